@@ -11,7 +11,6 @@ REAL-TIME RESPONSIVENESS FEATURES:
 """
 
 import os
-import json
 import asyncio
 from typing import List, Optional, AsyncGenerator, Dict
 from datetime import datetime, timezone
@@ -21,6 +20,7 @@ from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel
+import orjson
 
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
@@ -28,21 +28,30 @@ from ag_ui_adk import ADKAgent, add_adk_fastapi_endpoint
 
 from tools import (
     fetch_market_sentiment,
+    fetch_market_sentiment_streaming,
     send_alert,
+    queue_alert,
     XAPIClient,
     GrokClient,
-    GrokAnalysisClient,
     StreamMonitor,
+    RecentIdSet,
     create_stream_monitor,
     stream_institution_updates,
     _grok_live_search_analysis,
+    _get_xai_client,
     continue_analysis,
-    get_institution_context
+    get_institution_context,
+    _model_to_dict
 )
 
 load_dotenv()
 
 
+def _sse_json(obj) -> str:
+    """Serialize an SSE event payload to compact, single-line JSON (orjson-backed)."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -288,18 +297,18 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
     rate_limit_error = None
 
     # Stage 1: Starting
-    yield f"event: status\ndata: {json.dumps({'stage': 'starting', 'message': f'Starting analysis of {institution}...', 'timestamp': timestamp})}\n\n"
+    yield f"event: status\ndata: {_sse_json({'stage': 'starting', 'message': f'Starting analysis of {institution}...', 'timestamp': timestamp})}\n\n"
     await asyncio.sleep(0.1)
 
     # Stage 2: Fetching from X API
-    yield f"event: status\ndata: {json.dumps({'stage': 'fetching', 'message': 'Fetching tweets from X API (api.x.com)...', 'timestamp': timestamp})}\n\n"
+    yield f"event: status\ndata: {_sse_json({'stage': 'fetching', 'message': 'Fetching tweets from X API (api.x.com)...', 'timestamp': timestamp})}\n\n"
 
     try:
         x_client = XAPIClient()
         grok_client = GrokClient()
 
         # Stage 3: Search tweets
-        yield f"event: status\ndata: {json.dumps({'stage': 'searching', 'message': 'Searching /tweets/search/recent endpoint...', 'timestamp': timestamp})}\n\n"
+        yield f"event: status\ndata: {_sse_json({'stage': 'searching', 'message': 'Searching /tweets/search/recent endpoint...', 'timestamp': timestamp})}\n\n"
 
         tweet_data = x_client.get_institution_mentions(
             institution,
@@ -308,7 +317,7 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
         )
 
         tweet_count = tweet_data.get("total_fetched", 0)
-        yield f"event: progress\ndata: {json.dumps({'stage': 'tweets_fetched', 'message': f'Fetched {tweet_count} tweets', 'tweet_count': tweet_count, 'timestamp': timestamp})}\n\n"
+        yield f"event: progress\ndata: {_sse_json({'stage': 'tweets_fetched', 'message': f'Fetched {tweet_count} tweets', 'tweet_count': tweet_count, 'timestamp': timestamp})}\n\n"
         await asyncio.sleep(0.1)
 
         # Stage 4: Trend analysis
@@ -316,11 +325,11 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
         if trend_data and not trend_data.get("error"):
             velocity = trend_data.get("velocity_change_percent", 0)
             is_spiking = trend_data.get("is_spiking", False)
-            yield f"event: progress\ndata: {json.dumps({'stage': 'trend_analyzed', 'message': f'Volume trend: {velocity:+.1f}%', 'velocity': velocity, 'is_spiking': is_spiking, 'timestamp': timestamp})}\n\n"
+            yield f"event: progress\ndata: {_sse_json({'stage': 'trend_analyzed', 'message': f'Volume trend: {velocity:+.1f}%', 'velocity': velocity, 'is_spiking': is_spiking, 'timestamp': timestamp})}\n\n"
         await asyncio.sleep(0.1)
 
         # Stage 5: Grok analysis
-        yield f"event: status\ndata: {json.dumps({'stage': 'analyzing', 'message': 'Running Grok sentiment analysis (api.x.ai)...', 'timestamp': timestamp})}\n\n"
+        yield f"event: status\ndata: {_sse_json({'stage': 'analyzing', 'message': 'Running Grok sentiment analysis (api.x.ai)...', 'timestamp': timestamp})}\n\n"
 
         analysis = grok_client.analyze_sentiment(institution, tweet_data)
         await asyncio.sleep(0.1)
@@ -343,11 +352,9 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
                 if evidence_tweets and len(evidence_tweets) > 0:
                     source_link = evidence_tweets[0].get("url")
                 
-                # Call send_alert in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    send_alert,
+                # Hand off to the background alert worker; the stream never
+                # waits on Slack
+                queue_alert(
                     institution,
                     risk_level,
                     summary[:500],  # Limit length
@@ -357,7 +364,7 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
                 # Don't fail the stream if Slack fails
                 pass
         
-        yield f"event: result\ndata: {json.dumps({'stage': 'complete', 'institution': institution, 'risk_level': risk_level, 'analysis': analysis, 'tweet_count': tweet_count, 'data_source': 'X API v2 + Grok', 'timestamp': timestamp})}\n\n"
+        yield f"event: result\ndata: {_sse_json({'stage': 'complete', 'institution': institution, 'risk_level': risk_level, 'analysis': analysis, 'tweet_count': tweet_count, 'data_source': 'X API v2 + Grok', 'timestamp': timestamp})}\n\n"
 
     except Exception as e:
         error_str = str(e).lower()
@@ -365,15 +372,15 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
             use_fallback = True
             rate_limit_error = str(e)
         else:
-            yield f"event: error\ndata: {json.dumps({'stage': 'error', 'message': str(e), 'timestamp': timestamp})}\n\n"
+            yield f"event: error\ndata: {_sse_json({'stage': 'error', 'message': str(e), 'timestamp': timestamp})}\n\n"
 
     # Fallback to Grok Live Search when X API is rate limited
     if use_fallback:
-        yield f"event: status\ndata: {json.dumps({'stage': 'fallback', 'message': 'X API rate limited, switching to Grok Live Search...', 'timestamp': timestamp})}\n\n"
+        yield f"event: status\ndata: {_sse_json({'stage': 'fallback', 'message': 'X API rate limited, switching to Grok Live Search...', 'timestamp': timestamp})}\n\n"
         await asyncio.sleep(0.1)
 
         try:
-            yield f"event: status\ndata: {json.dumps({'stage': 'grok_search', 'message': 'Grok searching X in real-time...', 'timestamp': timestamp})}\n\n"
+            yield f"event: status\ndata: {_sse_json({'stage': 'grok_search', 'message': 'Grok searching X in real-time...', 'timestamp': timestamp})}\n\n"
 
             # Run Grok live search in thread pool to not block
             loop = asyncio.get_event_loop()
@@ -395,9 +402,7 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
                     if evidence_tweets and len(evidence_tweets) > 0:
                         source_link = evidence_tweets[0].get("url")
                     
-                    await loop.run_in_executor(
-                        None,
-                        send_alert,
+                    queue_alert(
                         institution,
                         risk_level,
                         summary[:500],
@@ -406,13 +411,13 @@ async def generate_analysis_stream(institution: str) -> AsyncGenerator[str, None
                 except Exception as e:
                     pass
             
-            yield f"event: result\ndata: {json.dumps({'stage': 'complete', 'institution': institution, 'risk_level': risk_level, 'analysis': analysis, 'data_source': 'Grok Live Search (X API fallback)', 'fallback_reason': rate_limit_error, 'timestamp': timestamp})}\n\n"
+            yield f"event: result\ndata: {_sse_json({'stage': 'complete', 'institution': institution, 'risk_level': risk_level, 'analysis': analysis, 'data_source': 'Grok Live Search (X API fallback)', 'fallback_reason': rate_limit_error, 'timestamp': timestamp})}\n\n"
 
         except Exception as fallback_error:
-            yield f"event: error\ndata: {json.dumps({'stage': 'error', 'message': f'Both X API and Grok fallback failed: {str(fallback_error)}', 'timestamp': timestamp})}\n\n"
+            yield f"event: error\ndata: {_sse_json({'stage': 'error', 'message': f'Both X API and Grok fallback failed: {str(fallback_error)}', 'timestamp': timestamp})}\n\n"
 
     # Final event
-    yield f"event: done\ndata: {json.dumps({'stage': 'done', 'message': 'Analysis complete', 'timestamp': timestamp})}\n\n"
+    yield f"event: done\ndata: {_sse_json({'stage': 'done', 'message': 'Analysis complete', 'timestamp': timestamp})}\n\n"
 
 
 @app.get("/stream/analyze/{institution}")
@@ -447,6 +452,32 @@ async def stream_analysis(institution: str):
     )
 
 
+@app.get("/stream/x-search/{institution}")
+async def stream_x_search_analysis(institution: str):
+    """
+    Stream an xai_sdk x_search analysis via Server-Sent Events (SSE).
+
+    Forwards each update from fetch_market_sentiment_streaming() as it
+    arrives, with the event name taken from its stage (initializing,
+    searching, tool_call, analyzing, partial, complete, error). A partial
+    event carries one top-level result field (e.g. risk_level) as soon as
+    the model finishes writing it.
+    """
+    async def generate_x_search_stream():
+        async for update in fetch_market_sentiment_streaming(institution):
+            yield f"event: {update.get('stage', 'status')}\ndata: {_sse_json(update)}\n\n"
+
+    return StreamingResponse(
+        generate_x_search_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering
+        }
+    )
+
+
 @app.post("/stream/batch")
 async def stream_batch_analysis(request: BatchAnalysisRequest):
     """
@@ -456,7 +487,7 @@ async def stream_batch_analysis(request: BatchAnalysisRequest):
     """
     async def generate_batch_stream():
         for idx, institution in enumerate(request.institutions):
-            yield f"event: batch_progress\ndata: {json.dumps({'current': idx + 1, 'total': len(request.institutions), 'institution': institution})}\n\n"
+            yield f"event: batch_progress\ndata: {_sse_json({'current': idx + 1, 'total': len(request.institutions), 'institution': institution})}\n\n"
 
             async for event in generate_analysis_stream(institution):
                 yield event
@@ -465,7 +496,7 @@ async def stream_batch_analysis(request: BatchAnalysisRequest):
             if idx < len(request.institutions) - 1:
                 await asyncio.sleep(1)
 
-        yield f"event: batch_complete\ndata: {json.dumps({'total_analyzed': len(request.institutions)})}\n\n"
+        yield f"event: batch_complete\ndata: {_sse_json({'total_analyzed': len(request.institutions)})}\n\n"
 
     return StreamingResponse(
         generate_batch_stream(),
@@ -491,7 +522,7 @@ async def analyze_institution(request: AnalysisRequest):
     """
     try:
         result = fetch_market_sentiment(request.institution)
-        return JSONResponse(content=json.loads(result))
+        return JSONResponse(content=orjson.loads(result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -508,7 +539,7 @@ async def analyze_batch(request: BatchAnalysisRequest):
     for institution in request.institutions:
         try:
             result = fetch_market_sentiment(institution)
-            results.append(json.loads(result))
+            results.append(orjson.loads(result))
         except Exception as e:
             results.append({
                 "bank_name": institution,
@@ -777,7 +808,7 @@ def _grok_relevance_filter(tweets: List[Dict], institutions: List[str]) -> List[
             is_relevant = False
             if content:
                 try:
-                    obj = json.loads(content.strip())
+                    obj = orjson.loads(content.strip())
                     is_relevant = bool(obj.get("relevant"))
                 except Exception:
                     is_relevant = "true" in content.lower()
@@ -890,7 +921,7 @@ async def stream_monitor_events():
 
     if not _stream_monitor:
         async def error_stream():
-            yield f"event: error\ndata: {json.dumps({'error': 'Monitor not started. Call POST /monitor/sync first.'})}\n\n"
+            yield f"event: error\ndata: {_sse_json({'error': 'Monitor not started. Call POST /monitor/sync first.'})}\n\n"
 
         return StreamingResponse(
             error_stream(),
@@ -905,7 +936,7 @@ async def stream_monitor_events():
             "rules_count": len(_stream_monitor.active_rules),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
-        yield f"event: connected\ndata: {json.dumps(connected_event)}\n\n"
+        yield f"event: connected\ndata: {_sse_json(connected_event)}\n\n"
 
         # Run the blocking stream in a thread pool
         executor = ThreadPoolExecutor(max_workers=1)
@@ -998,7 +1029,7 @@ async def stream_monitor_events():
                                 return True  # stream ended normally
                             elif msg_type == "data":
                                 # Process the tweet
-                                data = payload.model_dump() if hasattr(payload, 'model_dump') else dict(payload)
+                                data = _model_to_dict(payload)
 
                                 # Validate data
                                 if isinstance(data, dict) and data.get("error"):
@@ -1078,7 +1109,9 @@ async def stream_monitor_events():
                 loop
             )
 
-            seen_tweet_ids = set()
+            # LRU of recently seen ids: each poll re-returns the latest tweets,
+            # so hits are refreshed and only ids that stopped appearing age out
+            seen_tweet_ids = RecentIdSet(maxsize=1000)
             while not stop_event.is_set():
                 # Poll for tweets
                 tweets = poll_for_tweets()
@@ -1087,12 +1120,8 @@ async def stream_monitor_events():
                     if stop_event.is_set():
                         break
                     tweet_id = tweet.get("id")
-                    if tweet_id and tweet_id not in seen_tweet_ids:
-                        seen_tweet_ids.add(tweet_id)
+                    if tweet_id and seen_tweet_ids.add_if_new(tweet_id):
                         new_count += 1
-                        # Keep seen_ids bounded
-                        if len(seen_tweet_ids) > 1000:
-                            seen_tweet_ids = set(list(seen_tweet_ids)[-500:])
                         tweet["source"] = "search_api"
                         asyncio.run_coroutine_threadsafe(
                             event_queue.put(tweet),
@@ -1128,21 +1157,21 @@ async def stream_monitor_events():
                     event_type = event.get("type", "tweet")
 
                     if event.get("error"):
-                        yield f"event: error\ndata: {json.dumps(event)}\n\n"
+                        yield f"event: error\ndata: {_sse_json(event)}\n\n"
                     elif event_type == "info":
                         # Info message (e.g., fallback to polling, stream status)
-                        yield f"event: info\ndata: {json.dumps(event)}\n\n"
+                        yield f"event: info\ndata: {_sse_json(event)}\n\n"
                     elif event_type == "alert":
                         # High-urgency or high-engagement alert with Grok analysis
-                        yield f"event: alert\ndata: {json.dumps(event)}\n\n"
+                        yield f"event: alert\ndata: {_sse_json(event)}\n\n"
                     elif event_type == "volume_spike":
                         # Volume spike detected
-                        yield f"event: spike\ndata: {json.dumps(event)}\n\n"
+                        yield f"event: spike\ndata: {_sse_json(event)}\n\n"
                     else:
                         # Regular tweet event
                         _stream_monitor._tweets_processed += 1
                         event["type"] = "tweet"
-                        yield f"event: tweet\ndata: {json.dumps(event)}\n\n"
+                        yield f"event: tweet\ndata: {_sse_json(event)}\n\n"
 
                 except asyncio.TimeoutError:
                     # Send heartbeat to keep connection alive
@@ -1151,7 +1180,7 @@ async def stream_monitor_events():
                         "timestamp": datetime.now(timezone.utc).isoformat(),
                         "status": "waiting for tweets"
                     }
-                    yield f"event: heartbeat\ndata: {json.dumps(heartbeat)}\n\n"
+                    yield f"event: heartbeat\ndata: {_sse_json(heartbeat)}\n\n"
 
         except asyncio.CancelledError:
             stop_event.set()
@@ -1344,7 +1373,7 @@ async def continue_institution_analysis(request: ContinueAnalysisRequest):
     """
     try:
         result = continue_analysis(request.institution, request.follow_up)
-        return JSONResponse(content=json.loads(result))
+        return JSONResponse(content=orjson.loads(result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1357,7 +1386,7 @@ async def get_risk_trend(institution: str):
     Returns trend data showing if risk is escalating, improving, or stable.
     """
     try:
-        grok_client = GrokAnalysisClient()
+        grok_client = _get_xai_client()
         if grok_client.is_available():
             trend = grok_client.get_risk_trend(institution)
             return trend
@@ -1378,7 +1407,7 @@ async def get_analysis_mode(institution: str):
         - features: Available features for current mode
     """
     try:
-        grok_client = GrokAnalysisClient()
+        grok_client = _get_xai_client()
         is_stateful = grok_client.is_available()
 
         response = {
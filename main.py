@@ -11,8 +11,9 @@ import sys
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import msgspec
 from dotenv import load_dotenv
 
 from google.adk.sessions import InMemorySessionService
@@ -20,6 +21,7 @@ from google.adk.runners import Runner
 from google.genai import types
 
 from agent import create_financial_sentinel_agent
+from tools import XAPIClient, prime_prefetched_mentions
 
 
 # -----------------------------------------------------------------------------
@@ -59,6 +61,18 @@ DEFAULT_TARGETS: List[str] = [
 DEFAULT_INTERVAL_SECONDS: int = 600  # 10 minutes
 
 
+# -----------------------------------------------------------------------------
+# Result Records
+# -----------------------------------------------------------------------------
+
+class BankResult(msgspec.Struct, gc=False):
+    """Outcome of analyzing one bank in a monitoring cycle."""
+    status: str
+    response: str = ""
+    error: str = ""
+    timestamp: str = ""
+
+
 # -----------------------------------------------------------------------------
 # Logging Setup
 # -----------------------------------------------------------------------------
@@ -102,7 +116,7 @@ class FinancialSentinel:
         self.logger = logger or setup_logging()
 
         # Metrics
-        self.last_analysis: dict = {}
+        self.last_analysis: Dict[str, BankResult] = {}
         self.alert_count: int = 0
         self.cycle_count: int = 0
 
@@ -110,7 +124,7 @@ class FinancialSentinel:
         self.agent = None
         self.session_service = None
         self.runner = None
-        self.session_id = None
+        self.session_ids: Dict[str, str] = {}
 
     async def initialize(self) -> None:
         """Initialize the agent and ADK components."""
@@ -123,12 +137,19 @@ class FinancialSentinel:
             # Create session service
             self.session_service = InMemorySessionService()
 
-            # Create session (async operation)
-            session = await self.session_service.create_session(
-                app_name="financial_sentinel",
-                user_id="sentinel_system"
-            )
-            self.session_id = session.id
+            # One session per bank, created concurrently, so bank analyses
+            # don't contend on a shared session's state
+            sessions = await asyncio.gather(*(
+                self.session_service.create_session(
+                    app_name="financial_sentinel",
+                    user_id=self._user_id(bank_name)
+                )
+                for bank_name in self.target_banks
+            ))
+            self.session_ids = {
+                bank_name: session.id
+                for bank_name, session in zip(self.target_banks, sessions)
+            }
 
             # Create runner
             self.runner = Runner(
@@ -140,9 +161,25 @@ class FinancialSentinel:
             self.logger.info("Agent initialized successfully")
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize agent: {e}")
+            self.logger.error("Failed to initialize agent: %s", e)
             raise
 
+    @staticmethod
+    def _user_id(bank_name: str) -> str:
+        """ADK user id owning a bank's session."""
+        return f"sentinel_{bank_name}"
+
+    async def _get_session_id(self, bank_name: str) -> str:
+        """Return the bank's session id, creating one for banks added later."""
+        session_id = self.session_ids.get(bank_name)
+        if session_id is None:
+            session = await self.session_service.create_session(
+                app_name="financial_sentinel",
+                user_id=self._user_id(bank_name)
+            )
+            session_id = self.session_ids[bank_name] = session.id
+        return session_id
+
     async def analyze_bank(self, bank_name: str) -> str:
         """
         Run analysis for a single bank.
@@ -164,81 +201,110 @@ class FinancialSentinel:
             parts=[types.Part(text=query)]
         )
 
-        response_text = ""
+        # Accumulate streamed chunks and join once (avoids quadratic +=)
+        chunks: List[str] = []
 
         try:
+            session_id = await self._get_session_id(bank_name)
             async for event in self.runner.run_async(
-                user_id="sentinel_system",
-                session_id=self.session_id,
+                user_id=self._user_id(bank_name),
+                session_id=session_id,
                 new_message=content
             ):
                 # Collect final response
                 if hasattr(event, 'is_final_response') and event.is_final_response():
                     if event.content and event.content.parts:
-                        response_text = event.content.parts[0].text
+                        chunks.clear()
+                        chunks.append(event.content.parts[0].text or "")
                     break
                 elif hasattr(event, 'text') and event.text:
-                    response_text += event.text
+                    chunks.append(event.text)
                 elif hasattr(event, 'content') and event.content:
                     if isinstance(event.content, str):
-                        response_text += event.content
+                        chunks.append(event.content)
 
         except Exception as e:
-            self.logger.error(f"Error analyzing {bank_name}: {e}")
-            response_text = f"Error during analysis: {str(e)}"
+            self.logger.error("Error analyzing %s: %s", bank_name, e)
+            return f"Error during analysis: {str(e)}"
+
+        return "".join(chunks)
 
-        return response_text
+    async def prefetch_mentions(self) -> None:
+        """
+        Fetch mentions for all target banks with one batched X API query.
 
-    async def run_monitoring_cycle(self) -> dict:
+        The results are handed to the tools layer so each bank's
+        fetch_market_sentiment call reuses them instead of searching again.
+        Banks with only a few batched hits still run their own targeted search.
+        """
+        try:
+            x_client = XAPIClient()
+            mentions = await asyncio.to_thread(
+                x_client.batch_institution_mentions, self.target_banks
+            )
+        except Exception as e:
+            self.logger.warning("Batched mention prefetch failed, falling back to per-bank search: %s", e)
+            return
+
+        # Usable for one monitoring interval: the cycle's later banks still
+        # find them, and anything older is past the monitoring cadence anyway
+        prime_prefetched_mentions(mentions, ttl_seconds=self.interval_seconds)
+        covered = sum(1 for tweets in mentions.values() if tweets)
+        self.logger.info("Prefetched mentions for %d/%d banks", covered, len(self.target_banks))
+
+    async def run_monitoring_cycle(self) -> Dict[str, BankResult]:
         """
         Run a complete monitoring cycle for all target banks.
 
         Returns:
-            Dictionary with analysis results for each bank
+            Dictionary mapping each bank to its BankResult
         """
         self.cycle_count += 1
         cycle_start = datetime.now(timezone.utc)
 
         self.logger.info("=" * 60)
-        self.logger.info(f"Starting Monitoring Cycle #{self.cycle_count}")
-        self.logger.info(f"Time: {cycle_start.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        self.logger.info(f"Banks to analyze: {len(self.target_banks)}")
+        self.logger.info("Starting Monitoring Cycle #%d", self.cycle_count)
+        self.logger.info("Time: %s", cycle_start.strftime('%Y-%m-%d %H:%M:%S UTC'))
+        self.logger.info("Banks to analyze: %d", len(self.target_banks))
         self.logger.info("=" * 60)
 
+        await self.prefetch_mentions()
+
         results = {}
 
         for idx, bank_name in enumerate(self.target_banks, 1):
-            self.logger.info(f"\n[{idx}/{len(self.target_banks)}] Analyzing: {bank_name}")
+            self.logger.info("\n[%d/%d] Analyzing: %s", idx, len(self.target_banks), bank_name)
 
             try:
                 response = await self.analyze_bank(bank_name)
-                results[bank_name] = {
-                    "status": "completed",
-                    "response": response,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
+                results[bank_name] = BankResult(
+                    status="completed",
+                    response=response,
+                    timestamp=datetime.now(timezone.utc).isoformat()
+                )
 
                 # Check for risk indicators in response
                 response_upper = response.upper()
                 if "HIGH" in response_upper and ("ALERT" in response_upper or "RISK" in response_upper):
                     self.alert_count += 1
-                    self.logger.warning(f"HIGH RISK detected for {bank_name}")
+                    self.logger.warning("HIGH RISK detected for %s", bank_name)
                 elif "MEDIUM" in response_upper:
-                    self.logger.info(f"MEDIUM risk noted for {bank_name}")
+                    self.logger.info("MEDIUM risk noted for %s", bank_name)
                 else:
-                    self.logger.info(f"All clear for {bank_name}")
+                    self.logger.info("All clear for %s", bank_name)
 
-                # Log response preview
-                preview = response[:200].replace('\n', ' ')
-                self.logger.debug(f"Response preview: {preview}...")
+                # Log response preview (only built when DEBUG is enabled)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    preview = response[:200].replace('\n', ' ')
+                    self.logger.debug("Response preview: %s...", preview)
 
             except Exception as e:
-                self.logger.error(f"Failed to analyze {bank_name}: {e}")
-                results[bank_name] = {
-                    "status": "error",
-                    "error": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
+                self.logger.error("Failed to analyze %s: %s", bank_name, e)
+                results[bank_name] = BankResult(
+                    status="error",
+                    error=str(e),
+                    timestamp=datetime.now(timezone.utc).isoformat()
+                )
 
             # Small delay between banks to avoid rate limits
             if idx < len(self.target_banks):
@@ -248,9 +314,9 @@ class FinancialSentinel:
         duration = (cycle_end - cycle_start).total_seconds()
 
         self.logger.info("\n" + "=" * 60)
-        self.logger.info(f"Cycle #{self.cycle_count} Complete")
-        self.logger.info(f"Duration: {duration:.1f} seconds")
-        self.logger.info(f"Total alerts sent (all time): {self.alert_count}")
+        self.logger.info("Cycle #%d Complete", self.cycle_count)
+        self.logger.info("Duration: %.1f seconds", duration)
+        self.logger.info("Total alerts sent (all time): %d", self.alert_count)
         self.logger.info("=" * 60 + "\n")
 
         self.last_analysis = results
@@ -262,8 +328,8 @@ class FinancialSentinel:
         """
         self.logger.info("=" * 60)
         self.logger.info("FINANCIAL SENTINEL - Starting Continuous Monitoring")
-        self.logger.info(f"Monitoring {len(self.target_banks)} banks")
-        self.logger.info(f"Cycle interval: {self.interval_seconds} seconds")
+        self.logger.info("Monitoring %d banks", len(self.target_banks))
+        self.logger.info("Cycle interval: %d seconds", self.interval_seconds)
         self.logger.info("=" * 60)
 
         await self.initialize()
@@ -273,7 +339,7 @@ class FinancialSentinel:
                 await self.run_monitoring_cycle()
 
                 self.logger.info(
-                    f"Sleeping for {self.interval_seconds} seconds until next cycle..."
+                    "Sleeping for %d seconds until next cycle...", self.interval_seconds
                 )
                 await asyncio.sleep(self.interval_seconds)
 
@@ -281,16 +347,16 @@ class FinancialSentinel:
                 self.logger.info("\nReceived shutdown signal. Exiting gracefully...")
                 break
             except Exception as e:
-                self.logger.error(f"Error in monitoring cycle: {e}")
+                self.logger.error("Error in monitoring cycle: %s", e)
                 self.logger.info("Waiting 60 seconds before retry...")
                 await asyncio.sleep(60)
 
-    async def run_once(self) -> dict:
+    async def run_once(self) -> Dict[str, BankResult]:
         """
         Run a single monitoring cycle and exit.
 
         Returns:
-            Analysis results dictionary
+            Dictionary mapping each bank to its BankResult
         """
         await self.initialize()
         return await self.run_monitoring_cycle()
@@ -318,7 +384,7 @@ async def main_continuous():
     missing = [var for var in required_vars if not os.getenv(var)]
 
     if missing:
-        logger.error(f"Missing required environment variables: {', '.join(missing)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing))
         logger.error("Please check your .env file")
         sys.exit(1)
 
@@ -345,8 +411,8 @@ async def main_single_run():
     print("=" * 60)
 
     for bank, result in results.items():
-        status_icon = "OK" if result["status"] == "completed" else "ERR"
-        print(f"[{status_icon}] {bank}: {result['status']}")
+        status_icon = "OK" if result.status == "completed" else "ERR"
+        print(f"[{status_icon}] {bank}: {result.status}")
 
     return results
 
@@ -355,6 +421,13 @@ def cli():
     """Command-line interface entry point."""
     import argparse
 
+    # uvloop is a faster drop-in event loop for the socket-heavy API calls
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description="Financial Sentinel - Bank Risk Monitoring Agent",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -0,0 +1,33 @@
+"""Institution classification from partial names."""
+
+import pytest
+
+tools = pytest.importorskip("tools")
+InstitutionType = tools.InstitutionType
+
+
+@pytest.mark.parametrize("name, expected", [
+    # Name inside a registry key: first key in registry order, not the longest
+    ("coin", InstitutionType.CRYPTO_EXCHANGE),
+    ("us", InstitutionType.TRADITIONAL_BANK),
+    ("bit", InstitutionType.CRYPTO_EXCHANGE),
+    # Registry key inside the name: the longest (most specific) key
+    ("Coinbase Wallet", InstitutionType.CRYPTO_WALLET),
+    ("Coinbase Pro", InstitutionType.CRYPTO_EXCHANGE),
+    ("Chase Bank", InstitutionType.TRADITIONAL_BANK),
+])
+def test_partial_names(name, expected):
+    assert tools.classify_institution(name) is expected
+
+
+def test_name_inside_key_follows_registry_order():
+    registry = list(tools.INSTITUTION_REGISTRY.items())
+    for key, _ in registry:
+        for end in range(1, len(key)):
+            fragment = key[:end].strip()
+            if not fragment or fragment in tools.INSTITUTION_REGISTRY:
+                continue
+            if any(other in fragment for other, _ in registry):
+                continue  # a key inside the name takes precedence
+            expected = next(inst_type for other, inst_type in registry if fragment in other)
+            assert tools.classify_institution(fragment) is expected, fragment
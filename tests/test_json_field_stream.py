@@ -0,0 +1,35 @@
+"""Incremental top-level field extraction from streamed model replies."""
+
+import orjson
+import pytest
+
+tools = pytest.importorskip("tools")
+
+REPLY_OBJECT = {
+    "risk_level": "HIGH",
+    "summary": 'Outage, "withdrawals" {paused} [all regions] \\',
+    "key_findings": ["a,b", {"nested": [1, 2]}],
+    "confidence": 0.8,
+}
+REPLY = "```json\n" + orjson.dumps(REPLY_OBJECT, option=orjson.OPT_INDENT_2).decode() + "\n```"
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_fields_are_emitted_in_order_for_any_chunking(size):
+    stream = tools._JSONFieldStream()
+    emitted = []
+    for start in range(0, len(REPLY), size):
+        emitted.extend(stream.feed(REPLY[start:start + size]))
+
+    assert emitted == list(REPLY_OBJECT.items())
+    assert stream.result == REPLY_OBJECT
+
+
+def test_risk_level_is_emitted_before_the_reply_finishes():
+    stream = tools._JSONFieldStream()
+    head, tail = REPLY.split('"summary"', 1)
+
+    assert stream.feed(head) == [("risk_level", "HIGH")]
+    assert stream.result is None
+    stream.feed('"summary"' + tail)
+    assert stream.result == REPLY_OBJECT
@@ -0,0 +1,36 @@
+"""Batched mention attribution and the per-cycle prefetch store."""
+
+import pytest
+
+tools = pytest.importorskip("tools")
+
+
+def _tweet(tweet_id: str, text: str) -> dict:
+    return {"id": tweet_id, "text": text, "credibility_score": 1.0}
+
+
+def test_batch_attributes_whole_word_mentions_only(monkeypatch):
+    client = tools.XAPIClient.__new__(tools.XAPIClient)
+    tweets = [
+        _tweet("1", "Chase app is down again"),
+        _tweet("2", "got chased by a goose"),
+        _tweet("3", "E*TRADE and Chase both slow"),
+    ]
+    monkeypatch.setattr(client, "search_recent_tweets", lambda query, max_results=100: tweets)
+
+    mentions = client.batch_institution_mentions(["Chase", "E*TRADE", "SoFi"])
+
+    assert [t["id"] for t in mentions["Chase"]] == ["1", "3"]
+    assert [t["id"] for t in mentions["E*TRADE"]] == ["3"]
+    assert mentions["SoFi"] == []
+
+
+def test_prefetch_expires_after_given_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tools.time, "monotonic", lambda: now[0])
+
+    tools.prime_prefetched_mentions({"Chase": [_tweet("1", "Chase")]}, ttl_seconds=600)
+    now[0] += 599
+    assert [t["id"] for t in tools.get_prefetched_mentions("chase")] == ["1"]
+    now[0] += 2
+    assert tools.get_prefetched_mentions("chase") is None
@@ -0,0 +1,149 @@
+"""Adaptive rate limiting driven by X API rate-limit headers."""
+
+import time
+
+import pytest
+
+tools = pytest.importorskip("tools")
+
+
+def _x_headers(remaining: int, reset_in: float) -> dict:
+    # Header names exactly as the X API sends them
+    return {
+        "x-rate-limit-limit": "300",
+        "x-rate-limit-remaining": str(remaining),
+        "x-rate-limit-reset": str(int(time.time() + reset_in)),
+    }
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, headers: dict):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = b'{"data": [], "meta": {"total_tweet_count": 0}}'
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise _FakeHTTPError(self)
+
+
+class _FakeHTTPError(Exception):
+    def __init__(self, response):
+        super().__init__(f"{response.status_code} error")
+        self.response = response
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_observe_spreads_remaining_quota_over_reset_window():
+    limiter = tools.AdaptiveRateLimiter()
+    limiter.observe("x_counts", _x_headers(remaining=10, reset_in=100))
+
+    assert limiter._reserve("x_counts") == 0
+    # ~100s left for 10 requests: the next one waits ~10s
+    assert 8 < limiter._reserve("x_counts") <= 10.5
+
+
+def test_observe_exhausted_quota_holds_until_reset():
+    limiter = tools.AdaptiveRateLimiter()
+    limiter.observe("x_counts", _x_headers(remaining=0, reset_in=30))
+
+    assert 28 < limiter._reserve("x_counts") <= 30.5
+
+
+def test_observe_accepts_openai_style_names_as_fallback():
+    limiter = tools.AdaptiveRateLimiter()
+    limiter.observe("grok", {
+        "x-ratelimit-remaining": "5",
+        "x-ratelimit-reset": str(int(time.time() + 50)),
+    })
+
+    limiter._reserve("grok")
+    assert 8 < limiter._reserve("grok") <= 10.5
+
+
+def test_on_rate_limited_uses_x_reset_header():
+    limiter = tools.AdaptiveRateLimiter()
+    error = _FakeHTTPError(_FakeResponse(429, _x_headers(remaining=0, reset_in=40)))
+
+    assert 38 < limiter.on_rate_limited("x_counts", error) <= 40.5
+    assert limiter._reserve("x_counts") > 38
+
+
+def test_get_tweet_counts_429_reaches_the_limiter(monkeypatch):
+    limiter = tools.AdaptiveRateLimiter()
+    monkeypatch.setattr(tools, "RATE_LIMITER", limiter)
+    rate_limited = []
+    original = limiter.on_rate_limited
+    monkeypatch.setattr(
+        limiter, "on_rate_limited",
+        lambda endpoint, exc: rate_limited.append(endpoint) or original(endpoint, exc)
+    )
+    session = _FakeSession([
+        _FakeResponse(429, {"retry-after": "0", **_x_headers(remaining=0, reset_in=0)}),
+        _FakeResponse(200, _x_headers(remaining=299, reset_in=900)),
+    ])
+    monkeypatch.setattr(tools, "_get_x_session", lambda: session)
+
+    client = tools.XAPIClient.__new__(tools.XAPIClient)
+    client.bearer_token = "test-token"
+    result = client.get_tweet_counts("Chase")
+
+    assert rate_limited == ["x_counts"]
+    assert session.calls == 2
+    assert "error" not in result
+    # The successful response's headers now pace the endpoint (~3s apart)
+    assert limiter._min_interval["x_counts"] > 1
+
+
+def test_hold_beyond_max_wait_fails_fast_instead_of_sleeping(monkeypatch):
+    limiter = tools.AdaptiveRateLimiter()
+    monkeypatch.setattr(tools.time, "sleep", lambda seconds: pytest.fail(f"slept {seconds}s"))
+    error = _FakeHTTPError(_FakeResponse(429, _x_headers(remaining=0, reset_in=800)))
+
+    assert limiter.on_rate_limited("x_search", error) > tools.MAX_RATE_LIMIT_WAIT
+    with pytest.raises(tools.XAPIRateLimitError):
+        limiter.acquire("x_search")
+    # Still failing fast on the next call; no slot was claimed
+    with pytest.raises(tools.XAPIRateLimitError):
+        limiter.acquire("x_search")
+
+
+def test_exhausted_quota_beyond_max_wait_fails_fast():
+    limiter = tools.AdaptiveRateLimiter()
+    limiter.observe("x_search", _x_headers(remaining=0, reset_in=800))
+
+    with pytest.raises(tools.XAPIRateLimitError):
+        limiter.acquire("x_search")
+
+
+def test_headerless_429_uses_short_exponential_backoff(monkeypatch):
+    limiter = tools.AdaptiveRateLimiter()
+    monkeypatch.setattr(tools, "RATE_LIMITER", limiter)
+    sleeps = []
+    monkeypatch.setattr(tools.time, "sleep", sleeps.append)
+    session = _FakeSession([
+        _FakeResponse(429, {}),
+        _FakeResponse(429, {}),
+        _FakeResponse(200, {}),
+    ])
+    monkeypatch.setattr(tools, "_get_x_session", lambda: session)
+
+    client = tools.XAPIClient.__new__(tools.XAPIClient)
+    client.bearer_token = "test-token"
+    result = client.get_tweet_counts("Chase")
+
+    assert "error" not in result
+    assert session.calls == 3
+    # 1s then 2s (+/-10% jitter), and no hold left on the endpoint
+    assert len(sleeps) == 2
+    assert 0.9 <= sleeps[0] <= 1.1 and 1.8 <= sleeps[1] <= 2.2
+    assert limiter._reserve("x_counts") == 0
@@ -0,0 +1,74 @@
+"""Eviction and rotation behaviour of the stream deduplication structures."""
+
+import pytest
+
+tools = pytest.importorskip("tools")
+
+
+def _poll_emissions(seen, polls):
+    """Replay polls through the dedup the search-polling fallback uses."""
+    emitted = []
+    for poll in polls:
+        emitted.extend(tweet_id for tweet_id in poll if seen.add_if_new(tweet_id))
+    return emitted
+
+
+def test_recent_ids_keep_an_id_that_keeps_showing_up():
+    seen = tools.RecentIdSet(maxsize=10)
+    # "sticky" is in every poll while 50 new ids stream past a 10-id cap
+    polls = [["sticky", f"new-{i}"] for i in range(50)]
+
+    emitted = _poll_emissions(seen, polls)
+
+    assert emitted.count("sticky") == 1
+    assert len(emitted) == 51
+    assert len(seen) == 10
+
+
+def test_recent_ids_evict_oldest_absent_id():
+    seen = tools.RecentIdSet(maxsize=3)
+    _poll_emissions(seen, [["a", "b", "c"], ["b", "c", "d"]])
+
+    assert "a" not in seen
+    assert all(tweet_id in seen for tweet_id in ("b", "c", "d"))
+
+
+def test_bloom_filter_remembers_ids_for_at_least_capacity_insertions():
+    seen = tools.RotatingBloomFilter(capacity=100)
+    assert seen.add_if_new("first")
+
+    for i in range(99):
+        assert seen.add_if_new(f"id-{i}")
+    # The active filter just rotated; "first" now lives in the previous one
+    assert "first" in seen
+    for i in range(99, 198):
+        assert seen.add_if_new(f"id-{i}")
+    # 198 insertions later it is still recognized until the next rotation
+    assert not seen.add_if_new("first")
+
+
+def test_bloom_filter_forgets_after_two_rotations():
+    seen = tools.RotatingBloomFilter(capacity=100)
+    seen.add_if_new("first")
+    for i in range(200):
+        seen.add_if_new(f"id-{i}")
+
+    assert "first" not in seen
+    assert seen.add_if_new("first")
+
+
+def test_bloom_filter_memory_is_fixed_across_rotations():
+    seen = tools.RotatingBloomFilter(capacity=100)
+    size = len(seen._active)
+    for i in range(1000):
+        seen.add_if_new(f"id-{i}")
+
+    assert len(seen._active) == len(seen._previous) == size
+
+
+def test_bloom_filter_clear_forgets_everything():
+    seen = tools.RotatingBloomFilter(capacity=100)
+    seen.add_if_new("a")
+    seen.clear()
+
+    assert "a" not in seen
@@ -13,25 +13,234 @@ This module implements COMPREHENSIVE X API integration using the OFFICIAL X SDK
 """
 
 import os
-import json
+import re
+import sys
+import importlib.util
+import copy
 import time
+import hashlib
+import math
+import heapq
 import random
 import asyncio
-from typing import Optional, List, Dict, Any, Callable, Generator
-from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, asdict
+import atexit
+import queue
+from typing import Optional, List, Dict, Any, Callable, Generator, AsyncGenerator, Tuple, Literal
+from datetime import date, datetime, timezone, timedelta
+from dataclasses import dataclass, field, asdict
+from collections import OrderedDict, deque
+from bisect import bisect_right
 from enum import Enum
-from functools import wraps
+from functools import wraps, lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import threading
 
+import orjson
+
 # Official X Python SDK
 from xdk import Client as XDKClient
 
 import requests  # kept for fallback utilities
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient, RateLimitError
+from pydantic import BaseModel
 from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
+# Official xAI SDK (optional): Responses API + server-side x_search
+try:
+    from xai_sdk import Client as XAISDKClient, AsyncClient as AsyncXAISDKClient
+    from xai_sdk.chat import user as xai_user, system as xai_system
+    from xai_sdk.tools import x_search
+    XAI_SDK_AVAILABLE = True
+except ImportError:
+    XAISDKClient = AsyncXAISDKClient = xai_user = xai_system = x_search = None
+    XAI_SDK_AVAILABLE = False
+
+
+# Tool responses are consumed programmatically, so they serialize compactly;
+# set SENTIMENT_PRETTY_JSON=1 to get indented output while debugging
+_PRETTY_JSON = os.getenv("SENTIMENT_PRETTY_JSON") == "1"
+_DUMPS_OPTION = orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to a JSON string (orjson-backed)."""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTION).decode()
+
+
+def _model_to_dict(model: Any) -> Dict[str, Any]:
+    """
+    Convert an xdk response model to plain JSON-typed dicts.
+
+    model_dump_json() serializes in pydantic's Rust core and orjson decodes
+    the bytes, which beats model_dump()'s Python-level walk of large nested
+    pages. Values come back JSON-native (timestamps stay ISO strings).
+    """
+    if hasattr(model, 'model_dump_json'):
+        return orjson.loads(model.model_dump_json())
+    return dict(model)
+
+
+# Characters that matter when scanning for a balanced JSON object
+_JSON_SCAN_RE = re.compile(r'["\\{}]')
+
+
+def _extract_json_object(content: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the JSON object embedded in a model reply.
+
+    Tries the whole reply first; otherwise scans once from each '{' tracking
+    brace depth and string literals, and parses the first balanced slice.
+    Linear in the reply length, with no regex backtracking.
+
+    Returns:
+        Parsed dict, or None when no JSON object can be parsed
+    """
+    try:
+        parsed = orjson.loads(content)
+        if isinstance(parsed, dict):
+            return parsed
+    except orjson.JSONDecodeError:
+        pass
+
+    start = content.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        skip_to = 0
+        end = -1
+        for match in _JSON_SCAN_RE.finditer(content, start):
+            pos = match.start()
+            if pos < skip_to:
+                continue
+            char = match.group()
+            if in_string:
+                if char == "\\":
+                    skip_to = pos + 2  # skip the escaped character
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    end = pos
+                    break
+
+        if end == -1:
+            return None  # unbalanced - nothing further can close
+        try:
+            parsed = orjson.loads(content[start:end + 1])
+            if isinstance(parsed, dict):
+                return parsed
+        except orjson.JSONDecodeError:
+            pass
+        start = content.find("{", start + 1)
+
+    return None
+
+
+# Structural characters for the incremental field scan (arrays nest too)
+_JSON_FIELD_SCAN_RE = re.compile(r'["\\{}\[\],]')
+
+
+class _JSONFieldStream:
+    """
+    Incrementally scan a streamed model reply for top-level JSON fields.
+
+    feed() takes each content chunk and returns the (key, value) pairs of the
+    outermost object that closed within it, so a stream can surface e.g.
+    risk_level as soon as it is generated instead of after the whole reply.
+    Each chunk is scanned once on its own and only the text of the member
+    still open is kept (as a list of pieces), so the work stays linear in the
+    reply length; only completed members are decoded.
+
+    Once the object closes, ``result`` holds the assembled dict (left None if
+    any member failed to decode, so callers fall back to a full parse).
+    """
+
+    def __init__(self):
+        self._member_parts: List[str] = []
+        self._member_open = False
+        self._skip_next = False
+        self._depth = 0
+        self._in_string = False
+        self._intact = True
+        self._done = False
+        self.fields: Dict[str, Any] = {}
+        self.result: Optional[Dict[str, Any]] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume one content chunk; return the fields it completed."""
+        if self._done:
+            return []
+        emitted: List[Tuple[str, Any]] = []
+        # An escape at the end of the previous chunk covers this one's first char
+        skip_to = 1 if self._skip_next else 0
+        self._skip_next = False
+        member_from = 0  # where the open member's text resumes in this chunk
+
+        for match in _JSON_FIELD_SCAN_RE.finditer(chunk):
+            pos = match.start()
+            if pos < skip_to:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    skip_to = pos + 2  # skip the escaped character
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{" or char == "[":
+                self._depth += 1
+                if self._depth == 1 and char == "{":
+                    self._member_open = True
+                    self._member_parts = []
+                    member_from = pos + 1
+            elif char == ",":
+                if self._depth == 1 and self._member_open:
+                    self._emit(chunk, member_from, pos, emitted)
+                    member_from = pos + 1
+            elif self._depth > 0:  # closing } or ]
+                self._depth -= 1
+                if self._depth == 0 and self._member_open:
+                    self._emit(chunk, member_from, pos, emitted)
+                    self._member_open = False
+                    self._done = True
+                    if self._intact:
+                        self.result = dict(self.fields)
+                    return emitted
+
+        if skip_to > len(chunk):
+            self._skip_next = True
+        if self._member_open:
+            self._member_parts.append(chunk[member_from:])
+        return emitted
+
+    def _emit(self, chunk: str, start: int, end: int, emitted: List[Tuple[str, Any]]) -> None:
+        """Decode the member ending at chunk[end] and record its field."""
+        self._member_parts.append(chunk[start:end])
+        member = "".join(self._member_parts)
+        self._member_parts = []
+        if not member.strip():
+            return
+        try:
+            parsed = orjson.loads("{" + member + "}")
+        except orjson.JSONDecodeError:
+            self._intact = False
+            return
+        for key, value in parsed.items():
+            self.fields[key] = value
+            emitted.append((key, value))
+
 
 # =============================================================================
 # Circuit Breaker Pattern for API Resilience
@@ -43,11 +252,19 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     """
     Circuit breaker for graceful API failure handling.
     Prevents cascading failures and allows recovery.
+
+    can_execute() runs before every request, so the CLOSED case is answered
+    with a lock-free identity check; the lock only guards state transitions.
+    A stale CLOSED read at worst lets one extra request through while another
+    thread is opening the breaker.
+
+    get_status() returns a snapshot that is rebuilt only after a state change,
+    since it is embedded in every error message and health payload.
     """
     failure_threshold: int = 5
     recovery_timeout: int = 60
@@ -57,40 +274,106 @@ class CircuitBreaker:
     failure_count: int = 0
     last_failure_time: float = 0
     half_open_calls: int = 0
-    _lock: threading.Lock = None
-
-    def __post_init__(self):
-        self._lock = threading.Lock()
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _status: Optional[Dict] = field(default=None, repr=False, compare=False)
 
     def can_execute(self) -> bool:
+        if self.state is CircuitState.CLOSED:
+            return True
         with self._lock:
-            if self.state == CircuitState.CLOSED:
+            if self.state is CircuitState.CLOSED:
                 return True
-            elif self.state == CircuitState.OPEN:
+            elif self.state is CircuitState.OPEN:
                 if time.time() - self.last_failure_time >= self.recovery_timeout:
                     self.state = CircuitState.HALF_OPEN
                     self.half_open_calls = 0
+                    self._status = None
                     return True
                 return False
             else:  # HALF_OPEN
                 return self.half_open_calls < self.half_open_max_calls
 
     def record_success(self):
+        if self.state is CircuitState.CLOSED and self.failure_count == 0:
+            return
         with self._lock:
-            if self.state == CircuitState.HALF_OPEN:
+            if self.state is CircuitState.HALF_OPEN:
                 self.half_open_calls += 1
                 if self.half_open_calls >= self.half_open_max_calls:
                     self.state = CircuitState.CLOSED
                     self.failure_count = 0
-            elif self.state == CircuitState.CLOSED:
+            elif self.state is CircuitState.CLOSED:
                 self.failure_count = 0
+            self._status = None
 
     def record_failure(self):
         with self._lock:
             self.failure_count += 1
             self.last_failure_time = time.time()
-            if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state is CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
                 self.state = CircuitState.OPEN
+            self._status = None
+
+    def get_status(self) -> Dict:
+        """Current state snapshot; shared between callers, so treat it as read-only."""
+        status = self._status
+        if status is None:
+            # Built under the lock so a concurrent transition can't leave a
+            # stale snapshot cached
+            with self._lock:
+                status = self._status = {
+                    "state": self.state.value,
+                    "failure_count": self.failure_count,
+                    "last_failure": self.last_failure_time
+                }
+        return status
+
+
+@dataclass(slots=True)
+class AsyncCircuitBreaker:
+    """
+    Circuit breaker for coroutine callers.
+
+    Same states and thresholds as CircuitBreaker, but with no lock: every
+    method runs to completion without awaiting, so on a single event loop
+    no other task can observe a half-made transition, and callers never
+    block the loop on a thread lock.
+    """
+    failure_threshold: int = 5
+    recovery_timeout: int = 60
+    half_open_max_calls: int = 3
+
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    last_failure_time: float = 0
+    half_open_calls: int = 0
+
+    async def can_execute(self) -> bool:
+        if self.state is CircuitState.CLOSED:
+            return True
+        elif self.state is CircuitState.OPEN:
+            if time.time() - self.last_failure_time >= self.recovery_timeout:
+                self.state = CircuitState.HALF_OPEN
+                self.half_open_calls = 0
+                return True
+            return False
+        else:  # HALF_OPEN
+            return self.half_open_calls < self.half_open_max_calls
+
+    def record_success(self):
+        if self.state is CircuitState.HALF_OPEN:
+            self.half_open_calls += 1
+            if self.half_open_calls >= self.half_open_max_calls:
+                self.state = CircuitState.CLOSED
+                self.failure_count = 0
+        elif self.state is CircuitState.CLOSED:
+            self.failure_count = 0
+
+    def record_failure(self):
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        if self.state is CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
 
     def get_status(self) -> Dict:
         return {
@@ -116,29 +399,574 @@ def exponential_backoff_with_jitter(
     return delay + random.uniform(-jitter_range, jitter_range)
 
 
-def with_retry(max_attempts: int = 3, exceptions: tuple = (Exception,)):
-    """Decorator for retry with exponential backoff."""
+def with_retry(
+    max_attempts: int = 3,
+    exceptions: tuple = (Exception,),
+    endpoint: Optional[str] = None
+):
+    """
+    Decorator for retry with exponential backoff.
+
+    When `endpoint` is given, every attempt is paced through RATE_LIMITER and
+    a rate-limited failure is retried once the quota is expected to refill
+    (from Retry-After / x-rate-limit-reset) rather than after a blind backoff;
+    a 429 without those headers falls back to the exponential backoff.
+    Waits longer than MAX_RATE_LIMIT_WAIT are not worth blocking on, so the
+    error is raised straight away for the caller's fallback to handle (and
+    later calls fail fast in acquire() until the endpoint refills).
+    """
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             for attempt in range(max_attempts):
+                if endpoint:
+                    RATE_LIMITER.acquire(endpoint)
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_attempts - 1:
-                        delay = exponential_backoff_with_jitter(attempt)
-                        time.sleep(delay)
+                    if attempt >= max_attempts - 1:
+                        break
+                    if endpoint and _is_rate_limit_error(e):
+                        # The limiter now holds the endpoint until the refill
+                        # time; the acquire() at the top of the loop waits it out
+                        wait = RATE_LIMITER.on_rate_limited(endpoint, e)
+                        if wait is not None:
+                            if wait > MAX_RATE_LIMIT_WAIT:
+                                break
+                            continue
+                    delay = exponential_backoff_with_jitter(attempt)
+                    time.sleep(delay)
+            raise last_exception
+        return wrapper
+    return decorator
+
+
+def with_retry_async(
+    max_attempts: int = 3,
+    exceptions: tuple = (Exception,),
+    endpoint: Optional[str] = None,
+    breaker: Optional[AsyncCircuitBreaker] = None
+):
+    """
+    Coroutine counterpart of with_retry(), optionally guarded by a breaker.
+
+    Every failure counts against `breaker`; only `exceptions` are retried.
+    While the breaker is open, calls fail fast without reaching the API.
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+            for attempt in range(max_attempts):
+                if breaker is not None and not await breaker.can_execute():
+                    raise Exception(f"Circuit breaker OPEN - API temporarily unavailable. Status: {breaker.get_status()}")
+                if endpoint:
+                    await RATE_LIMITER.acquire_async(endpoint)
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if not isinstance(e, exceptions):
+                        raise
+                    last_exception = e
+                    if attempt >= max_attempts - 1:
+                        break
+                    if endpoint and _is_rate_limit_error(e):
+                        wait = RATE_LIMITER.on_rate_limited(endpoint, e)
+                        if wait is not None:
+                            if wait > MAX_RATE_LIMIT_WAIT:
+                                break
+                            continue
+                    await asyncio.sleep(exponential_backoff_with_jitter(attempt))
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
             raise last_exception
         return wrapper
     return decorator
 
 
+# =============================================================================
+# Token Bucket Rate Limiting
+# =============================================================================
+
+class TokenBucket:
+    """
+    Token bucket rate limiter driven by time.monotonic() floats.
+
+    Allows bursts up to `capacity` and refills smoothly at `rate` tokens/sec.
+    Tokens are reserved under a very short lock and any wait happens outside
+    it, so concurrent callers don't serialize on each other's sleeps.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, n: float) -> float:
+        """Take n tokens (the balance may go negative) and return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self, n: float = 1) -> None:
+        """Block the calling thread until n tokens are available."""
+        delay = self._reserve(n)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, n: float = 1) -> None:
+        """Wait on the event loop until n tokens are available."""
+        delay = self._reserve(n)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# X API Pro tier: 1500 search requests per 15 minutes, shared by every
+# XAPIClient instance in the process
+X_SEARCH_BUCKET = TokenBucket(rate=1500 / 900, capacity=1500)
+
+
+# =============================================================================
+# Adaptive Rate Limiting
+# =============================================================================
+
+# Longest rate-limit wait with_retry() will block a caller for
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+def _rate_limit_headers(exc: BaseException) -> Dict[str, str]:
+    """
+    Find the HTTP response headers behind an exception, if any.
+
+    SDK errors (openai, slack_sdk, requests) expose them as
+    `exc.response.headers`; our own XAPIRateLimitError is raised `from` the
+    SDK error, so the cause chain is checked too.
+    """
+    while exc is not None:
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            return {str(k).lower(): str(v) for k, v in headers.items()}
+        exc = exc.__cause__
+    return {}
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """True for XAPIRateLimitError or any error carrying an HTTP 429."""
+    if isinstance(exc, XAPIRateLimitError):
+        return True
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(response, "status_code", None)
+    return status == 429
+
+
+def _header_float(headers: Dict[str, str], *names: str) -> Optional[float]:
+    """Parse the first of `names` present in headers as a float."""
+    for name in names:
+        try:
+            return float(headers[name])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+# The X API sends x-rate-limit-*; the x-ratelimit-* spelling (OpenAI-style
+# APIs) is accepted as a fallback
+_REMAINING_HEADERS = ("x-rate-limit-remaining", "x-ratelimit-remaining")
+_RESET_HEADERS = ("x-rate-limit-reset", "x-ratelimit-reset")
+
+
+class AdaptiveRateLimiter:
+    """
+    Client-side pacing per endpoint, tuned from the server's rate-limit headers.
+
+    Each endpoint keeps a minimum interval between requests and the earliest
+    monotonic time the next request may start. Responses reporting
+    x-rate-limit-remaining / x-rate-limit-reset spread the remaining quota over
+    the rest of the window; a 429 holds the endpoint until Retry-After (or the
+    reset time) instead of guessing with 2**attempt.
+
+    A hold longer than `max_wait` is never slept through: acquire() raises
+    XAPIRateLimitError instead, so callers reach their fallback (e.g. Grok
+    live search) immediately rather than blocking for the rest of the window.
+    """
+
+    def __init__(self, default_interval: float = 0.0, max_wait: float = MAX_RATE_LIMIT_WAIT):
+        self.default_interval = default_interval
+        self.max_wait = max_wait
+        self._min_interval: Dict[str, float] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, endpoint: str) -> float:
+        """
+        Claim the next slot for endpoint and return seconds to wait for it.
+
+        Raises:
+            XAPIRateLimitError: The endpoint is held for longer than max_wait
+                (no slot is claimed)
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(endpoint, now))
+            if start - now > self.max_wait:
+                raise XAPIRateLimitError(
+                    f"{endpoint} rate limited for another {start - now:.0f}s"
+                )
+            interval = self._min_interval.get(endpoint, self.default_interval)
+            self._next_allowed[endpoint] = start + interval
+            return start - now
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the calling thread until endpoint may be called again (at most max_wait)."""
+        delay = self._reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait on the event loop until endpoint may be called again (at most max_wait)."""
+        delay = self._reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def observe(self, endpoint: str, headers: Any) -> None:
+        """
+        Update pacing from a response's rate-limit headers.
+
+        x-rate-limit-reset is an epoch timestamp on the X API; the remaining
+        quota is spread evenly over the time left until it.
+        """
+        if not headers:
+            return
+        headers = {str(k).lower(): str(v) for k, v in headers.items()}
+        remaining = _header_float(headers, *_REMAINING_HEADERS)
+        reset = _header_float(headers, *_RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        window = max(0.0, reset - time.time())
+        with self._lock:
+            if remaining <= 0:
+                self._next_allowed[endpoint] = time.monotonic() + window
+            else:
+                self._min_interval[endpoint] = window / remaining
+
+    def on_rate_limited(self, endpoint: str, exc: BaseException) -> Optional[float]:
+        """
+        Record a 429 for endpoint and return the inferred refill time in seconds.
+
+        Prefers Retry-After, then x-rate-limit-reset. Returns None (and holds
+        nothing) when the response carries neither, leaving the caller to its
+        usual exponential backoff.
+        """
+        headers = _rate_limit_headers(exc)
+        wait = _header_float(headers, "retry-after")
+        if wait is None:
+            reset = _header_float(headers, *_RESET_HEADERS)
+            if reset is None:
+                return None
+            wait = reset - time.time()
+        wait = max(0.0, wait)
+
+        with self._lock:
+            self._next_allowed[endpoint] = max(
+                self._next_allowed.get(endpoint, 0.0), time.monotonic() + wait
+            )
+        return wait
+
+
+# Shared by every client in the process so pacing learned on one request
+# applies to all of them
+RATE_LIMITER = AdaptiveRateLimiter()
+
+
+# =============================================================================
+# LRU + TTL Response Cache
+# =============================================================================
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Used to skip repeat Grok calls when the inputs haven't changed between
+    polling cycles.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# =============================================================================
+# Stream Deduplication (rotating Bloom filter, exact LRU id set)
+# =============================================================================
+
+class RotatingBloomFilter:
+    """
+    Fixed-memory "seen recently?" set for deduplicating stream ids.
+
+    Two Bloom filters take turns: ids are added to the active one, lookups
+    check both, and once the active one holds `capacity` ids the older one is
+    dropped and a blank one takes over. Every id is remembered for at least
+    `capacity` further insertions, memory stays constant, and nothing is ever
+    rebuilt. An unseen id is reported as seen with probability ~2x
+    `error_rate`.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 1e-6):
+        self.capacity = capacity
+        ln2 = math.log(2)
+        self._num_bits = max(64, int(-capacity * math.log(error_rate) / (ln2 * ln2)))
+        self._num_hashes = max(1, round(self._num_bits / capacity * ln2))
+        self._active = bytearray((self._num_bits + 7) // 8)
+        self._previous = bytearray(len(self._active))
+        self._count = 0
+
+    def _positions(self, item: str) -> List[int]:
+        """Bit positions for an item (double hashing over one blake2b digest)."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self._num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self._num_hashes)]
+
+    @staticmethod
+    def _has_all(bits: bytearray, positions: List[int]) -> bool:
+        for pos in positions:
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        positions = self._positions(item)
+        return self._has_all(self._active, positions) or self._has_all(self._previous, positions)
+
+    def add_if_new(self, item: str) -> bool:
+        """
+        Record an item unless it was seen recently.
+
+        Returns:
+            True if the item was new (and is now recorded), False if seen
+        """
+        positions = self._positions(item)
+        if self._has_all(self._active, positions) or self._has_all(self._previous, positions):
+            return False
+        active = self._active
+        for pos in positions:
+            active[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+        if self._count >= self.capacity:
+            self._previous = active
+            self._active = bytearray(len(active))
+            self._count = 0
+        return True
+
+    def clear(self) -> None:
+        self._active = bytearray(len(self._active))
+        self._previous = bytearray(len(self._active))
+        self._count = 0
+
+
+class RecentIdSet:
+    """
+    Exact, bounded set of recently seen ids with LRU eviction.
+
+    For pollers that keep re-receiving the newest items: a repeat sighting
+    refreshes the id, so only ids that stopped appearing age out, and the
+    oldest one is evicted in O(1) once `maxsize` is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._ids: "OrderedDict[Any, None]" = OrderedDict()
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add_if_new(self, item: Any) -> bool:
+        """
+        Record an item unless it was seen recently (refreshing it if so).
+
+        Returns:
+            True if the item was new, False if seen
+        """
+        if item in self._ids:
+            self._ids.move_to_end(item)
+            return False
+        self._ids[item] = None
+        if len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+        return True
+
+
+# =============================================================================
+# Shared X API HTTP Clients
+# =============================================================================
+
+X_COUNTS_URL = "https://api.x.com/2/tweets/counts/recent"
+
+_xdk_clients: Dict[str, XDKClient] = {}
+_x_session: Optional[requests.Session] = None
+_x_http_lock = threading.Lock()
+
+
+def _get_xdk_client(bearer_token: str) -> XDKClient:
+    """
+    Return the process-wide xdk client for a bearer token.
+
+    XAPIClient is constructed per tool call; sharing the SDK client keeps its
+    underlying connection pool (and TLS sessions) alive between calls.
+    """
+    client = _xdk_clients.get(bearer_token)
+    if client is None:
+        with _x_http_lock:
+            client = _xdk_clients.get(bearer_token)
+            if client is None:
+                client = _xdk_clients[bearer_token] = XDKClient(bearer_token=bearer_token)
+    return client
+
+
+def _get_x_session() -> requests.Session:
+    """
+    Return the keep-alive session used for direct X API REST calls.
+
+    Sized for the parallel fetches in get_institution_mentions() across
+    several institutions at once.
+    """
+    global _x_session
+    session = _x_session
+    if session is None:
+        with _x_http_lock:
+            session = _x_session
+            if session is None:
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+                _x_session = session
+    return session
+
+
 # =============================================================================
 # X API Client - Using Official X Python SDK (xdk)
 # =============================================================================
 
+class XAPIRateLimitError(Exception):
+    """Raised when the X API responds with HTTP 429 / rate limiting."""
+
+
+class XAPIAuthError(ValueError):
+    """Raised when the X API rejects the bearer token (HTTP 401)."""
+
+
+def _rate_limit_error() -> XAPIRateLimitError:
+    return XAPIRateLimitError(f"X API rate limited (remaining: 0). Resets in 900s at {datetime.now(timezone.utc).isoformat()}")
+
+
+def _auth_error() -> XAPIAuthError:
+    return XAPIAuthError("X API authentication failed. Check your bearer token.")
+
+
+# (substring of the lowercased SDK error, factory for the error we raise),
+# checked in order by XAPIClient.search_recent_tweets()
+_ERROR_SIGNATURES = (
+    ("429", _rate_limit_error),
+    ("rate", _rate_limit_error),
+    ("401", _auth_error),
+    ("unauthorized", _auth_error),
+)
+
+
+# Risk terms common to every institution type, appended after the
+# type-specific keywords in get_institution_mentions()
+BASE_RISK_KEYWORDS = (
+    "outage", "down", "not working", "can't access", "can't login",
+    "fraud", "scam", "hack", "breach", "warning"
+)
+_BASE_RISK_TERMS = list(BASE_RISK_KEYWORDS[:6])
+
+# Engagement score weights per public metric: RTs worth 3x, quotes 2x,
+# replies 1.5x, likes 1x
+_ENGAGEMENT_WEIGHTS = (
+    ("retweet_count", 3.0),
+    ("quote_count", 2.0),
+    ("reply_count", 1.5),
+    ("like_count", 1.0),
+)
+
+
+# Search credibility multiplier for business/government accounts; other
+# verified accounts get 1.5 and unverified ones 1.0
+_VERIFICATION_WEIGHTS = {"business": 2.0, "government": 2.0}
+
+# Stream credibility bonus for verified authors by verified_type (25 otherwise)
+_CREDIBILITY_BONUS = {"business": 40, "government": 50}
+
+
+def _author_credibility(followers: int, verified: bool, verified_type: Optional[str]) -> float:
+    """
+    Calculate a stream author's credibility score.
+
+    A plain module function rather than a method, so the per-tweet call in
+    the filtered stream skips bound-method creation and attribute lookup.
+    """
+    score = min(followers / 1000, 50)  # Max 50 from followers
+    if verified:
+        score += _CREDIBILITY_BONUS.get(verified_type, 25)
+    return round(score, 1)
+
+
+# Fields both search and the filtered stream request
+_COMMON_TWEET_FIELDS = (
+    "id", "text", "created_at", "author_id",
+    "public_metrics",  # retweets, likes, replies, quotes
+    "entities",        # hashtags, mentions, urls
+)
+_COMMON_USER_FIELDS = (
+    "username", "verified", "verified_type",
+    "public_metrics",  # followers, following
+)
+
+
 class XAPIClient:
     """
     Comprehensive X API v2 client using the OFFICIAL X Python SDK (xdk).
@@ -156,7 +984,16 @@ class XAPIClient:
     - client.stream.update_rules(): Manage stream rules
     """
 
-    TWEET_URL_TEMPLATE = "https://x.com/{username}/status/{tweet_id}"
+    # Field selections sent with every request, built once from the shared
+    # _COMMON_* tuples. xdk requires lists, so these are shared class-level
+    # lists: pass them through, never mutate them.
+    _SEARCH_TWEET_FIELDS = list(_COMMON_TWEET_FIELDS + ("context_annotations", "conversation_id", "referenced_tweets"))
+    _SEARCH_EXPANSIONS = ["author_id", "referenced_tweets.id"]
+    _SEARCH_USER_FIELDS = list(_COMMON_USER_FIELDS + ("description", "created_at"))
+
+    _STREAM_TWEET_FIELDS = list(_COMMON_TWEET_FIELDS + ("lang", "possibly_sensitive"))
+    _STREAM_USER_FIELDS = list(_COMMON_USER_FIELDS + ("id", "name"))
+    _STREAM_EXPANSIONS = ["author_id"]  # full user object for each author
 
     def __init__(self, bearer_token: Optional[str] = None):
         from urllib.parse import unquote
@@ -165,8 +1002,8 @@ class XAPIClient:
             raise ValueError("X_BEARER_TOKEN is required for X API access")
         self.bearer_token = unquote(raw_token)
 
-        # Initialize official X SDK client
-        self.client = XDKClient(bearer_token=self.bearer_token)
+        # Official X SDK client, shared by every XAPIClient with this token
+        self.client = _get_xdk_client(self.bearer_token)
 
         # Circuit breaker for API resilience
         self.circuit_breaker = CircuitBreaker(
@@ -179,6 +1016,8 @@ class XAPIClient:
         self.request_count = 0
         self.success_count = 0
         self.error_count = 0
+        # get_institution_mentions() runs searches in parallel threads
+        self._metrics_lock = threading.Lock()
 
         # SDK info for health checks
         self.sdk_version = "xdk (official)"
@@ -187,7 +1026,7 @@ class XAPIClient:
     # Endpoint 1: Tweet Search (Primary) - Using xdk
     # -------------------------------------------------------------------------
 
-    @with_retry(max_attempts=3, exceptions=(Exception,))
+    @with_retry(max_attempts=3, exceptions=(Exception,), endpoint="x_search")
     def search_recent_tweets(
         self,
         query: str,
@@ -212,11 +1051,15 @@ class XAPIClient:
         if not self.circuit_breaker.can_execute():
             raise Exception(f"Circuit breaker OPEN - API temporarily unavailable. Status: {self.circuit_breaker.get_status()}")
 
-        self.request_count += 1
+        X_SEARCH_BUCKET.acquire()
+        with self._metrics_lock:
+            self.request_count += 1
         full_query = f"{query} -is:retweet lang:en"
 
         tweets = []
-        tweets_collected = 0
+        # Weights bound to locals once, outside the per-tweet loop
+        (_, w_retweet), (_, w_quote), (_, w_reply), (_, w_like) = _ENGAGEMENT_WEIGHTS
+        today_ordinal = datetime.now(timezone.utc).toordinal()
 
         try:
             # Use official SDK with automatic pagination
@@ -226,12 +1069,12 @@ class XAPIClient:
                 query=full_query,
                 max_results=max(10, min(max_results, 100)),
                 sort_order=sort_order,
-                tweet_fields=["created_at", "public_metrics", "author_id", "text", "context_annotations", "conversation_id", "entities", "referenced_tweets"],
-                expansions=["author_id", "referenced_tweets.id"],
-                user_fields=["username", "verified", "verified_type", "public_metrics", "description", "created_at"]
+                tweet_fields=self._SEARCH_TWEET_FIELDS,
+                expansions=self._SEARCH_EXPANSIONS,
+                user_fields=self._SEARCH_USER_FIELDS
             ):
                 # Convert page data to dict for processing
-                page_data = page.model_dump() if hasattr(page, 'model_dump') else dict(page)
+                page_data = _model_to_dict(page)
 
                 if not page_data.get('data'):
                     break
@@ -241,13 +1084,21 @@ class XAPIClient:
                 if page_data.get('includes') and page_data['includes'].get('users'):
                     users = {u.get('id'): u for u in page_data['includes']['users']}
 
-                for tweet in page_data.get('data', []):
-                    if tweets_collected >= max_results:
-                        break
+                # Author-derived fields and scores, computed once per author per
+                # page; busy accounts often post several tweets in one page
+                author_features = {}
 
+                # Only walk the part of the page that still fits in max_results
+                for tweet in page_data['data'][:max_results - len(tweets)]:
+                    tweet_id = tweet.get('id')
                     author_id = tweet.get('author_id')
-                    author = users.get(author_id, {})
-                    username = author.get('username', 'unknown')
+                    features = author_features.get(author_id)
+                    if features is None:
+                        features = author_features[author_id] = self._author_features(
+                            users.get(author_id, {}), today_ordinal
+                        )
+                    (username, is_verified, verified_type, verification_weight, followers,
+                     influence_points, following, author_tweet_count, account_age) = features
 
                     # Calculate engagement score (weighted)
                     public_metrics = tweet.get('public_metrics', {})
@@ -256,33 +1107,23 @@ class XAPIClient:
                     replies = public_metrics.get('reply_count', 0)
                     quotes = public_metrics.get('quote_count', 0)
 
-                    # Engagement score: RTs worth 3x, quotes 2x, replies 1.5x, likes 1x
-                    engagement_score = (retweets * 3) + (quotes * 2) + (replies * 1.5) + likes
-
-                    # Verification weight (verified accounts more credible)
-                    is_verified = author.get('verified', False)
-                    verified_type = author.get('verified_type', 'none')
-                    verification_weight = 2.0 if verified_type in ['business', 'government'] else (1.5 if is_verified else 1.0)
-
-                    # Follower influence score
-                    author_metrics = author.get('public_metrics', {})
-                    followers = author_metrics.get('followers_count', 0)
-                    influence_score = min(followers / 10000, 10)  # Cap at 10
+                    # Weighted engagement score (see _ENGAGEMENT_WEIGHTS)
+                    engagement_score = retweets * w_retweet + quotes * w_quote + replies * w_reply + likes * w_like
 
                     # Combined credibility score
-                    credibility_score = (engagement_score * verification_weight) + (influence_score * 10)
+                    credibility_score = (engagement_score * verification_weight) + influence_points
 
                     tweets.append({
-                        "id": tweet.get("id"),
-                        "text": tweet.get("text"),
+                        "id": tweet_id,
+                        "text": tweet.get("text") or "",
                         "created_at": tweet.get("created_at"),
                         "author_username": username,
                         "author_verified": is_verified,
                         "author_verified_type": verified_type,
                         "author_followers": followers,
-                        "author_following": author_metrics.get("following_count", 0),
-                        "author_tweet_count": author_metrics.get("tweet_count", 0),
-                        "author_account_age_days": self._calculate_account_age(author.get("created_at")),
+                        "author_following": following,
+                        "author_tweet_count": author_tweet_count,
+                        "author_account_age_days": account_age,
                         "retweets": retweets,
                         "likes": likes,
                         "replies": replies,
@@ -290,40 +1131,83 @@ class XAPIClient:
                         "engagement_score": engagement_score,
                         "credibility_score": credibility_score,
                         "verification_weight": verification_weight,
-                        "url": self.TWEET_URL_TEMPLATE.format(username=username, tweet_id=tweet.get("id")),
+                        "url": f"https://x.com/{username}/status/{tweet_id}",
                         "context_annotations": tweet.get("context_annotations", []),
                         "is_reply": bool(tweet.get("referenced_tweets", [])),
                     })
-                    tweets_collected += 1
 
-                if tweets_collected >= max_results:
+                if len(tweets) >= max_results:
                     break
 
             self.circuit_breaker.record_success()
-            self.success_count += 1
+            with self._metrics_lock:
+                self.success_count += 1
             return tweets
 
         except Exception as e:
             self.circuit_breaker.record_failure()
-            self.error_count += 1
-            error_str = str(e).lower()
-
-            # Check for rate limiting
-            if "429" in str(e) or "rate" in error_str:
-                raise Exception(f"X API rate limited (remaining: 0). Resets in 900s at {datetime.now(timezone.utc).isoformat()}")
-            elif "401" in str(e) or "unauthorized" in error_str:
-                raise ValueError("X API authentication failed. Check your bearer token.")
-            else:
-                raise Exception(f"X API error: {str(e)}")
+            with self._metrics_lock:
+                self.error_count += 1
+            message = str(e)
+            error_lower = message.lower()
+
+            # Rate limiting first, then auth failures
+            for token, make_error in _ERROR_SIGNATURES:
+                if token in error_lower:
+                    raise make_error() from e
+            raise Exception(f"X API error: {message}")
+
+    def _author_features(self, author: Dict, today_ordinal: int) -> tuple:
+        """
+        Author fields and score components used for each of the author's tweets.
+
+        Returns:
+            (username, verified, verified_type, verification_weight, followers,
+             influence_points, following, tweet_count, account_age_days)
+        """
+        # Verification weight (verified accounts more credible)
+        is_verified = author.get('verified', False)
+        verified_type = author.get('verified_type', 'none')
+        verification_weight = _VERIFICATION_WEIGHTS.get(verified_type, 1.5 if is_verified else 1.0)
+
+        # Follower influence score, capped at 10 and worth 10 points each
+        author_metrics = author.get('public_metrics', {})
+        followers = author_metrics.get('followers_count', 0)
+        influence_score = min(followers / 10000, 10)
+
+        return (
+            author.get('username', 'unknown'),
+            is_verified,
+            verified_type,
+            verification_weight,
+            followers,
+            influence_score * 10,
+            author_metrics.get("following_count", 0),
+            author_metrics.get("tweet_count", 0),
+            self._calculate_account_age(author.get("created_at"), today_ordinal),
+        )
+
+    def _calculate_account_age(self, created_at: Any, today_ordinal: Optional[int] = None) -> int:
+        """
+        Calculate account age in whole calendar days.
 
-    def _calculate_account_age(self, created_at: Optional[str]) -> int:
-        """Calculate account age in days."""
+        X timestamps are fixed-format ("YYYY-MM-DDTHH:MM:SS.000Z"), so only the
+        date digits are parsed and compared against the caller's `today_ordinal`
+        (computed once per search) instead of building aware datetimes per tweet.
+        Callers outside a search may omit it to use today's UTC date.
+        """
         if not created_at:
             return 0
+        if today_ordinal is None:
+            today_ordinal = datetime.now(timezone.utc).toordinal()
         try:
-            created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-            return (datetime.now(timezone.utc) - created).days
-        except:
+            if isinstance(created_at, str):
+                created_ordinal = date(int(created_at[0:4]), int(created_at[5:7]), int(created_at[8:10])).toordinal()
+            else:
+                # model_dump() may already have produced a datetime
+                created_ordinal = created_at.toordinal()
+            return today_ordinal - created_ordinal
+        except (ValueError, TypeError, AttributeError):
             return 0
 
     # -------------------------------------------------------------------------
@@ -331,7 +1215,33 @@ class XAPIClient:
     # Uses X API v2 REST endpoint directly for accurate velocity calculation
     # -------------------------------------------------------------------------
 
-    @with_retry(max_attempts=3, exceptions=(Exception,))
+    @with_retry(max_attempts=3, exceptions=(Exception,), endpoint="x_counts")
+    def _request_tweet_counts(self, query: str, granularity: str, hours_back: int) -> Dict[str, Any]:
+        """
+        One /tweets/counts/recent request.
+
+        Errors (429s included) propagate so with_retry can pace and back off;
+        get_tweet_counts() turns a final failure into safe defaults.
+        """
+        # Calculate time window
+        now = datetime.now(timezone.utc)
+        start_time = (now - timedelta(hours=min(hours_back, 168))).isoformat()
+
+        headers = {
+            "Authorization": f"Bearer {self.bearer_token}"
+        }
+
+        params = {
+            "query": f"{query} -is:retweet lang:en",
+            "granularity": granularity,
+            "start_time": start_time
+        }
+
+        response = _get_x_session().get(X_COUNTS_URL, headers=headers, params=params, timeout=30)
+        RATE_LIMITER.observe("x_counts", response.headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def get_tweet_counts(
         self,
         query: str,
@@ -352,39 +1262,22 @@ class XAPIClient:
             Volume data with trend analysis including velocity_change_percent
         """
         try:
-            import requests
-            from datetime import datetime, timedelta, timezone
-
-            # X API v2 counts endpoint
-            url = "https://api.x.com/2/tweets/counts/recent"
-
-            # Calculate time window
-            now = datetime.now(timezone.utc)
-            start_time = (now - timedelta(hours=min(hours_back, 168))).isoformat()
-
-            headers = {
-                "Authorization": f"Bearer {self.bearer_token}"
-            }
-
-            params = {
-                "query": f"{query} -is:retweet lang:en",
-                "granularity": granularity,
-                "start_time": start_time
-            }
-
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = self._request_tweet_counts(query, granularity, hours_back)
 
             # Extract time series data
             if data.get('data') and len(data['data']) >= 2:
                 time_series = data['data']
                 total_count = data.get('meta', {}).get('total_tweet_count', 0)
 
-                # Calculate velocity: compare recent half vs older half
+                # Calculate velocity: compare recent half vs older half, in one
+                # pass over the buckets without slicing the series
                 midpoint = len(time_series) // 2
-                recent_volume = sum(bucket.get('tweet_count', 0) for bucket in time_series[midpoint:])
-                older_volume = sum(bucket.get('tweet_count', 0) for bucket in time_series[:midpoint])
+                older_volume = recent_volume = 0
+                for i, bucket in enumerate(time_series):
+                    if i < midpoint:
+                        older_volume += bucket.get('tweet_count', 0)
+                    else:
+                        recent_volume += bucket.get('tweet_count', 0)
 
                 # Calculate velocity percentage
                 if older_volume > 0:
@@ -446,24 +1339,22 @@ class XAPIClient:
             Response with created rule IDs
         """
         try:
-            # Pass dict directly - UpdateRulesRequest model doesn't work correctly
-            body = {"add": rules}
-            response = self.client.stream.update_rules(body=body)
-
-            return {
-                "status": "success",
-                "rules_created": len(rules),
-                "response": response.model_dump() if hasattr(response, 'model_dump') else dict(response)
-            }
+            return self._update_stream_rules({"add": rules}, rules_created=len(rules))
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def _update_stream_rules(self, body: Dict, **summary) -> Dict:
+        """Send one add/delete rules request and wrap the decoded response."""
+        # Pass dict directly - UpdateRulesRequest model doesn't work correctly
+        response = self.client.stream.update_rules(body=body)
+        return {"status": "success", **summary, "response": _model_to_dict(response)}
+
     def get_stream_rules(self) -> List[Dict]:
         """Get current filtered stream rules."""
         try:
             rules = []
             for page in self.client.stream.get_rules():
-                page_data = page.model_dump() if hasattr(page, 'model_dump') else dict(page)
+                page_data = _model_to_dict(page)
                 if page_data.get('data'):
                     for rule in page_data['data']:
                         rules.append({
@@ -496,15 +1387,7 @@ class XAPIClient:
             if not rule_ids:
                 return {"status": "no_rules", "deleted": 0}
 
-            # Pass dict directly - UpdateRulesRequest model doesn't work correctly
-            body = {"delete": {"ids": rule_ids}}
-            response = self.client.stream.update_rules(body=body)
-
-            return {
-                "status": "success",
-                "deleted": len(rule_ids),
-                "response": response.model_dump() if hasattr(response, 'model_dump') else dict(response)
-            }
+            return self._update_stream_rules({"delete": {"ids": rule_ids}}, deleted=len(rule_ids))
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
@@ -523,33 +1406,14 @@ class XAPIClient:
         Yields:
             Dict with enriched post data including engagement metrics
         """
-        # Request rich tweet fields
-        tweet_fields = [
-            'id', 'text', 'created_at', 'author_id',
-            'public_metrics',  # retweets, likes, replies, quotes
-            'entities',        # hashtags, mentions, urls
-            'lang',
-            'possibly_sensitive'
-        ]
-
-        # Request user fields for author expansion
-        user_fields = [
-            'id', 'name', 'username',
-            'verified', 'verified_type',
-            'public_metrics',  # followers, following
-        ] if include_user_data else None
-
-        # Expand author_id to get full user object
-        expansions = ['author_id'] if include_user_data else None
-
         try:
+            # Request rich tweet fields, plus the expanded author when wanted
             stream_kwargs = {
-                'tweet_fields': tweet_fields,
+                'tweet_fields': self._STREAM_TWEET_FIELDS,
             }
-            if expansions:
-                stream_kwargs['expansions'] = expansions
-            if user_fields:
-                stream_kwargs['user_fields'] = user_fields
+            if include_user_data:
+                stream_kwargs['expansions'] = self._STREAM_EXPANSIONS
+                stream_kwargs['user_fields'] = self._STREAM_USER_FIELDS
             if backfill_minutes:
                 stream_kwargs['backfill_minutes'] = min(backfill_minutes, 5)
 
@@ -573,9 +1437,9 @@ class XAPIClient:
 
                 try:
                     try:
-                        data = post_response.model_dump() if hasattr(post_response, 'model_dump') else dict(post_response)
+                        data = _model_to_dict(post_response)
                     except UnicodeDecodeError:
-                        # Skip this post if model_dump fails with UTF-8 error
+                        # Skip this post if serialization fails with UTF-8 error
                         continue
 
                     if data.get('data'):
@@ -591,13 +1455,8 @@ class XAPIClient:
                         )
 
                         # Find author in includes
-                        author = None
-                        if data.get('includes', {}).get('users'):
-                            author_id = tweet.get('author_id')
-                            for user in data['includes']['users']:
-                                if user.get('id') == author_id:
-                                    author = user
-                                    break
+                        users_by_id = {u.get('id'): u for u in (data.get('includes') or {}).get('users') or []}
+                        author = users_by_id.get(tweet.get('author_id'))
 
                         # Extract entities
                         entities = tweet.get('entities', {})
@@ -639,7 +1498,7 @@ class XAPIClient:
                                 "following": author_metrics.get('following_count', 0),
                             }
                             # Calculate credibility score
-                            enriched["author"]["credibility_score"] = self._calculate_credibility(
+                            enriched["author"]["credibility_score"] = _author_credibility(
                                 author_metrics.get('followers_count', 0),
                                 author.get('verified', False),
                                 author.get('verified_type')
@@ -657,58 +1516,10 @@ class XAPIClient:
         except Exception as e:
             yield {"error": str(e), "type": "stream_error"}
 
-    def _calculate_credibility(self, followers: int, verified: bool, verified_type: str) -> float:
-        """Calculate author credibility score."""
-        score = min(followers / 1000, 50)  # Max 50 from followers
-        if verified:
-            if verified_type == "business":
-                score += 40
-            elif verified_type == "government":
-                score += 50
-            else:
-                score += 25
-        return round(score, 1)
-
     # -------------------------------------------------------------------------
     # Combined Institution Analysis (Uses All Endpoints)
     # -------------------------------------------------------------------------
 
-    def _build_flexible_query(self, institution_name: str, inst_type: str) -> str:
-        """
-        Build a flexible search query that works for both companies and person names.
-
-        For person names (e.g., "Elon Musk"), creates a more flexible query like:
-        (Elon OR "Elon Musk") to catch partial mentions
-
-        For institutions, uses exact phrase matching: "Chase"
-
-        Args:
-            institution_name: Name to search for
-            inst_type: Institution type from classification
-
-        Returns:
-            Optimized search query string
-        """
-        # If it's an unknown type and contains multiple words, likely a person name
-        is_likely_person = (
-            inst_type == "unknown" and
-            " " in institution_name.strip() and
-            len(institution_name.split()) <= 3  # Avoid long phrases
-        )
-
-        if is_likely_person:
-            # For person names, use flexible matching
-            # e.g., "Elon Musk" becomes (Elon OR "Elon Musk")
-            words = institution_name.strip().split()
-            first_word = words[0]
-
-            # Build query: (FirstName OR "Full Name")
-            flexible_query = f'({first_word} OR "{institution_name}")'
-            return flexible_query
-        else:
-            # For institutions, use exact phrase matching
-            return f'"{institution_name}"'
-
     def get_institution_mentions(
         self,
         institution_name: str,
@@ -727,59 +1538,70 @@ class XAPIClient:
             Enriched data with tweets, trends, and metadata including institution type
         """
         # Get institution-specific context for targeted search
-        inst_context = get_institution_context(institution_name)
-        inst_type = inst_context["institution_type"]
-        type_specific_keywords = inst_context["risk_keywords"]
-
-        # Base risk keywords (common to all)
-        base_risk_keywords = [
-            "outage", "down", "not working", "can't access", "can't login",
-            "fraud", "scam", "hack", "breach", "warning"
-        ]
-
-        # Combine base + type-specific keywords (prioritize type-specific)
-        risk_keywords = type_specific_keywords[:8] + base_risk_keywords[:6]
+        inst_type = _cached_institution_context(institution_name)["institution_type"]
 
-        # Build flexible query that works for both institutions and person names
-        primary_query = self._build_flexible_query(institution_name, inst_type)
-        risk_query = f'{primary_query} ({" OR ".join(risk_keywords[:12])})'
+        # Build flexible query that works for both institutions and person names,
+        # plus its risk-keyword variant (both memoized per institution)
+        primary_query = _build_flexible_query(institution_name, inst_type)
+        risk_query = _build_risk_query(institution_name, inst_type)
 
         all_tweets = []
         trend_data = None
         rate_limit_error = None
 
-        # 1. Fetch risk-focused tweets (high priority)
-        try:
-            risk_tweets = self.search_recent_tweets(risk_query, max_results=50, sort_order="relevancy")
-            all_tweets.extend(risk_tweets)
-        except Exception as e:
-            if "rate limit" in str(e).lower():
-                rate_limit_error = str(e)
-
-        # 2. Fetch general sentiment tweets
-        try:
-            general_tweets = self.search_recent_tweets(primary_query, max_results=50, sort_order="recency")
-            existing_ids = {t["id"] for t in all_tweets}
-            for t in general_tweets:
-                if t["id"] not in existing_ids:
-                    all_tweets.append(t)
-        except Exception as e:
-            if "rate limit" in str(e).lower():
-                rate_limit_error = str(e)
+        # The searches and the counts request are independent network calls,
+        # so they run concurrently: wall time is the slowest call, not the sum.
+        # Tweets from a batched cycle query (see batch_institution_mentions)
+        # replace the searches only when there are enough of them; a handful
+        # of incidental hits is merged with the targeted results instead.
+        prefetched = get_prefetched_mentions(institution_name) or []
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            search_futures = []
+            if len(prefetched) < PREFETCH_MIN_TWEETS:
+                # 1. Risk-focused tweets (high priority), 2. general sentiment tweets
+                search_futures.append(pool.submit(self.search_recent_tweets, risk_query, max_results=50, sort_order="relevancy"))
+                search_futures.append(pool.submit(self.search_recent_tweets, primary_query, max_results=50, sort_order="recency"))
+
+            # 3. Trend/volume data (if enabled)
+            counts_future = None
+            if include_trend_data:
+                counts_future = pool.submit(self.get_tweet_counts, primary_query, granularity="hour", hours_back=24)
+
+            # Merge in submission order so risk tweets win duplicate ids
+            seen_ids = set()
+            for future in search_futures:
+                try:
+                    results = future.result()
+                except XAPIRateLimitError as e:
+                    rate_limit_error = e
+                    continue
+                except Exception:
+                    continue
+                # set.add() returns None, so the filter records each id as it passes
+                all_tweets.extend(
+                    t for t in results
+                    if t["id"] not in seen_ids and not seen_ids.add(t["id"])
+                )
+
+            all_tweets.extend(
+                t for t in prefetched
+                if t["id"] not in seen_ids and not seen_ids.add(t["id"])
+            )
 
-        # 3. Fetch trend/volume data (if enabled)
-        if include_trend_data:
-            try:
-                trend_data = self.get_tweet_counts(primary_query, granularity="hour", hours_back=24)
-            except Exception:
-                pass  # Non-critical
+            if counts_future is not None:
+                try:
+                    trend_data = counts_future.result()
+                except Exception:
+                    pass  # Non-critical
 
         # If we got no tweets and hit rate limit, raise it
         if not all_tweets and rate_limit_error:
-            raise Exception(rate_limit_error)
+            raise rate_limit_error
 
         # Sort by credibility score (most credible first)
-        all_tweets.sort(key=lambda t: t.get("credibility_score", 0), reverse=True)
+        # Every tweet here comes from search_recent_tweets(), which always sets
+        # credibility_score, so the C-level itemgetter can replace a lambda
+        all_tweets.sort(key=itemgetter("credibility_score"), reverse=True)
 
         return {
             "tweets": all_tweets[:max_results],
@@ -787,7 +1609,7 @@ class XAPIClient:
             "trend_data": trend_data,
             "sdk": self.sdk_version,
             "institution_type": inst_type,
-            "risk_keywords_used": risk_keywords[:8],
+            "risk_keywords_used": list(_risk_keywords(inst_type)[:8]),
             "api_metrics": {
                 "requests_made": self.request_count,
                 "success_rate": self.success_count / max(self.request_count, 1),
@@ -795,6 +1617,112 @@ class XAPIClient:
             }
         }
 
+    # X API recent search rejects queries longer than this (Basic/Self-serve tier)
+    MAX_QUERY_LENGTH = 512
+
+    def batch_institution_mentions(
+        self,
+        institution_names: List[str],
+        max_results: int = 100
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch mentions for many institutions with as few search calls as possible.
+
+        Names are OR-ed into one query (split into several only when the query
+        would exceed MAX_QUERY_LENGTH) and each returned tweet is attributed to
+        every institution whose name appears in its text as a whole word, so
+        "Chase" doesn't claim a tweet about being "chased".
+
+        Args:
+            institution_names: Institutions to search for
+            max_results: Max tweets to fetch per batched query
+
+        Returns:
+            Dict mapping each institution name to its matching tweets
+        """
+        suffix_len = len(" -is:retweet lang:en") + 2  # surrounding parentheses
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_len = 0
+        for name in institution_names:
+            term_len = len(name) + 2 + (4 if current else 0)  # quotes + " OR "
+            if current and current_len + term_len + suffix_len > self.MAX_QUERY_LENGTH:
+                batches.append(current)
+                current, current_len = [], 0
+                term_len -= 4
+            current.append(name)
+            current_len += term_len
+        if current:
+            batches.append(current)
+
+        needles = [(name, name.lower(), _mention_pattern(name.lower())) for name in institution_names]
+        mentions: Dict[str, List[Dict]] = {name: [] for name in institution_names}
+
+        # A tweet naming institutions from two batches comes back from both
+        # queries; attribute it only once
+        seen_ids = set()
+        for batch in batches:
+            query = "(" + " OR ".join(f'"{name}"' for name in batch) + ")"
+            for tweet in self.search_recent_tweets(query, max_results=max_results):
+                if tweet["id"] in seen_ids:
+                    continue
+                seen_ids.add(tweet["id"])
+                text_lower = (tweet.get("text") or "").lower()
+                for name, name_lower, pattern in needles:
+                    # Cheap substring test first; the boundary check only
+                    # runs for the few names that actually occur
+                    if name_lower in text_lower and pattern.search(text_lower):
+                        mentions[name].append(tweet)
+
+        return mentions
+
+    async def get_institution_mentions_async(
+        self,
+        institution_name: str,
+        max_results: int = 100,
+        include_trend_data: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Async wrapper around get_institution_mentions().
+
+        xdk is synchronous, so the fetch runs in a worker thread and several
+        institutions can be fetched concurrently with asyncio.gather.
+        """
+        return await asyncio.to_thread(
+            self.get_institution_mentions, institution_name, max_results, include_trend_data
+        )
+
+    async def get_many_institution_mentions_async(
+        self,
+        institution_names: List[str],
+        max_concurrency: int = 10,
+        max_results: int = 100,
+        include_trend_data: bool = True
+    ) -> List[Any]:
+        """
+        Fetch mentions for many institutions concurrently, at most max_concurrency at a time.
+
+        Each fetch already fans out into up to three parallel requests, so
+        the bound keeps a large watchlist from flooding the thread pool and
+        the X API rate limit at once.
+
+        Returns:
+            One result per name, in order; a failed fetch yields its exception
+            instead of raising (as with asyncio.gather(return_exceptions=True))
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(institution_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_institution_mentions_async(
+                    institution_name, max_results, include_trend_data
+                )
+
+        return await asyncio.gather(
+            *(fetch(institution_name) for institution_name in institution_names),
+            return_exceptions=True
+        )
+
     def get_api_health(self) -> Dict:
         """Get current API health status."""
         return {
@@ -807,6 +1735,56 @@ class XAPIClient:
         }
 
 
+# =============================================================================
+# Batched Mention Prefetch
+# =============================================================================
+
+# Tweets fetched by one batched query per monitoring cycle, keyed by lowercased
+# institution name. get_institution_mentions() consumes these instead of
+# issuing its own searches, so the agent's tool calls don't re-fetch.
+# Default lifetime when the caller doesn't give its cycle interval
+PREFETCH_TTL_SECONDS = 300
+# Batched hits needed before they replace an institution's targeted searches
+PREFETCH_MIN_TWEETS = 20
+_prefetched_mentions: Dict[str, tuple] = {}
+_prefetched_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _mention_pattern(name_lower: str) -> "re.Pattern[str]":
+    """Whole-word matcher for a lowercased institution name or ticker."""
+    return re.compile(r"(?<!\w)" + re.escape(name_lower) + r"(?!\w)")
+
+
+def prime_prefetched_mentions(
+    mentions: Dict[str, List[Dict]],
+    ttl_seconds: Optional[float] = None
+) -> None:
+    """
+    Store batched search results for later get_institution_mentions() calls.
+
+    Args:
+        mentions: Tweets per institution, as from batch_institution_mentions()
+        ttl_seconds: How long the results stay usable; pass the monitoring
+            cycle interval so they last until the next cycle re-primes them
+    """
+    expires_at = time.monotonic() + (PREFETCH_TTL_SECONDS if ttl_seconds is None else ttl_seconds)
+    with _prefetched_lock:
+        _prefetched_mentions.clear()
+        for name, tweets in mentions.items():
+            if tweets:
+                _prefetched_mentions[name.strip().lower()] = (expires_at, tweets)
+
+
+def get_prefetched_mentions(institution_name: str) -> Optional[List[Dict]]:
+    """Return fresh pre-fetched tweets for an institution, if any."""
+    with _prefetched_lock:
+        entry = _prefetched_mentions.get(institution_name.strip().lower())
+    if not entry or time.monotonic() > entry[0]:
+        return None
+    return list(entry[1])
+
+
 # =============================================================================
 # Institution Type Classification & Type-Specific Prompts
 # =============================================================================
@@ -945,38 +1923,154 @@ INSTITUTION_REGISTRY = {
     "affirm": InstitutionType.PAYMENT_APP,
 }
 
+# Read-only from here on; keys are interned so lookups with interned names
+# (see classify_institution) match on identity before comparing characters
+INSTITUTION_REGISTRY = MappingProxyType(
+    {sys.intern(key): inst_type for key, inst_type in INSTITUTION_REGISTRY.items()}
+)
+
+
+# Registry entries as (key, key_len, type), longest key first so the most
+# specific partial match wins ("coinbase wallet" before "coinbase")
+_REGISTRY_ITEMS = tuple(sorted(
+    ((key, len(key), inst_type) for key, inst_type in INSTITUTION_REGISTRY.items()),
+    key=lambda item: -item[1],
+))
 
-def classify_institution(name: str) -> InstitutionType:
-    """Classify an institution by name to determine its type."""
-    name_lower = name.lower().strip()
+# Keyword buckets used when no registry key matches, in priority order
+_TYPE_KEYWORDS = (
+    (InstitutionType.CRYPTO_EXCHANGE, ("crypto", "coin", "token", "defi", "dex", "swap", "chain", "wallet")),
+    (InstitutionType.TRADITIONAL_BANK, ("bank", "banking", "credit union", "federal")),
+    (InstitutionType.TRADING_PLATFORM, ("trade", "trading", "broker", "invest", "stocks")),
+    (InstitutionType.PAYMENT_APP, ("pay", "payment", "transfer", "send money", "cash")),
+)
 
+
+def _build_pattern_priorities() -> Dict[str, Tuple[int, InstitutionType]]:
+    """Map every classification substring to (priority, type).
+
+    Registry keys rank by position in _REGISTRY_ITEMS (longest first) and
+    keyword buckets rank after all of them, so the lowest priority hit is the
+    most specific match.
+    """
+    priorities: Dict[str, Tuple[int, InstitutionType]] = {}
+    for rank, (key, _, inst_type) in enumerate(_REGISTRY_ITEMS):
+        priorities.setdefault(key, (rank, inst_type))
+    base = len(_REGISTRY_ITEMS)
+    for offset, (inst_type, keywords) in enumerate(_TYPE_KEYWORDS):
+        for keyword in keywords:
+            priorities.setdefault(keyword, (base + offset, inst_type))
+    return priorities
+
+
+_PATTERN_PRIORITIES = _build_pattern_priorities()
+
+# Registry part of the table as contiguous (pattern, len, (priority, type))
+# rows for the pure-Python scan, which skips patterns longer than the name
+_PATTERN_ITEMS = tuple(
+    (pattern, len(pattern), value)
+    for pattern, value in _PATTERN_PRIORITIES.items()
+    if value[0] < len(_REGISTRY_ITEMS)
+)
+
+# One compiled alternation per keyword bucket, searched in bucket order
+_KEYWORD_BUCKET_PATTERNS = tuple(
+    ((len(_REGISTRY_ITEMS) + offset, inst_type), re.compile("|".join(map(re.escape, keywords))))
+    for offset, (inst_type, keywords) in enumerate(_TYPE_KEYWORDS)
+)
+
+# Aho-Corasick automaton over all patterns: one linear pass per name instead
+# of a substring test per pattern. pyahocorasick is optional; without it we
+# scan _PATTERN_ITEMS in priority order.
+try:
+    import ahocorasick
+    _PATTERN_AUTOMATON = ahocorasick.Automaton()
+    for _pattern, _value in _PATTERN_PRIORITIES.items():
+        _PATTERN_AUTOMATON.add_word(_pattern, _value)
+    _PATTERN_AUTOMATON.make_automaton()
+    del _pattern, _value
+except ImportError:
+    _PATTERN_AUTOMATON = None
+
+# Registry keys joined into one haystack so "name is part of a key" (e.g.
+# "coin" -> "coinbase") is a single str.find plus a bisect on key offsets.
+# This direction follows registry order, not longest-first: the longest key
+# containing a short name is the least specific match ("coin" would land on
+# "coinbase wallet", "us" on "trust wallet")
+_REGISTRY_KEYS = tuple(INSTITUTION_REGISTRY)
+_REGISTRY_KEY_TYPES = tuple(INSTITUTION_REGISTRY.values())
+_REGISTRY_HAYSTACK = "\n".join(_REGISTRY_KEYS)
+_REGISTRY_KEY_OFFSETS = [0]
+for _key in _REGISTRY_KEYS[:-1]:
+    _REGISTRY_KEY_OFFSETS.append(_REGISTRY_KEY_OFFSETS[-1] + len(_key) + 1)
+del _key
+
+
+def _best_pattern_hit(name_lower: str) -> Optional[Tuple[int, InstitutionType]]:
+    """Return the lowest-priority (priority, type) pattern found in the name."""
+    if _PATTERN_AUTOMATON is not None:
+        return min(
+            (value for _, value in _PATTERN_AUTOMATON.iter(name_lower)),
+            key=itemgetter(0),
+            default=None,
+        )
+    name_len = len(name_lower)
+    for pattern, pattern_len, value in _PATTERN_ITEMS:
+        if pattern_len <= name_len and pattern in name_lower:
+            return value
+    for value, pattern_re in _KEYWORD_BUCKET_PATTERNS:
+        if pattern_re.search(name_lower):
+            return value
+    return None
+
+
+def _first_registry_key_containing(name_lower: str) -> Optional[InstitutionType]:
+    """Return the type of the first registry key (in registry order) that contains the name."""
+    # Exact matches are handled by the caller, so only names shorter than the
+    # longest key can sit inside one; most full names skip the search here
+    if len(name_lower) >= _REGISTRY_ITEMS[0][1]:
+        return None
+    if "\n" in name_lower:
+        return next((_REGISTRY_KEY_TYPES[i] for i, key in enumerate(_REGISTRY_KEYS) if name_lower in key), None)
+    pos = _REGISTRY_HAYSTACK.find(name_lower)
+    if pos < 0:
+        return None
+    return _REGISTRY_KEY_TYPES[bisect_right(_REGISTRY_KEY_OFFSETS, pos) - 1]
+
+
+def classify_institution(name: str, name_lower: Optional[str] = None) -> InstitutionType:
+    """
+    Classify an institution by name to determine its type.
+
+    Args:
+        name: Institution name as given by the caller
+        name_lower: Already-normalized (lowercased, stripped) name, if the
+            caller has one; saves re-normalizing here
+    """
+    if name_lower is None:
+        name_lower = name.lower().strip()
+    return _classify_normalized(sys.intern(name_lower))
+
+
+@lru_cache(maxsize=1024)
+def _classify_normalized(name_lower: str) -> InstitutionType:
+    """Memoized classification keyed on the normalized name, so "Chase" and "chase " share an entry."""
     # Direct match
     if name_lower in INSTITUTION_REGISTRY:
         return INSTITUTION_REGISTRY[name_lower]
 
-    # Partial match (e.g., "Chase Bank" matches "chase")
-    for key, inst_type in INSTITUTION_REGISTRY.items():
-        if key in name_lower or name_lower in key:
-            return inst_type
-
-    # Keyword-based classification
-    crypto_keywords = ["crypto", "coin", "token", "defi", "dex", "swap", "chain", "wallet"]
-    bank_keywords = ["bank", "banking", "credit union", "federal"]
-    trading_keywords = ["trade", "trading", "broker", "invest", "stocks"]
-    payment_keywords = ["pay", "payment", "transfer", "send money", "cash"]
-
-    for keyword in crypto_keywords:
-        if keyword in name_lower:
-            return InstitutionType.CRYPTO_EXCHANGE
-    for keyword in bank_keywords:
-        if keyword in name_lower:
-            return InstitutionType.TRADITIONAL_BANK
-    for keyword in trading_keywords:
-        if keyword in name_lower:
-            return InstitutionType.TRADING_PLATFORM
-    for keyword in payment_keywords:
-        if keyword in name_lower:
-            return InstitutionType.PAYMENT_APP
+    # Partial match: a registry key inside the name (e.g., "Chase Bank"
+    # matches "chase"; the longest such key wins), then the name inside a key
+    # (e.g., "coin" matches "coinbase"; first in registry order), then
+    # keyword-based classification
+    hit = _best_pattern_hit(name_lower)
+    if hit is not None and hit[0] < len(_REGISTRY_ITEMS):
+        return hit[1]
+    containing = _first_registry_key_containing(name_lower)
+    if containing is not None:
+        return containing
+    if hit is not None:
+        return hit[1]
 
     return InstitutionType.UNKNOWN
 
@@ -1146,22 +2240,436 @@ Use standard risk assessment without institution-type-specific weighting."""
 }
 
 
+@lru_cache(maxsize=None)
+def _build_context(inst_type: InstitutionType) -> MappingProxyType:
+    """Type-level part of the institution context (static per type)."""
+    return MappingProxyType({
+        "institution_type": inst_type.value,
+        "risk_keywords": INSTITUTION_RISK_KEYWORDS.get(inst_type, []),
+        "prompt_section": INSTITUTION_PROMPT_SECTIONS.get(inst_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN])
+    })
+
+
 def get_institution_context(institution_name: str) -> Dict[str, Any]:
     """Get type-specific context for an institution."""
     inst_type = classify_institution(institution_name)
 
-    return {
-        "institution_name": institution_name,
-        "institution_type": inst_type.value,
-        "risk_keywords": INSTITUTION_RISK_KEYWORDS.get(inst_type, []),
-        "prompt_section": INSTITUTION_PROMPT_SECTIONS.get(inst_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN])
-    }
+    return {"institution_name": institution_name, **_build_context(inst_type)}
+
+
+@lru_cache(maxsize=512)
+def _cached_institution_context(institution_name: str) -> Dict[str, Any]:
+    """
+    Memoized get_institution_context() for the monitoring hot paths.
+
+    The same institutions are classified on every poll; the returned dict is
+    shared between callers, so treat it as read-only.
+    """
+    return get_institution_context(institution_name)
+
+
+@lru_cache(maxsize=1024)
+def _build_flexible_query(institution_name: str, inst_type: str) -> str:
+    """
+    Build a flexible search query that works for both companies and person names.
+
+    For person names (e.g., "Elon Musk"), creates a more flexible query like:
+    (Elon OR "Elon Musk") to catch partial mentions
+
+    For institutions, uses exact phrase matching: "Chase"
+
+    Args:
+        institution_name: Name to search for
+        inst_type: Institution type from classification
+
+    Returns:
+        Optimized search query string
+    """
+    # If it's an unknown type and contains multiple words, likely a person name
+    is_likely_person = (
+        inst_type == "unknown" and
+        " " in institution_name.strip() and
+        len(institution_name.split()) <= 3  # Avoid long phrases
+    )
+
+    if is_likely_person:
+        # For person names, use flexible matching
+        # e.g., "Elon Musk" becomes (Elon OR "Elon Musk")
+        words = institution_name.strip().split()
+        first_word = words[0]
+
+        # Build query: (FirstName OR "Full Name")
+        flexible_query = f'({first_word} OR "{institution_name}")'
+        return flexible_query
+    else:
+        # For institutions, use exact phrase matching
+        return f'"{institution_name}"'
+
+
+@lru_cache(maxsize=None)
+def _risk_keywords(inst_type: str) -> Tuple[str, ...]:
+    """Type-specific risk keywords (up to 8) followed by the base risk terms."""
+    type_specific_keywords = INSTITUTION_RISK_KEYWORDS.get(InstitutionType(inst_type), [])
+    return tuple(type_specific_keywords[:8]) + tuple(_BASE_RISK_TERMS)
+
+
+@lru_cache(maxsize=1024)
+def _build_risk_query(institution_name: str, inst_type: str) -> str:
+    """Flexible institution query narrowed to its first 12 risk keywords."""
+    primary_query = _build_flexible_query(institution_name, inst_type)
+    return f'{primary_query} ({" OR ".join(_risk_keywords(inst_type)[:12])})'
+
+
+# =============================================================================
+# Shared Grok (xAI, OpenAI-compatible) HTTP Clients
+# =============================================================================
+
+XAI_BASE_URL = "https://api.x.ai/v1"
+
+# HTTP/2 lets concurrent Grok calls multiplex over one TLS connection; httpx
+# only supports it when the optional h2 package (httpx[http2]) is installed
+GROK_HTTP2 = importlib.util.find_spec("h2") is not None
+# Idle connections outlive httpx's 5s default so spaced-out fallback calls
+# (one per rate-limited fetch) still find a warm TLS connection
+GROK_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0)
+GROK_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_grok_client: Optional[OpenAI] = None
+_grok_async_clients: Dict[Any, AsyncOpenAI] = {}
+_grok_client_lock = threading.Lock()
+
+
+def _get_grok_client(api_key: str) -> OpenAI:
+    """
+    Return the process-wide sync xAI client.
+
+    Reusing one client keeps its connection pool (and TLS sessions) alive
+    across calls instead of paying a fresh handshake per request.
+    """
+    global _grok_client
+    client = _grok_client
+    if client is None or client.api_key != api_key:
+        with _grok_client_lock:
+            client = _grok_client
+            if client is None or client.api_key != api_key:
+                client = _grok_client = OpenAI(
+                    api_key=api_key,
+                    base_url=XAI_BASE_URL,
+                    http_client=DefaultHttpxClient(
+                        http2=GROK_HTTP2,
+                        limits=GROK_HTTP_LIMITS,
+                        timeout=GROK_HTTP_TIMEOUT
+                    )
+                )
+    return client
+
+
+def _get_grok_async_client(api_key: str) -> AsyncOpenAI:
+    """
+    Return the async xAI client for the running event loop.
+
+    httpx async connection pools are bound to the loop that opened them, so
+    one long-lived client is kept per loop and dropped once its loop closes.
+    """
+    loop = asyncio.get_running_loop()
+    with _grok_client_lock:
+        for stale in [l for l in _grok_async_clients if l.is_closed()]:
+            del _grok_async_clients[stale]
+        client = _grok_async_clients.get(loop)
+        if client is None or client.api_key != api_key:
+            client = _grok_async_clients[loop] = AsyncOpenAI(
+                api_key=api_key,
+                base_url=XAI_BASE_URL,
+                http_client=DefaultAsyncHttpxClient(
+                    http2=GROK_HTTP2,
+                    limits=GROK_HTTP_LIMITS,
+                    timeout=GROK_HTTP_TIMEOUT
+                )
+            )
+    return client
+
+
+# =============================================================================
+# Structured Output Schemas
+# =============================================================================
+# Passed as response_format to chat.completions.parse() so Grok's reply is
+# constrained to, and returned as, these models instead of free-form JSON.
+# Field names match the dicts the frontend already consumes.
+
+class ConcerningTweet(BaseModel):
+    text: str
+    url: str
+    engagement: str
+    why_concerning: str
+
+
+class SentimentResult(BaseModel):
+    risk_level: Literal["HIGH", "MEDIUM", "LOW"]
+    summary: str
+    key_findings: List[str]
+    top_concerning_tweets: List[ConcerningTweet]
+    viral_indicators: str
+    confidence: float
+    recommended_action: str
+
+
+class LiveSearchResult(BaseModel):
+    risk_level: Literal["HIGH", "MEDIUM", "LOW"]
+    summary: str
+    key_findings: List[str]
+    sample_posts: List[str]
+    post_count_estimate: str
+    confidence: float
+
+
+def _parsed_message_dict(message: Any) -> Dict[str, Any]:
+    """Return a parse() reply as a dict, decoding the raw content if the SDK couldn't."""
+    if message.parsed is not None:
+        return message.parsed.model_dump()
+    return orjson.loads(message.content)
 
 
 # =============================================================================
 # Grok API Client (The "Brain" - Enhanced Analysis)
 # =============================================================================
 
+# Max characters of tweet text quoted in a Grok prompt
+PROMPT_TWEET_TEXT_CHARS = 300
+
+
+@dataclass
+class TweetBatch:
+    """
+    Structure-of-arrays view of a list of tweet dicts.
+
+    Each field is extracted once into a parallel list, so formatting and
+    aggregation iterate plain columns instead of repeating dict lookups.
+    Texts are truncated to PROMPT_TWEET_TEXT_CHARS here, once, rather than
+    on every format, and follower counts are pre-rendered with thousands
+    separators for the prompt. The tweet dicts remain the wire format for
+    API responses.
+    """
+    usernames: List[Optional[str]]
+    verified: List[bool]
+    verified_types: List[str]
+    followers: List[int]
+    follower_strs: List[str]
+    retweets: List[int]
+    likes: List[int]
+    replies: List[int]
+    credibility: List[float]
+    urls: List[str]
+    texts: List[str]
+
+    @classmethod
+    def from_tweets(cls, tweets: List[Dict]) -> "TweetBatch":
+        """Build the column view from enriched tweet dicts."""
+        followers = [t.get("author_followers", 0) for t in tweets]
+        return cls(
+            usernames=[t.get("author_username") for t in tweets],
+            verified=[bool(t.get("author_verified")) for t in tweets],
+            verified_types=[t.get("author_verified_type", "") for t in tweets],
+            followers=followers,
+            follower_strs=[f"{n:,}" for n in followers],
+            retweets=[t.get("retweets", 0) for t in tweets],
+            likes=[t.get("likes", 0) for t in tweets],
+            replies=[t.get("replies", 0) for t in tweets],
+            credibility=[t.get("credibility_score", 0) for t in tweets],
+            urls=[t.get("url", "") for t in tweets],
+            texts=[(t.get("text") or "")[:PROMPT_TWEET_TEXT_CHARS] for t in tweets],
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+def _top_k_by_credibility(tweets: List[Dict], k: int) -> List[Dict]:
+    """
+    Return the k most credible tweets, most credible first.
+
+    Credibility is pulled into one column up front and the ranking is done on
+    indices into it (an argsort), so no per-comparison lambda or dict lookup
+    runs. Small batches are simply sorted; large ones (e.g. filtered-stream
+    backlogs) use a size-k heap so cost grows as O(N log k), not O(N log N).
+    """
+    credibility = [t.get("credibility_score", 0) for t in tweets]
+    if len(tweets) <= k:
+        order = sorted(range(len(tweets)), key=credibility.__getitem__, reverse=True)
+    else:
+        order = heapq.nlargest(k, range(len(tweets)), key=credibility.__getitem__)
+    return [tweets[i] for i in order]
+
+
+def _tweet_aggregates(tweets: List[Dict]) -> Tuple[float, int, float, float]:
+    """
+    Reduce a non-empty tweet list to the prompt's aggregate metrics in one pass.
+
+    Returns:
+        (total engagement, verified tweet count, average credibility,
+        viral risk score 0-100)
+    """
+    total_engagement = 0
+    verified_tweet_count = 0
+    total_credibility = 0
+    for t in tweets:
+        get = t.get
+        total_engagement += get("engagement_score", 0)
+        if get("author_verified"):
+            verified_tweet_count += 1
+        total_credibility += get("credibility_score", 0)
+
+    n = len(tweets)
+    viral_score = min(100, (total_engagement / n) * (1 + verified_tweet_count / 10))
+    return total_engagement, verified_tweet_count, total_credibility / n, viral_score
+
+
+def _render_sentiment_system_prompt(inst_type: InstitutionType) -> str:
+    """Render the analyze_sentiment system prompt for one institution type."""
+    type_specific_prompt = INSTITUTION_PROMPT_SECTIONS.get(inst_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN])
+    type_specific_keywords = INSTITUTION_RISK_KEYWORDS.get(inst_type, [])
+
+    return f"""You are an elite financial risk analyst specializing in real-time monitoring of financial institutions via social media signals.
+
+{type_specific_prompt}
+
+TYPE-SPECIFIC KEYWORDS TO WATCH: {', '.join(type_specific_keywords[:10])}
+
+Your analysis must be:
+1. GROUNDED - Only cite information from the provided tweets
+2. TRACEABLE - Reference specific tweets by their URL when making claims
+3. QUANTITATIVE - Include engagement metrics to support severity assessment
+4. ACTIONABLE - Provide clear risk level with justification
+5. TYPE-AWARE - Apply the institution-type-specific risk signals above
+
+RISK LEVELS:
+- HIGH: Platform-wide outages (multiple verified reports), withdrawal freezes confirmed, hack/breach with evidence, regulatory action announced, bank run signals, rug pull indicators, active exploits
+- MEDIUM: Localized outages (some reports, not widespread), elevated complaint volume, unconfirmed but spreading rumors, isolated access issues, delayed transactions
+- LOW: Normal operations, routine individual complaints, minor bugs, promotional content, no systemic indicators
+
+CREDIBILITY WEIGHTING:
+- Verified accounts (especially business/government): HIGH weight
+- High-follower accounts (>100K): HIGH weight
+- High-engagement tweets (many RTs/likes): HIGH weight
+- New accounts or low engagement: LOW weight
+
+Respond in this exact JSON format:
+{{
+    "risk_level": "HIGH" | "MEDIUM" | "LOW",
+    "summary": "2-3 sentence assessment citing specific evidence",
+    "key_findings": ["Finding 1 with tweet evidence", "Finding 2"],
+    "top_concerning_tweets": [
+        {{"text": "tweet text (truncated)", "url": "full url", "engagement": "X RTs, Y likes", "why_concerning": "reason"}}
+    ],
+    "viral_indicators": "Assessment of spread velocity and influential users",
+    "confidence": 0.0-1.0,
+    "recommended_action": "Specific action recommendation"
+}}"""
+
+
+# System prompts only vary by institution type, so the message dicts are
+# built once at import time and shared by every request
+_SENTIMENT_SYSTEM_MESSAGES = {
+    inst_type.value: {"role": "system", "content": _render_sentiment_system_prompt(inst_type)}
+    for inst_type in InstitutionType
+}
+
+# Institution type labels as they appear in prompts ("Crypto Exchange" /
+# "crypto exchange"), rendered once
+_TYPE_PRETTY = {t.value: t.value.replace("_", " ").title() for t in InstitutionType}
+_TYPE_SPACED = {t.value: t.value.replace("_", " ") for t in InstitutionType}
+
+# Keyword lists as they appear in the per-request user prompts, joined once
+_RISK_KEYWORDS_JOINED_8 = {
+    inst_type.value: ", ".join(INSTITUTION_RISK_KEYWORDS.get(inst_type, [])[:8])
+    for inst_type in InstitutionType
+}
+_RISK_KEYWORDS_JOINED_6 = {
+    inst_type.value: ", ".join(INSTITUTION_RISK_KEYWORDS.get(inst_type, [])[:6])
+    for inst_type in InstitutionType
+}
+
+_SINGLE_TWEET_SYSTEM_PROMPT = """You are a financial risk analyst. Analyze this single tweet about a financial institution for risk indicators.
+
+Respond in JSON format:
+{
+    "risk_level": "HIGH" | "MEDIUM" | "LOW",
+    "risk_type": "crisis" | "complaint" | "concern" | "positive" | "neutral",
+    "summary": "Brief 1-sentence assessment",
+    "urgency": 1-10,
+    "action_needed": true | false
+}"""
+_SINGLE_TWEET_SYSTEM_MESSAGE = {"role": "system", "content": _SINGLE_TWEET_SYSTEM_PROMPT}
+
+# Leading "risk_level" field of a (possibly partial) streamed analysis
+_RISK_LEVEL_RE = re.compile(r'"risk_level"\s*:\s*"(HIGH|MEDIUM|LOW)"')
+
+# One tweet entry in the prompt built by GrokClient._format_tweets_for_analysis.
+# Positional %-formatting: fields are filled straight from a tuple, with no
+# per-row dict construction or named-field lookups.
+_TWEET_ANALYSIS_TEMPLATE = (
+    '%d. @%s %s (%s followers) '
+    '[%d RTs, %d likes, %d replies] [Credibility: %.0f]\n'
+    '   URL: %s\n'
+    '   "%s"'
+)
+
+# Prompt badge per verified_type; any other verified account gets "[VERIFIED]"
+_VERIFIED_BADGES = {"business": "[VERIFIED BUSINESS]", "government": "[VERIFIED GOV]"}
+
+# Analyses keyed by (model, institution, tweet-id set); repeat polls over an
+# unchanged tweet set within the TTL skip the Grok round-trip entirely
+_SENTIMENT_CACHE = TTLCache(maxsize=512, ttl=300)
+
+# Single-tweet analyses keyed by (model, institution, tweet text digest); the
+# stream re-sees the same text via retweets, re-polls and reconnect backfill
+_SINGLE_TWEET_CACHE = TTLCache(maxsize=4096, ttl=3600)
+
+# Output budget of one sentiment analysis (max_tokens on the request)
+SENTIMENT_MAX_TOKENS = 1500
+
+# Account-wide Grok token budget; async analyses reserve their estimated
+# prompt + completion tokens here before being sent
+GROK_TOKENS_PER_MINUTE = int(os.getenv("GROK_TOKENS_PER_MINUTE", "2000000"))
+GROK_TOKEN_BUCKET = TokenBucket(rate=GROK_TOKENS_PER_MINUTE / 60, capacity=GROK_TOKENS_PER_MINUTE)
+
+# Attempts per Grok request when the API answers 429
+GROK_MAX_ATTEMPTS = 4
+
+# Shared by async Grok requests; opens after repeated failures so a sweep
+# stops hammering an unhealthy API
+GROK_ASYNC_BREAKER = AsyncCircuitBreaker(failure_threshold=5, recovery_timeout=60)
+
+
+@with_retry_async(
+    max_attempts=GROK_MAX_ATTEMPTS,
+    exceptions=(RateLimitError,),
+    endpoint="grok",
+    breaker=GROK_ASYNC_BREAKER
+)
+async def _send_grok_request_async(request: Callable, **kwargs) -> Any:
+    """Await one Grok SDK call; pacing, 429 retries and the breaker come from the decorator."""
+    return await request(**kwargs)
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the output cap."""
+    return sum(len(m["content"]) for m in messages) // 4 + max_tokens
+
+
+def _no_tweets_analysis(bank_name: str, inst_type: str) -> Dict[str, Any]:
+    """Analysis returned when there are no tweets to send to Grok."""
+    return {
+        "risk_level": "LOW",
+        "summary": f"No recent tweets found mentioning {bank_name}.",
+        "key_findings": [],
+        "tweet_count": 0,
+        "top_tweets": [],
+        "viral_score": 0,
+        "trend_analysis": "No data available",
+        "institution_type": inst_type
+    }
+
+
 class GrokClient:
     """
     Enhanced Grok API client for sophisticated financial risk analysis.
@@ -1179,10 +2687,13 @@ class GrokClient:
         if not self.api_key:
             raise ValueError("XAI_API_KEY is required for Grok API access")
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url="https://api.x.ai/v1"
-        )
+        # Shared process-wide so HTTP connections are reused across requests
+        self.client = _get_grok_client(self.api_key)
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """Async client for the running event loop (used by the *_async methods)."""
+        return _get_grok_async_client(self.api_key)
 
     def analyze_sentiment(
         self,
@@ -1201,37 +2712,229 @@ class GrokClient:
         Returns:
             Comprehensive analysis with traceability and institution type context
         """
+        prepared = self._prepare_sentiment_request(bank_name, tweet_data)
+        if "result" in prepared:
+            return prepared["result"]
+
+        cache_key = self._sentiment_cache_key(bank_name, prepared["tweets"], prepared["trend_data"], model)
+        cached = _SENTIMENT_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        try:
+            response = self.client.chat.completions.parse(
+                model=model,
+                messages=prepared["messages"],
+                temperature=0.2,  # Lower for more consistent analysis
+                max_tokens=SENTIMENT_MAX_TOKENS,
+                response_format=SentimentResult
+            )
+            result = self._finalize_sentiment(prepared, _parsed_message_dict(response.choices[0].message), model)
+            _SENTIMENT_CACHE.set(cache_key, copy.deepcopy(result))
+            return result
+
+        except Exception as e:
+            return self._sentiment_error(prepared, e)
+
+    async def analyze_sentiment_async(
+        self,
+        bank_name: str,
+        tweet_data: Dict[str, Any],
+        model: str = "grok-4-1-fast",
+        risk_level_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async variant of analyze_sentiment() using the AsyncOpenAI client.
+
+        Args:
+            bank_name: Institution being analyzed
+            tweet_data: Rich data from XAPIClient.get_institution_mentions()
+            model: Grok model to use
+            risk_level_only: Stream the reply and stop as soon as a LOW/MEDIUM
+                risk level is known (HIGH still returns the full analysis)
+
+        Returns:
+            Same structure as analyze_sentiment(); early-terminated results
+            carry only the risk level and aggregate metrics
+        """
+        prepared = self._prepare_sentiment_request(bank_name, tweet_data)
+        if "result" in prepared:
+            return prepared["result"]
+
+        cache_key = self._sentiment_cache_key(bank_name, prepared["tweets"], prepared["trend_data"], model)
+        cached = _SENTIMENT_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        if risk_level_only:
+            return await self._stream_risk_level(prepared, cache_key, model)
+
+        try:
+            response = await self._create_completion_async(
+                parse=True,
+                model=model,
+                messages=prepared["messages"],
+                temperature=0.2,
+                max_tokens=SENTIMENT_MAX_TOKENS,
+                response_format=SentimentResult
+            )
+            result = self._finalize_sentiment(prepared, _parsed_message_dict(response.choices[0].message), model)
+            _SENTIMENT_CACHE.set(cache_key, copy.deepcopy(result))
+            return result
+
+        except Exception as e:
+            return self._sentiment_error(prepared, e)
+
+    async def analyze_many(
+        self,
+        jobs: List[Tuple[str, Dict[str, Any]]],
+        model: str = "grok-4-1-fast",
+        max_concurrent_requests: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many institutions concurrently over the shared async client.
+
+        At most `max_concurrent_requests` analyses are in flight at once, every
+        request is admitted through the account-wide token-per-minute budget,
+        and 429s are retried per item (see _create_completion_async), so a
+        20-bank sweep costs roughly one round-trip instead of twenty.
+
+        Args:
+            jobs: (bank_name, tweet_data) pairs, tweet_data as returned by
+                XAPIClient.get_institution_mentions()
+            model: Grok model to use
+            max_concurrent_requests: Cap on simultaneous Grok requests
+
+        Returns:
+            One analyze_sentiment_async() result per job, in submission order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        async def run(bank_name: str, tweet_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.analyze_sentiment_async(bank_name, tweet_data, model)
+
+        return list(await asyncio.gather(*(run(bank, data) for bank, data in jobs)))
+
+    async def _create_completion_async(self, parse: bool = False, **kwargs) -> Any:
+        """
+        chat.completions.create() gated by the token budget, retrying on 429.
+
+        Waits for Retry-After (via RATE_LIMITER) when the API sends one and
+        fails fast while GROK_ASYNC_BREAKER is open. With parse=True the
+        structured-output parse() endpoint is used instead.
+        """
+        completions = self.aclient.chat.completions
+        request = completions.parse if parse else completions.create
+        await GROK_TOKEN_BUCKET.acquire_async(
+            _estimate_tokens(kwargs["messages"], kwargs.get("max_tokens", 0))
+        )
+        return await _send_grok_request_async(request, **kwargs)
+
+    async def _stream_risk_level(self, prepared: Dict[str, Any], cache_key: str, model: str) -> Dict[str, Any]:
+        """
+        Stream the analysis and return early once a LOW/MEDIUM level is parseable.
+
+        The JSON reply leads with "risk_level", so the common LOW case is known
+        after the first few tokens. HIGH keeps streaming to a full analysis
+        because alerting needs the summary and evidence.
+        """
+        try:
+            stream = await self._create_completion_async(
+                model=model,
+                messages=prepared["messages"],
+                temperature=0.2,
+                max_tokens=SENTIMENT_MAX_TOKENS,
+                response_format={"type": "json_object"},
+                stream=True
+            )
+
+            chunks: List[str] = []
+            risk_level = None
+            # Running copy of the reply until the level is known; each delta
+            # only searches the new tail (plus room for a key split across
+            # deltas), then only from the key onward once it has been seen
+            head = ""
+            search_from = 0
+            key_pos = -1
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+
+                if risk_level is None:
+                    head += delta
+                    if key_pos < 0:
+                        key_pos = head.find('"risk_level"', search_from)
+                        search_from = max(0, len(head) - len('"risk_level"'))
+                    match = _RISK_LEVEL_RE.match(head, key_pos) if key_pos >= 0 else None
+                    if match:
+                        risk_level = match.group(1)
+                        if risk_level != "HIGH":
+                            await stream.close()
+                            return {
+                                "risk_level": risk_level,
+                                "tweet_count": len(prepared["tweets"]),
+                                "model_used": model,
+                                "viral_score": round(prepared["viral_score"], 1),
+                                "verified_sources": prepared["verified_tweet_count"],
+                                "institution_type": prepared["inst_type"],
+                                "early_terminated": True
+                            }
+
+            result = self._finalize_sentiment(prepared, orjson.loads("".join(chunks)), model)
+            _SENTIMENT_CACHE.set(cache_key, copy.deepcopy(result))
+            return result
+
+        except Exception as e:
+            return self._sentiment_error(prepared, e)
+
+    @staticmethod
+    def _sentiment_cache_key(bank_name: str, tweets: List[Dict], trend_data: Optional[Dict], model: str) -> str:
+        """
+        Fingerprint an analysis request by model, institution, tweet set and trend.
+
+        The trend part holds exactly the volume figures the prompt shows, so
+        a new spike over the same tweets is analyzed afresh.
+        """
+        tweet_ids = ",".join(sorted(str(t.get("id")) for t in tweets))
+        trend = ""
+        if trend_data and not trend_data.get("error"):
+            trend = (
+                f"{trend_data.get('total_count', 'N/A')}"
+                f"|{trend_data.get('velocity_change_percent', 0):+.1f}"
+                f"|{bool(trend_data.get('is_spiking', False))}"
+            )
+        return hashlib.blake2b(
+            f"{model}|{bank_name}|{tweet_ids}|{trend}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _prepare_sentiment_request(self, bank_name: str, tweet_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build prompts and aggregate metrics shared by the sync and async paths.
+
+        Returns:
+            Prepared request state, or {"result": ...} when there is nothing to analyze
+        """
         tweets = tweet_data.get("tweets", [])
         trend_data = tweet_data.get("trend_data", {})
 
         # Get institution-specific context
-        inst_context = get_institution_context(bank_name)
+        inst_context = _cached_institution_context(bank_name)
         inst_type = inst_context["institution_type"]
-        type_specific_prompt = inst_context["prompt_section"]
         type_specific_keywords = inst_context["risk_keywords"]
 
         if not tweets:
-            return {
-                "risk_level": "LOW",
-                "summary": f"No recent tweets found mentioning {bank_name}.",
-                "key_findings": [],
-                "tweet_count": 0,
-                "top_tweets": [],
-                "viral_score": 0,
-                "trend_analysis": "No data available",
-                "institution_type": inst_type
-            }
+            return {"result": _no_tweets_analysis(bank_name, inst_type)}
 
         # Calculate aggregate metrics for intelligence
-        total_engagement = sum(t.get("engagement_score", 0) for t in tweets)
-        verified_tweet_count = sum(1 for t in tweets if t.get("author_verified"))
-        avg_credibility = sum(t.get("credibility_score", 0) for t in tweets) / len(tweets)
-
-        # Viral risk score (0-100)
-        viral_score = min(100, (total_engagement / len(tweets)) * (1 + verified_tweet_count / 10))
+        total_engagement, verified_tweet_count, avg_credibility, viral_score = _tweet_aggregates(tweets)
 
         # Format tweets for Grok with URLs
-        tweets_text = self._format_tweets_for_analysis(tweets[:40])
+        tweets_text = self._format_tweets_for_analysis(tweets, max_tweets=40)
 
         # Include trend context
         trend_context = ""
@@ -1245,52 +2948,14 @@ TWEET VOLUME TREND (last 24 hours):
 - {"SPIKING - Unusual volume increase detected!" if is_spiking else "Normal volume patterns"}
 """
 
-        # Build institution-type-specific system prompt
-        system_prompt = f"""You are an elite financial risk analyst specializing in real-time monitoring of financial institutions via social media signals.
-
-{type_specific_prompt}
-
-TYPE-SPECIFIC KEYWORDS TO WATCH: {', '.join(type_specific_keywords[:10])}
-
-Your analysis must be:
-1. GROUNDED - Only cite information from the provided tweets
-2. TRACEABLE - Reference specific tweets by their URL when making claims
-3. QUANTITATIVE - Include engagement metrics to support severity assessment
-4. ACTIONABLE - Provide clear risk level with justification
-5. TYPE-AWARE - Apply the institution-type-specific risk signals above
-
-RISK LEVELS:
-- HIGH: Platform-wide outages (multiple verified reports), withdrawal freezes confirmed, hack/breach with evidence, regulatory action announced, bank run signals, rug pull indicators, active exploits
-- MEDIUM: Localized outages (some reports, not widespread), elevated complaint volume, unconfirmed but spreading rumors, isolated access issues, delayed transactions
-- LOW: Normal operations, routine individual complaints, minor bugs, promotional content, no systemic indicators
-
-CREDIBILITY WEIGHTING:
-- Verified accounts (especially business/government): HIGH weight
-- High-follower accounts (>100K): HIGH weight
-- High-engagement tweets (many RTs/likes): HIGH weight
-- New accounts or low engagement: LOW weight
-
-Respond in this exact JSON format:
-{{
-    "risk_level": "HIGH" | "MEDIUM" | "LOW",
-    "summary": "2-3 sentence assessment citing specific evidence",
-    "key_findings": ["Finding 1 with tweet evidence", "Finding 2"],
-    "top_concerning_tweets": [
-        {{"text": "tweet text (truncated)", "url": "full url", "engagement": "X RTs, Y likes", "why_concerning": "reason"}}
-    ],
-    "viral_indicators": "Assessment of spread velocity and influential users",
-    "confidence": 0.0-1.0,
-    "recommended_action": "Specific action recommendation"
-}}"""
-
-        user_prompt = f"""Analyze these tweets about {bank_name} ({inst_type.replace('_', ' ').title()}) for financial risk indicators:
+        user_prompt = f"""Analyze these tweets about {bank_name} ({_TYPE_PRETTY[inst_type]}) for financial risk indicators:
 
 {trend_context}
 
 INSTITUTION CONTEXT:
 - Name: {bank_name}
-- Type: {inst_type.replace('_', ' ').title()}
-- Type-specific risk keywords: {', '.join(type_specific_keywords[:8])}
+- Type: {_TYPE_PRETTY[inst_type]}
+- Type-specific risk keywords: {_RISK_KEYWORDS_JOINED_8[inst_type]}
 
 AGGREGATE METRICS:
 - Tweets analyzed: {len(tweets)}
@@ -1303,55 +2968,66 @@ TWEETS (sorted by credibility, includes direct URLs):
 
 {tweets_text}
 
-Provide your risk assessment applying {inst_type.replace('_', ' ')} analysis context. Remember to cite specific tweet URLs in your findings."""
+Provide your risk assessment applying {_TYPE_SPACED[inst_type]} analysis context. Remember to cite specific tweet URLs in your findings."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,  # Lower for more consistent analysis
-                max_tokens=1500,
-                response_format={"type": "json_object"}
-            )
+        return {
+            "messages": [
+                _SENTIMENT_SYSTEM_MESSAGES[inst_type],
+                {"role": "user", "content": user_prompt}
+            ],
+            "tweets": tweets,
+            "trend_data": trend_data,
+            "inst_type": inst_type,
+            "type_specific_keywords": type_specific_keywords,
+            "viral_score": viral_score,
+            "verified_tweet_count": verified_tweet_count,
+        }
 
-            result = json.loads(response.choices[0].message.content)
+    def _finalize_sentiment(self, prepared: Dict[str, Any], result: Dict[str, Any], model: str) -> Dict[str, Any]:
+        """Enrich Grok's decoded analysis with metadata for the frontend."""
+        tweets = prepared["tweets"]
+        trend_data = prepared["trend_data"]
 
-            # Enrich with metadata including institution type
-            result["tweet_count"] = len(tweets)
-            result["model_used"] = model
-            result["viral_score"] = round(viral_score, 1)
-            result["verified_sources"] = verified_tweet_count
-            result["trend_velocity"] = trend_data.get("velocity_change_percent", 0) if trend_data else 0
-            result["is_trending_up"] = trend_data.get("is_spiking", False) if trend_data else False
-            result["institution_type"] = inst_type
-            result["type_specific_keywords_checked"] = type_specific_keywords[:5]
-
-            # Add top 3 tweets for frontend display
-            result["evidence_tweets"] = [
-                {
-                    "text": t.get("text", "")[:200],
-                    "url": t.get("url"),
-                    "author": f"@{t.get('author_username')}",
-                    "verified": t.get("author_verified"),
-                    "engagement": f"{t.get('retweets', 0)} RTs, {t.get('likes', 0)} likes"
-                }
-                for t in tweets[:3]
-            ]
+        # Enrich with metadata including institution type
+        result["tweet_count"] = len(tweets)
+        result["model_used"] = model
+        result["viral_score"] = round(prepared["viral_score"], 1)
+        result["verified_sources"] = prepared["verified_tweet_count"]
+        result["trend_velocity"] = trend_data.get("velocity_change_percent", 0) if trend_data else 0
+        result["is_trending_up"] = trend_data.get("is_spiking", False) if trend_data else False
+        result["institution_type"] = prepared["inst_type"]
+        result["type_specific_keywords_checked"] = prepared["type_specific_keywords"][:5]
 
-            return result
+        # Add top 3 tweets for frontend display
+        result["evidence_tweets"] = self._evidence_tweets(tweets[:3])
 
-        except Exception as e:
-            return {
-                "risk_level": "UNKNOWN",
-                "summary": f"Error during analysis: {str(e)}",
-                "key_findings": [],
-                "tweet_count": len(tweets),
-                "viral_score": round(viral_score, 1),
-                "error": str(e)
-            }
+        return result
+
+    @staticmethod
+    def _evidence_tweets(tweets: List[Dict]) -> List[Dict[str, Any]]:
+        """Compact tweet summaries shown as evidence alongside an analysis."""
+        evidence = []
+        for t in tweets:
+            get = t.get
+            evidence.append({
+                "text": (get("text") or "")[:200],
+                "url": get("url"),
+                "author": f"@{get('author_username')}",
+                "verified": get("author_verified"),
+                "engagement": f"{get('retweets', 0)} RTs, {get('likes', 0)} likes"
+            })
+        return evidence
+
+    def _sentiment_error(self, prepared: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Build the UNKNOWN result returned when the Grok call fails."""
+        return {
+            "risk_level": "UNKNOWN",
+            "summary": f"Error during analysis: {str(error)}",
+            "key_findings": [],
+            "tweet_count": len(prepared["tweets"]),
+            "viral_score": round(prepared["viral_score"], 1),
+            "error": str(error)
+        }
 
     def analyze_single_tweet(
         self,
@@ -1374,96 +3050,213 @@ Provide your risk assessment applying {inst_type.replace('_', ' ')} analysis con
         """
         total_engagement = sum(metrics.values())
 
-        system_prompt = """You are a financial risk analyst. Analyze this single tweet about a financial institution for risk indicators.
+        cache_key = self._single_tweet_cache_key(institution, tweet_text, model)
+        cached = _SINGLE_TWEET_CACHE.get(cache_key)
+        if cached is not None:
+            return self._stamp_single_tweet(copy.deepcopy(cached), total_engagement)
+
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=self._single_tweet_messages(institution, tweet_text, metrics, total_engagement),
+                temperature=0.1,
+                max_tokens=200,
+                response_format={"type": "json_object"}
+            )
+            return self._finalize_single_tweet(response, institution, total_engagement, cache_key)
+
+        except Exception as e:
+            return self._single_tweet_error(e)
+
+    async def analyze_single_tweet_async(
+        self,
+        institution: str,
+        tweet_text: str,
+        metrics: Dict[str, int],
+        model: str = "grok-3-fast"
+    ) -> Dict[str, Any]:
+        """
+        Async variant of analyze_single_tweet() for the stream monitor's event loop.
+
+        Goes through _create_completion_async, so it shares the token budget,
+        429 handling and breaker with the other async Grok calls.
+        """
+        total_engagement = sum(metrics.values())
+
+        cache_key = self._single_tweet_cache_key(institution, tweet_text, model)
+        cached = _SINGLE_TWEET_CACHE.get(cache_key)
+        if cached is not None:
+            return self._stamp_single_tweet(copy.deepcopy(cached), total_engagement)
+
+        try:
+            response = await self._create_completion_async(
+                model=model,
+                messages=self._single_tweet_messages(institution, tweet_text, metrics, total_engagement),
+                temperature=0.1,
+                max_tokens=200,
+                response_format={"type": "json_object"}
+            )
+            return self._finalize_single_tweet(response, institution, total_engagement, cache_key)
+
+        except Exception as e:
+            return self._single_tweet_error(e)
+
+    def _single_tweet_messages(
+        self,
+        institution: str,
+        tweet_text: str,
+        metrics: Dict[str, int],
+        total_engagement: int
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a single-tweet analysis."""
+        user_prompt = f"""Analyze this tweet about {institution}:
+
+"{tweet_text}"
+
+Engagement metrics:
+- Retweets: {metrics.get('retweet_count', 0)}
+- Replies: {metrics.get('reply_count', 0)}
+- Likes: {metrics.get('like_count', 0)}
+- Quotes: {metrics.get('quote_count', 0)}
+- Total engagement: {total_engagement}
+
+Assess the risk level considering both content and virality potential."""
+
+        return [
+            _SINGLE_TWEET_SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt}
+        ]
+
+    @staticmethod
+    def _single_tweet_cache_key(institution: str, tweet_text: str, model: str) -> tuple:
+        """Key a single-tweet analysis by model, institution and text digest."""
+        return (model, institution, hashlib.blake2b(tweet_text.encode(), digest_size=16).digest())
+
+    def _finalize_single_tweet(
+        self,
+        response: Any,
+        institution: str,
+        total_engagement: int,
+        cache_key: tuple
+    ) -> Dict[str, Any]:
+        """Decode a single-tweet completion, cache it and attach the tracking fields."""
+        result = orjson.loads(response.choices[0].message.content)
+        result["institution"] = institution
+        _SINGLE_TWEET_CACHE.set(cache_key, copy.deepcopy(result))
+        return self._stamp_single_tweet(result, total_engagement)
+
+    @staticmethod
+    def _stamp_single_tweet(result: Dict[str, Any], total_engagement: int) -> Dict[str, Any]:
+        """Attach the per-call fields (current engagement, analysis time); never cached."""
+        result["engagement"] = total_engagement
+        result["analyzed_at"] = datetime.now(timezone.utc).isoformat()
+        return result
+
+    def _single_tweet_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the UNKNOWN result returned when a single-tweet analysis fails."""
+        return {
+            "risk_level": "UNKNOWN",
+            "risk_type": "error",
+            "summary": f"Analysis failed: {str(error)}",
+            "urgency": 0,
+            "action_needed": False,
+            "error": str(error)
+        }
+
+    def _format_tweets_for_analysis(self, tweets: List[Dict], max_tweets: int = 40) -> str:
+        """Format tweets with full context for Grok analysis."""
+        batch = TweetBatch.from_tweets(_top_k_by_credibility(tweets, max_tweets))
+
+        template = _TWEET_ANALYSIS_TEMPLATE
+        formatted = [None] * len(batch)
+        rows = zip(
+            batch.usernames, batch.verified, batch.verified_types, batch.follower_strs,
+            batch.retweets, batch.likes, batch.replies, batch.credibility,
+            batch.urls, batch.texts
+        )
+        for i, (username, verified, vtype, followers, retweets, likes, replies,
+                credibility, url, text) in enumerate(rows):
+            verified_badge = _VERIFIED_BADGES.get(vtype, "[VERIFIED]") if verified else ""
+            formatted[i] = template % (
+                i + 1, username, verified_badge, followers,
+                retweets, likes, replies, credibility, url, text
+            )
+
+        return "\n\n".join(formatted)
+
+
+# =============================================================================
+# Grok Analysis Client - xai_sdk (Responses API + Server-Side Tools)
+# =============================================================================
+
+def _render_x_search_system_prompt(inst_type: InstitutionType) -> str:
+    """Render the analyze_with_x_search system prompt for one institution type."""
+    type_specific_prompt = INSTITUTION_PROMPT_SECTIONS.get(inst_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN])
+
+    return f"""You are an elite financial risk analyst with real-time X (Twitter) search capabilities.
+
+{type_specific_prompt}
+
+TYPE-SPECIFIC KEYWORDS: {_RISK_KEYWORDS_JOINED_8[inst_type.value]}
+
+IMPORTANT INSTRUCTIONS:
+1. Use x_search to find recent posts about the institution
+2. Search for risk-related keywords specific to this institution type
+3. Analyze the sentiment and urgency of findings
+4. Include post URLs in your findings for traceability
+5. Provide a risk assessment: HIGH, MEDIUM, or LOW
+
+RISK LEVELS:
+- HIGH: Platform outages, withdrawal freezes, hacks, regulatory action, bank run signals
+- MEDIUM: Localized issues, elevated complaints, unconfirmed rumors
+- LOW: Normal operations, routine complaints, no systemic issues
 
-Respond in JSON format:
-{
+Respond with structured JSON:
+{{
     "risk_level": "HIGH" | "MEDIUM" | "LOW",
-    "risk_type": "crisis" | "complaint" | "concern" | "positive" | "neutral",
-    "summary": "Brief 1-sentence assessment",
-    "urgency": 1-10,
-    "action_needed": true | false
-}"""
+    "summary": "2-3 sentence assessment",
+    "key_findings": ["Finding with evidence"],
+    "evidence_posts": [{{"text": "post text", "url": "post url", "author": "@username"}}],
+    "search_queries_used": ["query1", "query2"],
+    "confidence": 0.0-1.0,
+    "recommended_action": "action if any"
+}}"""
 
-        user_prompt = f"""Analyze this tweet about {institution}:
 
-"{tweet_text}"
+# x_search system prompts carry no per-request data (the institution name
+# lives in the user message), so they are rendered once per type
+_X_SEARCH_SYSTEM_PROMPTS = {
+    inst_type.value: _render_x_search_system_prompt(inst_type)
+    for inst_type in InstitutionType
+}
+_X_SEARCH_STREAMING_SYSTEM_PROMPTS = {
+    inst_type.value: "You are a financial risk analyst. " + INSTITUTION_PROMPT_SECTIONS.get(
+        inst_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN]
+    )
+    for inst_type in InstitutionType
+}
 
-Engagement metrics:
-- Retweets: {metrics.get('retweet_count', 0)}
-- Replies: {metrics.get('reply_count', 0)}
-- Likes: {metrics.get('like_count', 0)}
-- Quotes: {metrics.get('quote_count', 0)}
-- Total engagement: {total_engagement}
 
-Assess the risk level considering both content and virality potential."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=200,
-                response_format={"type": "json_object"}
-            )
+# Responses API keeps stored conversations for 30 days
+XAI_SESSION_TTL_SECONDS = 30 * 24 * 3600
 
-            result = json.loads(response.choices[0].message.content)
-            result["institution"] = institution
-            result["engagement"] = total_engagement
-            result["analyzed_at"] = datetime.now(timezone.utc).isoformat()
-            return result
 
-        except Exception as e:
-            return {
-                "risk_level": "UNKNOWN",
-                "risk_type": "error",
-                "summary": f"Analysis failed: {str(e)}",
-                "urgency": 0,
-                "action_needed": False,
-                "error": str(e)
-            }
+@lru_cache(maxsize=None)
+def _x_search_tool() -> Any:
+    """The x_search tool descriptor; identical for every request, so built once."""
+    return x_search()
 
-    def _format_tweets_for_analysis(self, tweets: List[Dict], max_tweets: int = 40) -> str:
-        """Format tweets with full context for Grok analysis."""
-        sorted_tweets = sorted(
-            tweets,
-            key=lambda t: t.get("credibility_score", 0),
-            reverse=True
-        )[:max_tweets]
-
-        formatted = []
-        for i, tweet in enumerate(sorted_tweets, 1):
-            verified_badge = ""
-            if tweet.get("author_verified"):
-                vtype = tweet.get("author_verified_type", "")
-                if vtype == "business":
-                    verified_badge = "[VERIFIED BUSINESS]"
-                elif vtype == "government":
-                    verified_badge = "[VERIFIED GOV]"
-                else:
-                    verified_badge = "[VERIFIED]"
-
-            followers = tweet.get("author_followers", 0)
-            engagement = f"[{tweet.get('retweets', 0)} RTs, {tweet.get('likes', 0)} likes, {tweet.get('replies', 0)} replies]"
-            credibility = f"[Credibility: {tweet.get('credibility_score', 0):.0f}]"
-            url = tweet.get("url", "")
-
-            formatted.append(
-                f"{i}. @{tweet.get('author_username')} {verified_badge} "
-                f"({followers:,} followers) {engagement} {credibility}\n"
-                f"   URL: {url}\n"
-                f"   \"{tweet.get('text', '')[:300]}\""
-            )
 
-        return "\n\n".join(formatted)
+# Analyses kept per institution for get_risk_trend()
+RISK_HISTORY_MAXLEN = 32
 
+# tool_calls entries kept per x_search analysis; beyond this they are noise
+MAX_RECORDED_TOOL_CALLS = 32
+
+# Ordering of risk levels when comparing consecutive analyses
+_RISK_VALUES = MappingProxyType({"HIGH": 3, "MEDIUM": 2, "LOW": 1, "UNKNOWN": 0})
 
-# =============================================================================
-# Grok Analysis Client - xai_sdk (Responses API + Server-Side Tools)
-# =============================================================================
 
 class GrokAnalysisClient:
     """
@@ -1483,25 +3276,36 @@ class GrokAnalysisClient:
         if not self.api_key:
             raise ValueError("XAI_API_KEY is required for xai_sdk")
 
-        # Lazy import xai_sdk (may not be installed)
-        try:
-            from xai_sdk import Client as XAISDKClient
-            self.client = XAISDKClient(api_key=self.api_key)
-            self.sdk_available = True
-        except ImportError:
-            self.sdk_available = False
-            self.client = None
+        # xai_sdk may not be installed (see XAI_SDK_AVAILABLE)
+        self.sdk_available = XAI_SDK_AVAILABLE
+        self.client = XAISDKClient(api_key=self.api_key) if XAI_SDK_AVAILABLE else None
 
-        # Session storage: institution -> response_id
-        self.sessions: Dict[str, str] = {}
+        # xai_sdk AsyncClient per event loop (its gRPC channel is loop-bound)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
 
-        # Analysis history for delta tracking
-        self.analysis_history: Dict[str, List[Dict]] = {}
+        # Session storage: institution -> response_id, dropped once the
+        # Responses API would no longer honour it as previous_response_id
+        self.sessions = TTLCache(maxsize=1024, ttl=XAI_SESSION_TTL_SECONDS)
+
+        # Analysis history for delta tracking (most recent records only)
+        self.analysis_history: Dict[str, deque] = {}
+        self._history_lock = threading.RLock()
 
     def is_available(self) -> bool:
         """Check if xai_sdk is available."""
         return self.sdk_available and self.client is not None
 
+    @property
+    def aclient(self) -> Any:
+        """xai_sdk AsyncClient for the running event loop (used by analyze_streaming)."""
+        loop = asyncio.get_running_loop()
+        for stale in [l for l in self._async_clients if l.is_closed()]:
+            del self._async_clients[stale]
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncXAISDKClient(api_key=self.api_key)
+        return client
+
     def get_session_id(self, institution: str) -> Optional[str]:
         """Get existing session ID for an institution."""
         return self.sessions.get(institution.lower())
@@ -1535,67 +3339,35 @@ class GrokAnalysisClient:
                 "fallback": "Use GrokClient instead"
             }
 
-        from xai_sdk.chat import user, system
-        from xai_sdk.tools import x_search
-
         # Get institution-specific context
-        inst_context = get_institution_context(institution)
+        inst_context = _cached_institution_context(institution)
         inst_type = inst_context["institution_type"]
-        type_specific_prompt = inst_context["prompt_section"]
         type_specific_keywords = inst_context["risk_keywords"]
 
         # Build chat configuration
         chat_kwargs = {
             "model": "grok-4-1-fast",  # Optimized for tool calling
-            "tools": [x_search()],
+            "tools": [_x_search_tool()],
             "store_messages": True  # Enable Responses API
         }
 
         # Continue previous session if available
         institution_key = institution.lower()
-        if continue_session and institution_key in self.sessions:
-            chat_kwargs["previous_response_id"] = self.sessions[institution_key]
+        previous_response_id = self.sessions.get(institution_key) if continue_session else None
+        if previous_response_id:
+            chat_kwargs["previous_response_id"] = previous_response_id
 
         try:
             chat = self.client.chat.create(**chat_kwargs)
 
-            # System prompt with institution-specific context
-            system_prompt = f"""You are an elite financial risk analyst with real-time X (Twitter) search capabilities.
-
-{type_specific_prompt}
-
-TYPE-SPECIFIC KEYWORDS: {', '.join(type_specific_keywords[:8])}
-
-IMPORTANT INSTRUCTIONS:
-1. Use x_search to find recent posts about the institution
-2. Search for risk-related keywords specific to this institution type
-3. Analyze the sentiment and urgency of findings
-4. Include post URLs in your findings for traceability
-5. Provide a risk assessment: HIGH, MEDIUM, or LOW
-
-RISK LEVELS:
-- HIGH: Platform outages, withdrawal freezes, hacks, regulatory action, bank run signals
-- MEDIUM: Localized issues, elevated complaints, unconfirmed rumors
-- LOW: Normal operations, routine complaints, no systemic issues
-
-Respond with structured JSON:
-{{
-    "risk_level": "HIGH" | "MEDIUM" | "LOW",
-    "summary": "2-3 sentence assessment",
-    "key_findings": ["Finding with evidence"],
-    "evidence_posts": [{{"text": "post text", "url": "post url", "author": "@username"}}],
-    "search_queries_used": ["query1", "query2"],
-    "confidence": 0.0-1.0,
-    "recommended_action": "action if any"
-}}"""
-
-            chat.append(system(system_prompt))
+            # Byte-identical per type so xAI's prompt-prefix cache can match
+            chat.append(xai_system(_X_SEARCH_SYSTEM_PROMPTS[inst_type]))
 
             # Build user prompt
             if additional_context:
-                user_prompt = f"Continue analyzing {institution} ({inst_type.replace('_', ' ').title()}). {additional_context}"
+                user_prompt = f"Continue analyzing {institution} ({_TYPE_PRETTY[inst_type]}). {additional_context}"
             else:
-                user_prompt = f"""Analyze {institution} ({inst_type.replace('_', ' ').title()}) for financial risk indicators.
+                user_prompt = f"""Analyze {institution} ({_TYPE_PRETTY[inst_type]}) for financial risk indicators.
 
 Search X for:
 1. "{institution}" + ({' OR '.join(type_specific_keywords[:4])})
@@ -1604,41 +3376,57 @@ Search X for:
 
 Provide your risk assessment with evidence from the posts you find."""
 
-            chat.append(user(user_prompt))
+            chat.append(xai_user(user_prompt))
 
             # Execute with streaming to capture tool calls
-            full_response = ""
+            response_parts: List[str] = []
             tool_calls_made = []
+            # A tool call can surface in several chunks; record each id once,
+            # and stop recording past the cap (later entries add nothing)
+            seen_tool_ids = set()
 
             for response, chunk in chat.stream():
-                if hasattr(chunk, 'tool_calls') and chunk.tool_calls:
-                    for tool_call in chunk.tool_calls:
+                tool_calls = getattr(chunk, 'tool_calls', None)
+                if tool_calls and len(tool_calls_made) < MAX_RECORDED_TOOL_CALLS:
+                    for tool_call in tool_calls:
+                        tool_id = getattr(tool_call, 'id', None)
+                        if tool_id:
+                            if tool_id in seen_tool_ids:
+                                continue
+                            seen_tool_ids.add(tool_id)
+                        function = getattr(tool_call, 'function', None)
                         tool_calls_made.append({
-                            "tool": tool_call.function.name if hasattr(tool_call, 'function') else str(tool_call),
+                            "tool": function.name if function is not None else str(tool_call),
                             "timestamp": datetime.now(timezone.utc).isoformat()
                         })
-                if hasattr(chunk, 'content') and chunk.content:
-                    full_response += chunk.content
+                        if len(tool_calls_made) >= MAX_RECORDED_TOOL_CALLS:
+                            break
+                content = getattr(chunk, 'content', None)
+                if content:
+                    response_parts.append(content)
 
             # Save session ID for continuation
             if hasattr(response, 'id') and response.id:
-                self.sessions[institution_key] = response.id
+                self.sessions.set(institution_key, response.id)
 
             # Try to parse as JSON
-            result = self._parse_response(full_response, institution, inst_type)
-            result["session_id"] = self.sessions.get(institution_key)
+            session_id = self.sessions.get(institution_key)
+            result = self._parse_response("".join(response_parts), institution, inst_type)
+            result["session_id"] = session_id
             result["tool_calls"] = tool_calls_made
             result["data_source"] = "xai_sdk (x_search server-side)"
-            result["continued_session"] = continue_session and institution_key in self.sessions
+            result["continued_session"] = continue_session and session_id is not None
 
             # Track in history
-            if institution_key not in self.analysis_history:
-                self.analysis_history[institution_key] = []
-            self.analysis_history[institution_key].append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "risk_level": result.get("risk_level"),
-                "session_id": result.get("session_id")
-            })
+            with self._history_lock:
+                history = self.analysis_history.get(institution_key)
+                if history is None:
+                    history = self.analysis_history[institution_key] = deque(maxlen=RISK_HISTORY_MAXLEN)
+                history.append({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "risk_level": result.get("risk_level"),
+                    "session_id": session_id
+                })
 
             return result
 
@@ -1650,14 +3438,17 @@ Provide your risk assessment with evidence from the posts you find."""
                 "institution_type": inst_type
             }
 
-    def analyze_streaming(
+    async def analyze_streaming(
         self,
         institution: str,
         callback: Optional[Callable[[str], None]] = None
-    ) -> Generator[Dict, None, None]:
+    ) -> AsyncGenerator[Dict, None]:
         """
         Stream analysis updates for real-time UI.
 
+        Runs on xai_sdk's AsyncClient, so concurrent streams interleave on one
+        event loop instead of each blocking it while waiting on its socket.
+
         Yields:
             Dict updates as analysis progresses
         """
@@ -1665,12 +3456,7 @@ Provide your risk assessment with evidence from the posts you find."""
             yield {"status": "error", "error": "xai_sdk not available"}
             return
 
-        from xai_sdk.chat import user, system
-        from xai_sdk.tools import x_search
-
-        inst_context = get_institution_context(institution)
-        inst_type = inst_context["institution_type"]
-        type_specific_prompt = inst_context["prompt_section"]
+        inst_type = _cached_institution_context(institution)["institution_type"]
 
         yield {
             "stage": "initializing",
@@ -1679,14 +3465,14 @@ Provide your risk assessment with evidence from the posts you find."""
         }
 
         try:
-            chat = self.client.chat.create(
+            chat = self.aclient.chat.create(
                 model="grok-4-1-fast",
-                tools=[x_search()],
+                tools=[_x_search_tool()],
                 store_messages=True
             )
 
-            chat.append(system(f"You are a financial risk analyst. {type_specific_prompt}"))
-            chat.append(user(f"Analyze {institution} for financial risk using x_search."))
+            chat.append(xai_system(_X_SEARCH_STREAMING_SYSTEM_PROMPTS[inst_type]))
+            chat.append(xai_user(f"Analyze {institution} for financial risk using x_search."))
 
             yield {
                 "stage": "searching",
@@ -1694,9 +3480,14 @@ Provide your risk assessment with evidence from the posts you find."""
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
-            content_buffer = ""
-            for response, chunk in chat.stream():
+            content_parts: List[str] = []
+            fields = _JSONFieldStream()
+            # Content chunks carry the time their "analyzing" stage began;
+            # stamped once per stage rather than once per token
+            analyzing_since = None
+            async for response, chunk in chat.stream():
                 if hasattr(chunk, 'tool_calls') and chunk.tool_calls:
+                    analyzing_since = None
                     yield {
                         "stage": "tool_call",
                         "message": "Executing x_search...",
@@ -1704,20 +3495,31 @@ Provide your risk assessment with evidence from the posts you find."""
                     }
 
                 if hasattr(chunk, 'content') and chunk.content:
-                    content_buffer += chunk.content
+                    content_parts.append(chunk.content)
                     if callback:
                         callback(chunk.content)
+                    if analyzing_since is None:
+                        analyzing_since = datetime.now(timezone.utc).isoformat()
                     yield {
                         "stage": "analyzing",
                         "chunk": chunk.content,
-                        "timestamp": datetime.now(timezone.utc).isoformat()
+                        "timestamp": analyzing_since
                     }
+                    # Surface each top-level field (risk_level, summary, ...)
+                    # the moment its value closes
+                    for key, value in fields.feed(chunk.content):
+                        yield {
+                            "stage": "partial",
+                            "field": key,
+                            "value": value,
+                            "timestamp": datetime.now(timezone.utc).isoformat()
+                        }
 
-            # Final result
-            result = self._parse_response(content_buffer, institution, inst_type)
+            # Final result; the field scan usually assembled it already
+            result = self._parse_response("".join(content_parts), institution, inst_type, parsed=fields.result)
 
             if hasattr(response, 'id') and response.id:
-                self.sessions[institution.lower()] = response.id
+                self.sessions.set(institution.lower(), response.id)
                 result["session_id"] = response.id
 
             yield {
@@ -1741,87 +3543,108 @@ Provide your risk assessment with evidence from the posts you find."""
             Trend data showing risk level changes over time
         """
         institution_key = institution.lower()
-        history = self.analysis_history.get(institution_key, [])
+        with self._history_lock:
+            history = self.analysis_history.get(institution_key, ())
+            analysis_count = len(history)
+            # Last 5 analyses; deque indexing near the ends is O(1)
+            recent = [history[i] for i in range(max(0, analysis_count - 5), analysis_count)]
 
-        if not history:
+        if not recent:
             return {"trend": "no_data", "history": []}
 
-        risk_values = {"HIGH": 3, "MEDIUM": 2, "LOW": 1, "UNKNOWN": 0}
-
-        risk_scores = [
-            risk_values.get(h.get("risk_level", "UNKNOWN"), 0)
-            for h in history
-        ]
-
-        if len(risk_scores) < 2:
+        # Only the two latest analyses decide the trend
+        if analysis_count < 2:
             trend = "insufficient_data"
-        elif risk_scores[-1] > risk_scores[-2]:
-            trend = "escalating"
-        elif risk_scores[-1] < risk_scores[-2]:
-            trend = "improving"
         else:
-            trend = "stable"
+            current = _RISK_VALUES.get(recent[-1].get("risk_level", "UNKNOWN"), 0)
+            previous = _RISK_VALUES.get(recent[-2].get("risk_level", "UNKNOWN"), 0)
+            if current > previous:
+                trend = "escalating"
+            elif current < previous:
+                trend = "improving"
+            else:
+                trend = "stable"
 
         return {
             "institution": institution,
             "trend": trend,
-            "current_risk": history[-1].get("risk_level") if history else None,
-            "analysis_count": len(history),
-            "history": history[-5:]  # Last 5 analyses
+            "current_risk": recent[-1].get("risk_level"),
+            "analysis_count": analysis_count,
+            "history": recent
         }
 
-    def _parse_response(self, content: str, institution: str, inst_type: str) -> Dict[str, Any]:
-        """Parse response content, attempting JSON extraction."""
-        import re
-
-        try:
-            # Try to extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                result = json.loads(json_match.group())
-                result["institution"] = institution
-                result["institution_type"] = inst_type
-                return result
-        except json.JSONDecodeError:
-            pass
+    def _parse_response(
+        self,
+        content: str,
+        institution: str,
+        inst_type: str,
+        parsed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Parse response content, attempting JSON extraction unless already parsed."""
+        result = parsed
+        if result is None and content:
+            result = _extract_json_object(content)
+        if result is not None:
+            result["institution"] = institution
+            result["institution_type"] = inst_type
+            return result
 
-        # Fallback to unstructured response
-        return {
+        # Fallback to unstructured response; the full text is only attached
+        # when the summary had to cut it short
+        if not content:
+            return {
+                "risk_level": "UNKNOWN",
+                "summary": "No response received",
+                "key_findings": [],
+                "institution": institution,
+                "institution_type": inst_type,
+                "raw_response": content
+            }
+        fallback = {
             "risk_level": "UNKNOWN",
-            "summary": content[:500] if content else "No response received",
+            "summary": content if len(content) <= 500 else content[:500],
             "key_findings": [],
             "institution": institution,
-            "institution_type": inst_type,
-            "raw_response": content
+            "institution_type": inst_type
         }
+        if len(content) > 500:
+            fallback["raw_response"] = content
+        return fallback
 
 
-# =============================================================================
-# Grok Live Search Fallback (When X API is rate limited)
-# =============================================================================
+_xai_client: Optional[GrokAnalysisClient] = None
+_xai_client_lock = threading.Lock()
 
-def _grok_live_search_analysis(bank_name: str) -> Dict[str, Any]:
+
+def _get_xai_client() -> GrokAnalysisClient:
     """
-    Fallback: Use Grok's live search capability when X API is rate limited.
-    Grok can search X/Twitter in real-time as part of its response.
-    Now includes institution-type-specific prompts.
+    Return the process-wide GrokAnalysisClient, created on first use.
+
+    Sessions and analysis history live on the instance, so sharing one is
+    what lets a follow-up (continue_analysis) or trend lookup find the
+    response id and history recorded by an earlier analysis.
     """
-    api_key = os.getenv("XAI_API_KEY")
-    if not api_key:
-        raise ValueError("XAI_API_KEY is required for Grok fallback")
+    global _xai_client
+    client = _xai_client
+    if client is None:
+        with _xai_client_lock:
+            client = _xai_client
+            if client is None:
+                client = _xai_client = GrokAnalysisClient()
+    return client
 
-    # Get institution-specific context
-    inst_context = get_institution_context(bank_name)
-    inst_type = inst_context["institution_type"]
-    type_specific_prompt = inst_context["prompt_section"]
-    type_specific_keywords = inst_context["risk_keywords"]
 
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://api.x.ai/v1"
-    )
+# =============================================================================
+# Grok Live Search Fallback (When X API is rate limited)
+# =============================================================================
 
-    system_prompt = f"""You are a financial risk analyst with real-time access to X (Twitter) data.
+def _render_live_search_system_prompt(institution_type: InstitutionType) -> str:
+    """Render the live-search system prompt for one institution type."""
+    type_specific_prompt = INSTITUTION_PROMPT_SECTIONS.get(institution_type, INSTITUTION_PROMPT_SECTIONS[InstitutionType.UNKNOWN])
+    type_specific_keywords = INSTITUTION_RISK_KEYWORDS.get(institution_type, [])
+    inst_type = institution_type.value
+
+    return f"""You are a financial risk analyst with real-time access to X (Twitter) data.
 
 IMPORTANT: You have live search enabled. Search X/Twitter for recent posts about the institution.
 
@@ -1846,10 +3669,24 @@ Return your analysis as JSON:
     "confidence": 0.0-1.0
 }}"""
 
-    user_prompt = f"""Search X/Twitter for recent posts about "{bank_name}" ({inst_type.replace('_', ' ').title()}) and analyze for financial risk indicators.
 
-Institution Type: {inst_type.replace('_', ' ').title()}
-Key risk signals for this type: {', '.join(type_specific_keywords[:6])}
+_LIVE_SEARCH_SYSTEM_MESSAGES = {
+    inst_type.value: {"role": "system", "content": _render_live_search_system_prompt(inst_type)}
+    for inst_type in InstitutionType
+}
+
+
+def _build_live_search_request(bank_name: str) -> tuple:
+    """Build (institution type, messages) for a Grok live-search analysis."""
+    # Get institution-specific context
+    inst_context = _cached_institution_context(bank_name)
+    inst_type = inst_context["institution_type"]
+    type_specific_keywords = inst_context["risk_keywords"]
+
+    user_prompt = f"""Search X/Twitter for recent posts about "{bank_name}" ({_TYPE_PRETTY[inst_type]}) and analyze for financial risk indicators.
+
+Institution Type: {_TYPE_PRETTY[inst_type]}
+Key risk signals for this type: {_RISK_KEYWORDS_JOINED_6[inst_type]}
 
 Look for:
 - {type_specific_keywords[0] if type_specific_keywords else 'Outage reports'}
@@ -1858,59 +3695,174 @@ Look for:
 - Customer complaints at unusual volume
 - Regulatory or legal news
 
-Provide your risk assessment applying {inst_type.replace('_', ' ')} context. Include post URLs when possible."""
+Provide your risk assessment applying {_TYPE_SPACED[inst_type]} context. Include post URLs when possible."""
+
+    return inst_type, [
+        _LIVE_SEARCH_SYSTEM_MESSAGES[inst_type],
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def _parse_live_search_content(message: Any, inst_type: str) -> Dict[str, Any]:
+    """
+    Return the structured live-search analysis, or the best effort from its text.
+
+    Replies without a parsed model (refusals, or a provider ignoring the
+    schema while live search is on) still get the brace scan before the raw
+    text is wrapped.
+    """
+    content = message.content or ""
+    if message.parsed is not None:
+        result = message.parsed.model_dump()
+    else:
+        result = _extract_json_object(content)
+    if result is not None:
+        result["data_source"] = "Grok Live Search (X API fallback)"
+        result["institution_type"] = inst_type
+        return result
+
+    return {
+        "risk_level": "UNKNOWN",
+        "summary": content if len(content) <= 500 else content[:500],
+        "key_findings": [],
+        "data_source": "Grok Live Search (X API fallback)",
+        "institution_type": inst_type,
+        "confidence": 0.5
+    }
+
+
+def _live_search_error(inst_type: str, error: Exception) -> Dict[str, Any]:
+    """Build the result returned when the live-search call fails."""
+    return {
+        "risk_level": "UNKNOWN",
+        "summary": f"Grok search error: {str(error)}",
+        "key_findings": [],
+        "data_source": "Grok Live Search (failed)",
+        "institution_type": inst_type,
+        "error": str(error)
+    }
+
+
+def _grok_live_search_analysis(bank_name: str) -> Dict[str, Any]:
+    """
+    Fallback: Use Grok's live search capability when X API is rate limited.
+    Grok can search X/Twitter in real-time as part of its response.
+    Now includes institution-type-specific prompts.
+    """
+    api_key = os.getenv("XAI_API_KEY")
+    if not api_key:
+        raise ValueError("XAI_API_KEY is required for Grok fallback")
+
+    inst_type, messages = _build_live_search_request(bank_name)
+
+    client = _get_grok_client(api_key)
 
     try:
-        response = client.chat.completions.create(
+        response = client.chat.completions.parse(
             model="grok-3-latest",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=messages,
             temperature=0.3,
             max_tokens=1500,
+            response_format=LiveSearchResult,
             extra_body={"search_parameters": {"mode": "auto"}}
         )
+        return _parse_live_search_content(response.choices[0].message, inst_type)
 
-        content = response.choices[0].message.content
+    except Exception as e:
+        return _live_search_error(inst_type, e)
 
-        # Try to parse as JSON
-        try:
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', content)
-            if json_match:
-                result = json.loads(json_match.group())
-                result["data_source"] = "Grok Live Search (X API fallback)"
-                result["institution_type"] = inst_type
-                return result
-        except json.JSONDecodeError:
-            pass
 
-        return {
-            "risk_level": "UNKNOWN",
-            "summary": content[:500],
-            "key_findings": [],
-            "data_source": "Grok Live Search (X API fallback)",
-            "institution_type": inst_type,
-            "confidence": 0.5
-        }
+async def _grok_live_search_analysis_async(bank_name: str) -> Dict[str, Any]:
+    """Async variant of _grok_live_search_analysis() using AsyncOpenAI."""
+    api_key = os.getenv("XAI_API_KEY")
+    if not api_key:
+        raise ValueError("XAI_API_KEY is required for Grok fallback")
+
+    inst_type, messages = _build_live_search_request(bank_name)
+
+    client = _get_grok_async_client(api_key)
+
+    try:
+        response = await client.chat.completions.parse(
+            model="grok-3-latest",
+            messages=messages,
+            temperature=0.3,
+            max_tokens=1500,
+            response_format=LiveSearchResult,
+            extra_body={"search_parameters": {"mode": "auto"}}
+        )
+        return _parse_live_search_content(response.choices[0].message, inst_type)
 
     except Exception as e:
-        return {
-            "risk_level": "UNKNOWN",
-            "summary": f"Grok search error: {str(e)}",
-            "key_findings": [],
-            "data_source": "Grok Live Search (failed)",
-            "institution_type": inst_type,
-            "error": str(e)
-        }
+        return _live_search_error(inst_type, e)
+
+
+# =============================================================================
+# Mention Activity Cache
+# =============================================================================
+
+# How long a zero-mention observation is trusted before X is queried again
+QUIET_BANK_TTL_SECONDS = 60
+
+# bank name (lowercase) -> (observed at, tweets found)
+_activity_cache: Dict[str, Tuple[float, int]] = {}
+_activity_lock = threading.Lock()
+
+
+def _record_activity(bank_name: str, tweet_count: int) -> None:
+    """Remember how many mentions the latest real fetch for bank_name found."""
+    with _activity_lock:
+        _activity_cache[bank_name.lower()] = (time.time(), tweet_count)
+
+
+def _recently_quiet(bank_name: str) -> bool:
+    """True if a fetch in the last QUIET_BANK_TTL_SECONDS found no mentions."""
+    entry = _activity_cache.get(bank_name.lower())
+    return (
+        entry is not None
+        and entry[1] == 0
+        and time.time() - entry[0] < QUIET_BANK_TTL_SECONDS
+    )
+
+
+def _quiet_bank_payload(bank_name: str, timestamp: str) -> Dict[str, Any]:
+    """Response payload answered from the activity cache without calling any API."""
+    inst_type = _cached_institution_context(bank_name)["institution_type"]
+    return {
+        "bank_name": bank_name,
+        "status": "success",
+        "timestamp": timestamp,
+        "data_source": "activity cache (no recent mentions)",
+        "sdk_used": "none",
+        "institution_type": inst_type,
+        "tweet_count": 0,
+        "analysis": _no_tweets_analysis(bank_name, inst_type)
+    }
+
+
+# Successful fetch_market_sentiment payloads, keyed by normalized bank name;
+# watchlist refreshes and repeat tool calls within the TTL skip every API
+SENTIMENT_RESPONSE_TTL_SECONDS = 60
+_sentiment_responses = TTLCache(maxsize=2048, ttl=SENTIMENT_RESPONSE_TTL_SECONDS)
+
+
+def _sentiment_response_key(bank_name: str) -> str:
+    """Normalize a bank name so "Chase", " chase " and "CHASE" share an entry."""
+    return " ".join(bank_name.lower().split())
+
+
+def _remember_sentiment(bank_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a successful sentiment payload and hand it back."""
+    if payload.get("status") == "success":
+        _sentiment_responses.set(_sentiment_response_key(bank_name), copy.deepcopy(payload))
+    return payload
 
 
 # =============================================================================
 # Combined Sentiment Tool (ADK Tool Function - Enhanced)
 # =============================================================================
 
-def fetch_market_sentiment(bank_name: str, use_xai_sdk: bool = False) -> str:
+def fetch_market_sentiment(bank_name: str, use_xai_sdk: bool = False, force_refresh: bool = False) -> str:
     """
     Fetch comprehensive real-time market sentiment for a financial institution.
 
@@ -1927,7 +3879,8 @@ def fetch_market_sentiment(bank_name: str, use_xai_sdk: bool = False) -> str:
 
     Args:
         bank_name: The name of the institution (e.g., "Chase", "Coinbase", "Robinhood")
-        use_xai_sdk: Whether to try xai_sdk first (default True)
+        use_xai_sdk: Whether to try xai_sdk first (default False)
+        force_refresh: Skip the short-lived activity and response caches and re-analyze
 
     Returns:
         JSON string containing comprehensive sentiment analysis with:
@@ -1938,42 +3891,140 @@ def fetch_market_sentiment(bank_name: str, use_xai_sdk: bool = False) -> str:
     """
     timestamp = datetime.now(timezone.utc).isoformat()
 
-    # =========================================================================
-    # Strategy 1: xai_sdk with x_search (server-side, stateful)
-    # =========================================================================
-    if use_xai_sdk:
-        try:
-            xai_client = GrokAnalysisClient()
-
-            if xai_client.is_available():
-                analysis = xai_client.analyze_with_x_search(bank_name)
-
-                if analysis.get("status") != "error":
-                    return json.dumps({
-                        "bank_name": bank_name,
-                        "status": "success",
-                        "timestamp": timestamp,
-                        "data_source": "xai_sdk (x_search server-side)",
-                        "sdk_used": "xai_sdk",
-                        "analysis_model": "Grok 4.1 Fast",
-                        "session_id": analysis.get("session_id"),
-                        "continued_session": analysis.get("continued_session", False),
-                        "institution_type": analysis.get("institution_type", "unknown"),
-                        "analysis": analysis,
-                        "tool_calls": analysis.get("tool_calls", []),
-                        "risk_trend": xai_client.get_risk_trend(bank_name)
-                    }, indent=2)
+    if not force_refresh:
+        # A fetch moments ago found nothing: answer LOW without touching any client
+        if _recently_quiet(bank_name):
+            return _dumps(_quiet_bank_payload(bank_name, timestamp))
+
+        # Analyzed moments ago: reuse that analysis
+        cached = _sentiment_responses.get(_sentiment_response_key(bank_name))
+        if cached is not None:
+            return _dumps(cached)
+
+    # =========================================================================
+    # Strategies 1 + 2: xai_sdk x_search, hedged by xdk + GrokClient
+    # =========================================================================
+    rate_limit_error = None
+    error_payload = None
+
+    # Without xai_sdk installed Strategy 1 can only fail; don't spend a
+    # thread (or the shared client) finding that out
+    if use_xai_sdk and XAI_SDK_AVAILABLE:
+        outcomes = _hedged_sentiment_attempts(bank_name, timestamp)
+    else:
+        outcomes = iter([_xdk_sentiment_attempt(bank_name, timestamp)])
+
+    for payload, rate_limited in outcomes:
+        if payload is not None and payload.get("status") == "success":
+            return _dumps(_remember_sentiment(bank_name, payload))
+        if rate_limited:
+            rate_limit_error = rate_limited
+        elif payload is not None:
+            error_payload = payload
+
+    # xdk failed outright (not rate limited): report its error
+    if rate_limit_error is None:
+        return _dumps(error_payload)
+
+    # =========================================================================
+    # Strategy 3: Grok Live Search fallback (when all else fails)
+    # =========================================================================
+    try:
+        analysis = _grok_live_search_analysis(bank_name)
+
+        return _dumps(_remember_sentiment(
+            bank_name, _live_search_payload(bank_name, timestamp, analysis, rate_limit_error)
+        ))
+
+    except Exception as fallback_error:
+        return _dumps(
+            _all_strategies_failed_payload(bank_name, timestamp, rate_limit_error, fallback_error)
+        )
+
+
+# Head start x_search gets before the xdk path is started as a hedge; x_search
+# usually answers well within it, so most calls pay for a single analysis
+X_SEARCH_HEDGE_SECONDS = 8.0
+
+
+def _hedged_sentiment_attempts(
+    bank_name: str,
+    timestamp: str
+) -> Generator[Tuple[Optional[Dict[str, Any]], Optional[str]], None, None]:
+    """
+    Yield Strategy 1 and 2 outcomes for fetch_market_sentiment() as they finish.
+
+    x_search (the preferred path) runs alone first. xdk + GrokClient is only
+    started once x_search has failed, or is still running after
+    X_SEARCH_HEDGE_SECONDS; from then on whichever finishes first is yielded
+    first. Threads can't be interrupted, so a caller that stops consuming
+    simply leaves the other strategy to finish in the background.
+
+    Yields:
+        (payload, rate_limit_error) tuples as returned by each strategy
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        primary = executor.submit(_x_search_sentiment_attempt, bank_name, timestamp)
+        done, _ = wait([primary], timeout=X_SEARCH_HEDGE_SECONDS)
+        if done:
+            yield primary.result()
+            pending = {executor.submit(_xdk_sentiment_attempt, bank_name, timestamp)}
+        else:
+            pending = {primary, executor.submit(_xdk_sentiment_attempt, bank_name, timestamp)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _x_search_sentiment_attempt(bank_name: str, timestamp: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Strategy 1: xai_sdk with x_search (server-side, stateful).
+
+    Returns:
+        (success payload or None, None) - failures here always fall through
+    """
+    try:
+        xai_client = _get_xai_client()
 
-        except Exception as e:
-            # Log but continue to fallback
-            pass
+        if xai_client.is_available():
+            analysis = xai_client.analyze_with_x_search(bank_name)
 
-    # =========================================================================
-    # Strategy 2: xdk + GrokClient (direct X API, full tweet data)
-    # =========================================================================
-    use_grok_fallback = False
-    rate_limit_error = None
+            if analysis.get("status") != "error":
+                return {
+                    "bank_name": bank_name,
+                    "status": "success",
+                    "timestamp": timestamp,
+                    "data_source": "xai_sdk (x_search server-side)",
+                    "sdk_used": "xai_sdk",
+                    "analysis_model": "Grok 4.1 Fast",
+                    "session_id": analysis.get("session_id"),
+                    "continued_session": analysis.get("continued_session", False),
+                    "institution_type": analysis.get("institution_type", "unknown"),
+                    "analysis": analysis,
+                    "tool_calls": analysis.get("tool_calls", []),
+                    "risk_trend": xai_client.get_risk_trend(bank_name)
+                }, None
+
+    except Exception:
+        # Log but continue to fallback
+        pass
+
+    return None, None
+
+
+def _xdk_sentiment_attempt(bank_name: str, timestamp: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Strategy 2: xdk + GrokClient (direct X API, full tweet data).
 
+    Returns:
+        (payload, None) on success or a hard error; (None, error) when X API
+        rate limits or an open breaker call for the live-search fallback
+    """
     try:
         # Initialize xdk-based clients
         x_client = XAPIClient()
@@ -1985,75 +4036,195 @@ def fetch_market_sentiment(bank_name: str, use_xai_sdk: bool = False) -> str:
             max_results=100,
             include_trend_data=True
         )
+        _record_activity(bank_name, len(tweet_data.get("tweets", [])))
 
         # Analyze with GrokClient (OpenAI-compatible)
         analysis = grok_client.analyze_sentiment(bank_name, tweet_data)
 
-        return json.dumps({
-            "bank_name": bank_name,
-            "status": "success",
-            "timestamp": timestamp,
-            "data_source": "xdk + GrokClient (X API v2 direct)",
-            "sdk_used": "xdk",
-            "endpoints_used": ["/tweets/search/recent", "/tweets/counts/recent"],
-            "analysis_model": "Grok 4.1 Fast (OpenAI-compatible)",
-            "institution_type": tweet_data.get("institution_type", "unknown"),
-            "risk_keywords_used": tweet_data.get("risk_keywords_used", []),
-            "tweet_count": tweet_data.get("total_fetched", 0),
-            "analysis": analysis,
-            "api_health": tweet_data.get("api_metrics", {}),
-            "trend_data": {
-                "velocity_change": tweet_data.get("trend_data", {}).get("velocity_change_percent", 0),
-                "is_spiking": tweet_data.get("trend_data", {}).get("is_spiking", False)
-            }
-        }, indent=2)
+        return _xdk_sentiment_payload(bank_name, timestamp, tweet_data, analysis), None
 
     except Exception as e:
         error_str = str(e).lower()
         if "rate limit" in error_str or "circuit breaker" in error_str:
-            use_grok_fallback = True
-            rate_limit_error = str(e)
+            return None, str(e)
+        return _sentiment_error_payload(bank_name, timestamp, e), None
+
+
+def _xdk_sentiment_payload(
+    bank_name: str,
+    timestamp: str,
+    tweet_data: Dict[str, Any],
+    analysis: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Response payload for a successful xdk + GrokClient analysis."""
+    return {
+        "bank_name": bank_name,
+        "status": "success",
+        "timestamp": timestamp,
+        "data_source": "xdk + GrokClient (X API v2 direct)",
+        "sdk_used": "xdk",
+        "endpoints_used": ["/tweets/search/recent", "/tweets/counts/recent"],
+        "analysis_model": "Grok 4.1 Fast (OpenAI-compatible)",
+        "institution_type": tweet_data.get("institution_type", "unknown"),
+        "risk_keywords_used": tweet_data.get("risk_keywords_used", []),
+        "tweet_count": tweet_data.get("total_fetched", 0),
+        "analysis": analysis,
+        "api_health": tweet_data.get("api_metrics", {}),
+        "trend_data": {
+            "velocity_change": tweet_data.get("trend_data", {}).get("velocity_change_percent", 0),
+            "is_spiking": tweet_data.get("trend_data", {}).get("is_spiking", False)
+        }
+    }
+
+
+def _live_search_payload(
+    bank_name: str,
+    timestamp: str,
+    analysis: Dict[str, Any],
+    fallback_reason: Optional[str]
+) -> Dict[str, Any]:
+    """Response payload for a Grok Live Search fallback analysis."""
+    return {
+        "bank_name": bank_name,
+        "status": "success",
+        "timestamp": timestamp,
+        "data_source": "Grok Live Search (all SDKs failed/rate limited)",
+        "sdk_used": "openai (grok-compatible)",
+        "analysis_model": "Grok with live X search",
+        "institution_type": analysis.get("institution_type", "unknown"),
+        "fallback_reason": fallback_reason,
+        "analysis": analysis
+    }
+
+
+def _sentiment_error_payload(bank_name: str, timestamp: str, error: Exception) -> Dict[str, Any]:
+    """Response payload for a non-recoverable analysis error."""
+    return {
+        "bank_name": bank_name,
+        "status": "error",
+        "error": f"Error: {str(error)}",
+        "timestamp": timestamp,
+        "recovery_suggestion": "Will retry with exponential backoff"
+    }
+
+
+def _all_strategies_failed_payload(
+    bank_name: str,
+    timestamp: str,
+    rate_limit_error: Optional[str],
+    fallback_error: Exception
+) -> Dict[str, Any]:
+    """Response payload when both xdk and the live-search fallback failed."""
+    return {
+        "bank_name": bank_name,
+        "status": "error",
+        "error": f"All strategies failed. xdk: {rate_limit_error}. Grok fallback: {str(fallback_error)}",
+        "timestamp": timestamp
+    }
+
+
+async def fetch_market_sentiment_async(
+    bank_names: List[str],
+    force_refresh: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Analyze several institutions concurrently (xdk + GrokClient, live-search fallback).
+
+    Each bank's Grok analysis starts as soon as its own X API fetch returns,
+    so prompt building and Grok round-trips for early banks overlap with the
+    fetches still in flight, and a sweep takes about as long as its slowest
+    bank instead of the sum of all banks.
+
+    Args:
+        bank_names: Institutions to analyze
+        force_refresh: Skip the short-lived activity and response caches and re-analyze
+
+    Returns:
+        Dict mapping each bank name to the payload fetch_market_sentiment() returns
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    results = {}
+    for bank_name in ([] if force_refresh else bank_names):
+        if _recently_quiet(bank_name):
+            results[bank_name] = _quiet_bank_payload(bank_name, timestamp)
         else:
-            return json.dumps({
-                "bank_name": bank_name,
-                "status": "error",
-                "error": f"Error: {str(e)}",
-                "timestamp": timestamp,
-                "recovery_suggestion": "Will retry with exponential backoff"
-            }, indent=2)
+            cached = _sentiment_responses.get(_sentiment_response_key(bank_name))
+            if cached is not None:
+                results[bank_name] = copy.deepcopy(cached)
+    active_banks = [bank_name for bank_name in bank_names if bank_name not in results]
+    if not active_banks:
+        return results
+
+    x_client = XAPIClient()
+    grok_client = GrokClient()
+
+    # Same bound as get_many_institution_mentions_async: each fetch already
+    # fans out into up to three X API requests
+    fetch_slots = asyncio.Semaphore(10)
+
+    async def analyze(bank_name: str, tweet_data: Any) -> Dict[str, Any]:
+        if isinstance(tweet_data, Exception):
+            error_str = str(tweet_data).lower()
+            if "rate limit" not in error_str and "circuit breaker" not in error_str:
+                return _sentiment_error_payload(bank_name, timestamp, tweet_data)
+            try:
+                analysis = await _grok_live_search_analysis_async(bank_name)
+            except Exception as fallback_error:
+                return _all_strategies_failed_payload(bank_name, timestamp, str(tweet_data), fallback_error)
+            return _live_search_payload(bank_name, timestamp, analysis, str(tweet_data))
 
-    # =========================================================================
-    # Strategy 3: Grok Live Search fallback (when all else fails)
-    # =========================================================================
-    if use_grok_fallback:
+        _record_activity(bank_name, len(tweet_data.get("tweets", [])))
+        analysis = await grok_client.analyze_sentiment_async(bank_name, tweet_data)
+        return _xdk_sentiment_payload(bank_name, timestamp, tweet_data, analysis)
+
+    async def fetch_and_analyze(bank_name: str) -> Dict[str, Any]:
         try:
-            analysis = _grok_live_search_analysis(bank_name)
+            async with fetch_slots:
+                tweet_data = await x_client.get_institution_mentions_async(bank_name)
+        except Exception as e:
+            tweet_data = e
+        return await analyze(bank_name, tweet_data)
+
+    payloads = await asyncio.gather(*(fetch_and_analyze(bank_name) for bank_name in active_banks))
+    for bank_name, payload in zip(active_banks, payloads):
+        results[bank_name] = _remember_sentiment(bank_name, payload)
+    return {bank_name: results[bank_name] for bank_name in bank_names}
 
-            return json.dumps({
-                "bank_name": bank_name,
-                "status": "success",
-                "timestamp": timestamp,
-                "data_source": "Grok Live Search (all SDKs failed/rate limited)",
-                "sdk_used": "openai (grok-compatible)",
-                "analysis_model": "Grok with live X search",
-                "institution_type": analysis.get("institution_type", "unknown"),
-                "fallback_reason": rate_limit_error,
-                "analysis": analysis
-            }, indent=2)
-
-        except Exception as fallback_error:
-            return json.dumps({
-                "bank_name": bank_name,
-                "status": "error",
-                "error": f"All strategies failed. xdk: {rate_limit_error}. Grok fallback: {str(fallback_error)}",
-                "timestamp": timestamp
-            }, indent=2)
 
+def fetch_market_sentiment_batch(bank_names: List[str]) -> str:
+    """
+    Analyze several institutions concurrently (sync wrapper for ADK tools).
+
+    Args:
+        bank_names: Institutions to analyze (e.g., ["Chase", "Coinbase"])
+
+    Returns:
+        JSON string mapping each bank name to its sentiment analysis
+    """
+    try:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            results = asyncio.run(fetch_market_sentiment_async(bank_names))
+        else:
+            # Called from inside an event loop (e.g. an ADK tool call):
+            # run the sweep on its own loop in a worker thread
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                results = pool.submit(asyncio.run, fetch_market_sentiment_async(bank_names)).result()
+        return _dumps(results)
+
+    except Exception as e:
+        return _dumps({
+            "status": "error",
+            "error": f"Error: {str(e)}",
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
 
-def fetch_market_sentiment_streaming(
+
+async def fetch_market_sentiment_streaming(
     bank_name: str,
     callback: Optional[Callable[[Dict], None]] = None
-) -> Generator[Dict, None, None]:
+) -> AsyncGenerator[Dict, None]:
     """
     Stream market sentiment analysis with real-time updates.
 
@@ -2068,7 +4239,7 @@ def fetch_market_sentiment_streaming(
         Dict updates as analysis progresses
     """
     try:
-        xai_client = GrokAnalysisClient()
+        xai_client = _get_xai_client()
 
         if not xai_client.is_available():
             yield {
@@ -2077,7 +4248,7 @@ def fetch_market_sentiment_streaming(
             }
             return
 
-        for update in xai_client.analyze_streaming(bank_name, callback=lambda x: callback({"chunk": x}) if callback else None):
+        async for update in xai_client.analyze_streaming(bank_name, callback=lambda x: callback({"chunk": x}) if callback else None):
             yield update
 
     except Exception as e:
@@ -2103,23 +4274,23 @@ def continue_analysis(bank_name: str, follow_up: str) -> str:
     timestamp = datetime.now(timezone.utc).isoformat()
 
     try:
-        xai_client = GrokAnalysisClient()
+        xai_client = _get_xai_client()
 
         if not xai_client.is_available():
-            return json.dumps({
+            return _dumps({
                 "status": "error",
                 "error": "xai_sdk not available for session continuation",
                 "timestamp": timestamp
-            }, indent=2)
+            })
 
         session_id = xai_client.get_session_id(bank_name)
 
         if not session_id:
-            return json.dumps({
+            return _dumps({
                 "status": "error",
                 "error": f"No existing session found for {bank_name}. Run initial analysis first.",
                 "timestamp": timestamp
-            }, indent=2)
+            })
 
         analysis = xai_client.analyze_with_x_search(
             bank_name,
@@ -2127,7 +4298,7 @@ def continue_analysis(bank_name: str, follow_up: str) -> str:
             continue_session=True
         )
 
-        return json.dumps({
+        return _dumps({
             "bank_name": bank_name,
             "status": "success",
             "timestamp": timestamp,
@@ -2137,20 +4308,136 @@ def continue_analysis(bank_name: str, follow_up: str) -> str:
             "follow_up_question": follow_up,
             "analysis": analysis,
             "risk_trend": xai_client.get_risk_trend(bank_name)
-        }, indent=2)
+        })
 
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "status": "error",
             "error": str(e),
             "timestamp": timestamp
-        }, indent=2)
+        })
 
 
 # =============================================================================
 # Slack Alerting Tool (Enhanced with Rich Context)
 # =============================================================================
 
+# Alert styling per risk level (read-only)
+_RISK_CONFIG = MappingProxyType({
+    "HIGH": MappingProxyType({"emoji": "🚨", "color": "#FF0000", "header": "CRITICAL ALERT"}),
+    "MEDIUM": MappingProxyType({"emoji": "⚠️", "color": "#FFA500", "header": "WARNING"}),
+    "LOW": MappingProxyType({"emoji": "ℹ️", "color": "#36A64F", "header": "NOTICE"})
+})
+
+# Block Kit layout for alerts. Slots 0, 1 and 3 (header, fields, summary) are
+# rebuilt per alert; the static blocks are shared by every message, so they
+# must never be mutated
+_ALERT_TEMPLATE_BLOCKS = (
+    None,  # header
+    None,  # institution / risk level / detected at / data source fields
+    {"type": "divider"},
+    None,  # summary
+    {"type": "divider"},
+    {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": "🤖 _Financial Sentinel | Real-time X API + Grok Analysis | <https://api.x.com|X API> + <https://api.x.ai|Grok>_"
+            }
+        ]
+    }
+)
+_ALERT_DATA_SOURCE_FIELD = {"type": "mrkdwn", "text": "*Data Source:*\nX API v2 + Grok"}
+
+
+def _build_alert_message(
+    bank_name: str,
+    risk_level: str,
+    summary: str,
+    source_link: Optional[str] = None
+) -> tuple:
+    """Build (fallback_text, blocks, timestamp) for a Slack risk alert."""
+    level = risk_level.upper()
+    config = _RISK_CONFIG.get(level, _RISK_CONFIG["MEDIUM"])
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    # Shallow copy: only the dynamic slots get fresh dicts
+    blocks = list(_ALERT_TEMPLATE_BLOCKS)
+    blocks[0] = {
+        "type": "header",
+        "text": {"type": "plain_text", "text": f"{config['emoji']} {config['header']}: {bank_name}", "emoji": True}
+    }
+    blocks[1] = {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": f"*Institution:*\n{bank_name}"},
+            {"type": "mrkdwn", "text": f"*Risk Level:*\n{level}"},
+            {"type": "mrkdwn", "text": f"*Detected At:*\n{timestamp}"},
+            _ALERT_DATA_SOURCE_FIELD
+        ]
+    }
+    blocks[3] = {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": f"*Summary:*\n{summary[:2900]}"}
+    }
+
+    if source_link:
+        blocks.insert(-1, {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"📎 <{source_link}|View source on X>"
+            }
+        })
+
+    fallback_text = f"{config['emoji']} {level} Risk Alert for {bank_name}"
+    return fallback_text, blocks, timestamp
+
+
+def _alert_skipped(bank_name: str) -> str:
+    return _dumps({
+        "status": "skipped",
+        "reason": "Slack credentials not configured (optional feature)",
+        "bank_name": bank_name
+    })
+
+
+def _alert_sent(bank_name: str, risk_level: str, channel_id: str, response: Any, timestamp: str) -> str:
+    return _dumps({
+        "status": "success",
+        "bank_name": bank_name,
+        "risk_level": risk_level,
+        "channel": channel_id,
+        "message_ts": response["ts"],
+        "timestamp": timestamp
+    })
+
+
+def _alert_failed(bank_name: str, error: Exception, timestamp: str) -> str:
+    message = str(error.response["error"]) if isinstance(error, SlackApiError) else str(error)
+    return _dumps({
+        "status": "error",
+        "error": message,
+        "bank_name": bank_name,
+        "timestamp": timestamp
+    })
+
+
+_slack_client: Optional[WebClient] = None
+
+# Block Kit caps a single message at 50 blocks
+SLACK_MAX_BLOCKS = 50
+
+
+def _get_slack_client(token: str) -> WebClient:
+    """Return the module-level WebClient, created on first use (keeps its connection pool warm)."""
+    global _slack_client
+    if _slack_client is None or _slack_client.token != token:
+        _slack_client = WebClient(token=token)
+    return _slack_client
+
+
 def send_alert(
     bank_name: str,
     risk_level: str,
@@ -2179,104 +4466,256 @@ def send_alert(
     channel_id = os.getenv("SLACK_CHANNEL_ID")
 
     if not slack_token or not channel_id:
-        return json.dumps({
-            "status": "skipped",
-            "reason": "Slack credentials not configured (optional feature)",
-            "bank_name": bank_name
-        })
+        return _alert_skipped(bank_name)
 
-    client = WebClient(token=slack_token)
+    client = _get_slack_client(slack_token)
+    fallback_text, blocks, timestamp = _build_alert_message(bank_name, risk_level, summary, source_link)
 
-    risk_config = {
-        "HIGH": {"emoji": "🚨", "color": "#FF0000", "header": "CRITICAL ALERT"},
-        "MEDIUM": {"emoji": "⚠️", "color": "#FFA500", "header": "WARNING"},
-        "LOW": {"emoji": "ℹ️", "color": "#36A64F", "header": "NOTICE"}
-    }
+    try:
+        response = client.chat_postMessage(
+            channel=channel_id,
+            text=fallback_text,
+            blocks=blocks,
+            unfurl_links=False,
+            unfurl_media=False
+        )
+        return _alert_sent(bank_name, risk_level, channel_id, response, timestamp)
 
-    config = risk_config.get(risk_level.upper(), risk_config["MEDIUM"])
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    except Exception as e:
+        return _alert_failed(bank_name, e, timestamp)
 
-    blocks = [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": f"{config['emoji']} {config['header']}: {bank_name}",
-                "emoji": True
-            }
-        },
-        {
-            "type": "section",
-            "fields": [
-                {"type": "mrkdwn", "text": f"*Institution:*\n{bank_name}"},
-                {"type": "mrkdwn", "text": f"*Risk Level:*\n{risk_level.upper()}"},
-                {"type": "mrkdwn", "text": f"*Detected At:*\n{timestamp}"},
-                {"type": "mrkdwn", "text": f"*Data Source:*\nX API v2 + Grok"}
-            ]
-        },
-        {"type": "divider"},
-        {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"*Summary:*\n{summary[:2900]}"
-            }
-        },
-        {"type": "divider"},
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": "🤖 _Financial Sentinel | Real-time X API + Grok Analysis | <https://api.x.com|X API> + <https://api.x.ai|Grok>_"
-                }
-            ]
-        }
-    ]
 
-    if source_link:
-        blocks.insert(-1, {
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": f"📎 <{source_link}|View source on X>"
-            }
-        })
+def send_alerts_batch(alerts: List[Dict[str, Any]]) -> str:
+    """
+    Coalesce a burst of alerts into one Slack message.
+
+    Each alert contributes its usual header, fields and summary sections; the
+    footer is shared. Alerts that would push the message past Slack's block
+    limit are counted in a closing note instead of being sent.
+
+    Args:
+        alerts: Dicts of send_alert() keyword arguments
+                (bank_name, risk_level, summary, optional source_link)
+
+    Returns:
+        JSON string with status of the alert operation
+    """
+    if not alerts:
+        return _dumps({"status": "skipped", "reason": "No alerts to send"})
+    if len(alerts) == 1:
+        return send_alert(**alerts[0])
+
+    slack_token = os.getenv("SLACK_BOT_TOKEN")
+    channel_id = os.getenv("SLACK_CHANNEL_ID")
+    bank_names = [alert["bank_name"] for alert in alerts]
 
-    fallback_text = f"{config['emoji']} {risk_level.upper()} Risk Alert for {bank_name}"
+    if not slack_token or not channel_id:
+        return _alert_skipped(", ".join(bank_names))
+
+    blocks: List[Dict[str, Any]] = []
+    footer = None
+    timestamp = None
+    included = []
+    for alert in alerts:
+        _, alert_blocks, timestamp = _build_alert_message(**alert)
+        footer = alert_blocks[-1]
+        # Leave room for the shared footer and a possible "omitted" note
+        if len(blocks) + len(alert_blocks) - 1 > SLACK_MAX_BLOCKS - 2:
+            break
+        blocks.extend(alert_blocks[:-1])
+        included.append(f"{alert['bank_name']} ({alert['risk_level'].upper()})")
+
+    omitted = len(alerts) - len(included)
+    if omitted:
+        blocks.append({
+            "type": "context",
+            "elements": [{"type": "mrkdwn", "text": f"_...and {omitted} more alert(s) not shown_"}]
+        })
+    blocks.append(footer)
+    fallback_text = f"🚨 {len(alerts)} Risk Alerts: {', '.join(included)}"
 
     try:
-        response = client.chat_postMessage(
+        response = _get_slack_client(slack_token).chat_postMessage(
             channel=channel_id,
             text=fallback_text,
             blocks=blocks,
             unfurl_links=False,
             unfurl_media=False
         )
-
-        return json.dumps({
+        return _dumps({
             "status": "success",
-            "bank_name": bank_name,
-            "risk_level": risk_level,
+            "bank_names": bank_names,
+            "alerts_included": len(included),
+            "alerts_omitted": omitted,
             "channel": channel_id,
             "message_ts": response["ts"],
             "timestamp": timestamp
-        }, indent=2)
+        })
 
-    except SlackApiError as e:
-        return json.dumps({
-            "status": "error",
-            "error": str(e.response["error"]),
-            "bank_name": bank_name,
-            "timestamp": timestamp
-        }, indent=2)
     except Exception as e:
-        return json.dumps({
-            "status": "error",
-            "error": str(e),
-            "bank_name": bank_name,
-            "timestamp": timestamp
-        }, indent=2)
+        return _alert_failed(", ".join(bank_names), e, timestamp)
+
+
+# Fire-and-forget alerting: callers that don't need the delivery status hand
+# alerts to a background worker instead of waiting out Slack's round trip
+_alert_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+_alert_worker_thread: Optional[threading.Thread] = None
+_alert_worker_lock = threading.Lock()
+
+# Alerts coalesced into one message by the worker; 8 alerts of at most 6
+# blocks each stay within send_alerts_batch's block budget
+ALERT_BATCH_MAX = 8
+
+
+def _alert_worker() -> None:
+    """Drain the alert queue, coalescing whatever piled up into one message."""
+    while True:
+        alerts = [_alert_queue.get()]
+        while len(alerts) < ALERT_BATCH_MAX:
+            try:
+                alerts.append(_alert_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            send_alerts_batch(alerts)
+        except Exception:
+            pass  # Slack failures must not kill the worker
+        finally:
+            for _ in alerts:
+                _alert_queue.task_done()
+
+
+def _ensure_alert_worker() -> None:
+    """Start the alert worker thread on first use."""
+    global _alert_worker_thread
+    if _alert_worker_thread is not None:
+        return
+    with _alert_worker_lock:
+        if _alert_worker_thread is None:
+            _alert_worker_thread = threading.Thread(target=_alert_worker, name="slack-alerts", daemon=True)
+            _alert_worker_thread.start()
+            # The worker is a daemon; give queued alerts a chance to go out
+            atexit.register(flush_alerts, 5.0)
+
+
+def queue_alert(
+    bank_name: str,
+    risk_level: str,
+    summary: str,
+    source_link: Optional[str] = None
+) -> str:
+    """
+    Queue an alert for background delivery and return immediately.
+
+    Same arguments as send_alert(). Use this where the alert is a side effect
+    (streams, monitors); send_alert() stays synchronous for callers that need
+    the delivery status, such as the agent's tool call.
+
+    Returns:
+        JSON string with status "queued"
+    """
+    _ensure_alert_worker()
+    _alert_queue.put({
+        "bank_name": bank_name,
+        "risk_level": risk_level,
+        "summary": summary,
+        "source_link": source_link
+    })
+    return _dumps({
+        "status": "queued",
+        "bank_name": bank_name,
+        "risk_level": risk_level,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    })
+
+
+def flush_alerts(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for queued alerts to be delivered (for graceful shutdown).
+
+    Args:
+        timeout: Seconds to wait at most; None waits indefinitely
+
+    Returns:
+        True if the queue drained, False if the timeout expired first
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with _alert_queue.all_tasks_done:
+        while _alert_queue.unfinished_tasks:
+            if deadline is None:
+                _alert_queue.all_tasks_done.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _alert_queue.all_tasks_done.wait(remaining)
+    return True
+
+
+_async_slack_client: Optional[AsyncWebClient] = None
+
+
+def _get_async_slack_client(token: str) -> AsyncWebClient:
+    """Return the module-level AsyncWebClient, created on first use."""
+    global _async_slack_client
+    if _async_slack_client is None or _async_slack_client.token != token:
+        _async_slack_client = AsyncWebClient(token=token)
+    return _async_slack_client
+
+
+async def send_alert_async(
+    bank_name: str,
+    risk_level: str,
+    summary: str,
+    source_link: Optional[str] = None
+) -> str:
+    """
+    Async variant of send_alert() using a shared AsyncWebClient.
+
+    Args:
+        bank_name: Name of the institution with detected risk
+        risk_level: Risk severity - "HIGH", "MEDIUM", or "LOW"
+        summary: Detailed summary of the risk findings
+        source_link: Optional URL to primary source tweet
+
+    Returns:
+        JSON string with status of the alert operation
+    """
+    slack_token = os.getenv("SLACK_BOT_TOKEN")
+    channel_id = os.getenv("SLACK_CHANNEL_ID")
+
+    if not slack_token or not channel_id:
+        return _alert_skipped(bank_name)
+
+    client = _get_async_slack_client(slack_token)
+    fallback_text, blocks, timestamp = _build_alert_message(bank_name, risk_level, summary, source_link)
+
+    try:
+        response = await client.chat_postMessage(
+            channel=channel_id,
+            text=fallback_text,
+            blocks=blocks,
+            unfurl_links=False,
+            unfurl_media=False
+        )
+        return _alert_sent(bank_name, risk_level, channel_id, response, timestamp)
+
+    except Exception as e:
+        return _alert_failed(bank_name, e, timestamp)
+
+
+async def send_alerts_async(alerts: List[Dict[str, Any]]) -> List[str]:
+    """
+    Dispatch several alerts concurrently.
+
+    Args:
+        alerts: Dicts of send_alert() keyword arguments
+                (bank_name, risk_level, summary, optional source_link)
+
+    Returns:
+        JSON status strings, in the same order as `alerts`
+    """
+    return list(await asyncio.gather(*(send_alert_async(**alert) for alert in alerts)))
 
 
 # =============================================================================
@@ -2357,9 +4796,10 @@ class StreamMonitor:
         self._volume_window_minutes = 5
         # High-engagement threshold for instant Grok analysis
         self._high_engagement_threshold = 50
-        # Event deduplication
-        self._seen_tweet_ids: set = set()
+        # Event deduplication: remembers at least the last 10k tweet ids in
+        # constant memory, with no periodic rebuild
         self._max_seen_ids = 10000
+        self._seen_tweet_ids = RotatingBloomFilter(capacity=self._max_seen_ids)
         # Stats tracking for frontend display
         self._tweets_processed = 0
         self._analyses_performed = 0
@@ -2379,21 +4819,8 @@ class StreamMonitor:
         inst_type = inst_context["institution_type"]
         risk_keywords = inst_context["risk_keywords"][:6]
 
-        # Build flexible query for person names vs institutions
-        is_likely_person = (
-            inst_type == "unknown" and
-            " " in institution.strip() and
-            len(institution.split()) <= 3
-        )
-
-        if is_likely_person:
-            # For person names, use flexible matching
-            words = institution.strip().split()
-            first_word = words[0]
-            name_clause = f'({first_word} OR "{institution}")'
-        else:
-            # For institutions, use exact phrase
-            name_clause = f'"{institution}"'
+        # Flexible query for person names vs exact phrase for institutions
+        name_clause = _build_flexible_query(institution, inst_type)
 
         # Build optimized stream rule
         # Include institution name + key risk terms
@@ -2435,13 +4862,13 @@ class StreamMonitor:
     def get_monitored_institutions(self) -> List[Dict]:
         """Get list of currently monitored institutions with stats."""
         result = []
+        # One clock read for the whole listing, not one per tracked timestamp
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=self._volume_window_minutes)
         for inst_key, inst_data in self.monitored_institutions.items():
             stats = inst_data.copy()
             # Add volume stats
             if inst_key in self._volume_tracker:
-                recent = [t for t in self._volume_tracker[inst_key]
-                         if t > datetime.now(timezone.utc) - timedelta(minutes=self._volume_window_minutes)]
-                stats["tweets_last_5min"] = len(recent)
+                stats["tweets_last_5min"] = sum(1 for t in self._volume_tracker[inst_key] if t > cutoff)
             result.append(stats)
         return result
 
@@ -2472,7 +4899,7 @@ class StreamMonitor:
             self._analyses_performed = 0
             self._spikes_detected = 0
             self.event_buffer = []
-            self._seen_tweet_ids = set()
+            self._seen_tweet_ids.clear()
 
         # Apply rules to stream
         result = await self.setup_stream(clear_existing=True)
@@ -2616,12 +5043,8 @@ class StreamMonitor:
 
                 # Deduplicate
                 tweet_id = post.get("id")
-                if tweet_id in self._seen_tweet_ids:
+                if not self._seen_tweet_ids.add_if_new(str(tweet_id)):
                     continue
-                self._seen_tweet_ids.add(tweet_id)
-                if len(self._seen_tweet_ids) > self._max_seen_ids:
-                    # Remove oldest half
-                    self._seen_tweet_ids = set(list(self._seen_tweet_ids)[self._max_seen_ids // 2:])
 
                 # Identify matching institution
                 matching_institution = None
@@ -2702,7 +5125,7 @@ class StreamMonitor:
                     grok_analysis = None
                     if self.grok_client:
                         try:
-                            grok_analysis = self.grok_client.analyze_single_tweet(
+                            grok_analysis = await self.grok_client.analyze_single_tweet_async(
                                 inst_name,
                                 post.get("text", ""),
                                 {
@@ -2731,7 +5154,7 @@ class StreamMonitor:
                                     summary = grok_summary[:500]  # Limit length
                             
                             # Send Slack notification for MEDIUM or HIGH risk
-                            send_alert(
+                            queue_alert(
                                 bank_name=inst_name,
                                 risk_level=risk_level,
                                 summary=summary,
@@ -2810,7 +5233,7 @@ class StreamMonitor:
                 continue
 
             try:
-                grok_client = GrokAnalysisClient()
+                grok_client = _get_xai_client()
                 if grok_client.is_available():
                     # Build context from recent events
                     recent_signals = set()